@@ -76,11 +76,12 @@ void add_null_handler(object logger)
     }
 }
 
-void debug(const char* msg) { log_debug(msg); }
-void info(const char* msg) { log_info(msg); }
-void warning(const char* msg) { log_warning(msg); }
-void error(const char* msg) { log_error(msg); }
-void critical(const char* msg) { log_critical(msg); }
+// logging callbacks may be called from bindings which released the GIL
+void debug(const char* msg) { gil_scoped_acquire acquire; log_debug(msg); }
+void info(const char* msg) { gil_scoped_acquire acquire; log_info(msg); }
+void warning(const char* msg) { gil_scoped_acquire acquire; log_warning(msg); }
+void error(const char* msg) { gil_scoped_acquire acquire; log_error(msg); }
+void critical(const char* msg) { gil_scoped_acquire acquire; log_critical(msg); }
 
 void setup_logging()
 {
@@ -267,6 +268,240 @@ public:
 };
 
 
+// Services on entities, encoding requests and decoding replies with the GIL held and
+// releasing it only while the request is on the device: entities are implemented in
+// Python, walking them calls back into Python and their shared_ptrs own Python objects
+
+static shared_ptr<ydk::path::DataNode> invoke_rpc(ydk::ServiceProvider& provider, ydk::path::Rpc& rpc)
+{
+    const ydk::path::Session& session = provider.get_session();
+    gil_scoped_release release;
+    return rpc(session);
+}
+
+static string get_filter_payload(vector<ydk::Entity*>& filters, ydk::path::RootSchemaNode& root_schema)
+{
+    ydk::XmlSubtreeCodec codec{};
+    string payload;
+    for (auto filter : filters)
+        payload += codec.encode(*filter, root_schema);
+    return payload;
+}
+
+static string get_data_payload(vector<ydk::Entity*>& entities, ydk::path::RootSchemaNode& root_schema,
+                               ydk::EncodingFormat encoding)
+{
+    ydk::path::Codec codec{};
+    string payload;
+    for (auto entity : entities)
+    {
+        const ydk::path::DataNode* data_node = &ydk::get_data_node_from_entity(*entity, root_schema);
+        while (data_node->get_parent() != nullptr)
+            data_node = data_node->get_parent();
+        payload += codec.encode(*data_node, encoding, false);
+    }
+    return payload;
+}
+
+static string get_top_name(const string& path)
+{
+    auto start = path.find_first_not_of('/');
+    if (start == string::npos)
+        return "";
+    auto end = path.find_first_of("[/", start);
+    return path.substr(start, end == string::npos ? string::npos : end - start);
+}
+
+static ydk::path::DataNode* find_top_data_node(ydk::path::DataNode& reply, ydk::Entity& top_entity)
+{
+    auto name = get_top_name(top_entity.get_segment_path());
+    for (auto& child : reply.get_children())
+    {
+        if (get_top_name(child->get_path()) == name)
+            return child.get();
+    }
+    return nullptr;
+}
+
+static shared_ptr<ydk::Entity> get_read_entity(ydk::path::DataNode& reply, ydk::Entity& filter)
+{
+    vector<ydk::Entity*> ancestors{};
+    ydk::Entity* top_filter = &filter;
+    while (top_filter->get_parent() != nullptr)
+    {
+        ancestors.push_back(top_filter);
+        top_filter = top_filter->get_parent();
+    }
+    shared_ptr<ydk::Entity> entity = top_filter->clone_ptr();
+    ydk::path::DataNode* data_node = find_top_data_node(reply, *entity);
+    if (data_node == nullptr)
+        return nullptr;
+    ydk::get_entity_from_data_node(data_node, entity);
+
+    // descend to the entity matching the filter
+    for (auto ancestor = ancestors.rbegin(); ancestor != ancestors.rend(); ++ancestor)
+    {
+        auto segment_path = (*ancestor)->get_segment_path();
+        shared_ptr<ydk::Entity> child{};
+        for (auto& entry : entity->get_children())
+        {
+            if (entry.second != nullptr && entry.second->get_segment_path() == segment_path)
+            {
+                child = entry.second;
+                break;
+            }
+        }
+        if (child == nullptr)
+            return nullptr;
+        entity = child;
+    }
+    return entity;
+}
+
+static vector<shared_ptr<ydk::Entity>> read_entities(ydk::ServiceProvider& provider, ydk::path::Rpc& rpc,
+                                                     vector<ydk::Entity*>& filters)
+{
+    auto& root_schema = provider.get_session().get_root_schema();
+    rpc.get_input_node().create_datanode("filter", get_filter_payload(filters, root_schema));
+    auto reply = invoke_rpc(provider, rpc);
+
+    vector<shared_ptr<ydk::Entity>> entities{};
+    for (auto filter : filters)
+        entities.push_back(reply == nullptr ? shared_ptr<ydk::Entity>{} : get_read_entity(*reply, *filter));
+    return entities;
+}
+
+static vector<shared_ptr<ydk::Entity>> crud_read(ydk::ServiceProvider& provider, vector<ydk::Entity*>& filters,
+                                                 bool config_only)
+{
+    auto rpc = provider.get_session().get_root_schema().create_rpc("ydk:read");
+    if (config_only)
+        rpc->get_input_node().create_datanode("only-config");
+    return read_entities(provider, *rpc, filters);
+}
+
+static bool crud_edit(ydk::ServiceProvider& provider, vector<ydk::Entity*>& entities, const string& operation)
+{
+    auto& root_schema = provider.get_session().get_root_schema();
+    auto rpc = root_schema.create_rpc(operation);
+    rpc->get_input_node().create_datanode("entity",
+        get_data_payload(entities, root_schema, provider.get_encoding()));
+    invoke_rpc(provider, *rpc);
+    return true;
+}
+
+static string get_datastore_name(ydk::DataStore datastore)
+{
+    switch (datastore)
+    {
+        case ydk::DataStore::candidate:
+            return "candidate";
+        case ydk::DataStore::running:
+            return "running";
+        case ydk::DataStore::startup:
+            return "startup";
+        default:
+            throw ydk::YServiceError{"Datastore must be candidate, running or startup"};
+    }
+}
+
+static shared_ptr<ydk::path::Rpc> create_netconf_rpc(ydk::ServiceProvider& provider, const string& operation)
+{
+    return provider.get_session().get_root_schema().create_rpc("ietf-netconf:" + operation);
+}
+
+static vector<shared_ptr<ydk::Entity>> netconf_get_config(ydk::NetconfServiceProvider& provider,
+                                                          ydk::DataStore source, vector<ydk::Entity*>& filters)
+{
+    auto rpc = create_netconf_rpc(provider, "get-config");
+    rpc->get_input_node().create_datanode("source/" + get_datastore_name(source));
+    return read_entities(provider, *rpc, filters);
+}
+
+static bool netconf_edit_config(ydk::NetconfServiceProvider& provider, ydk::DataStore target,
+                                vector<ydk::Entity*>& config, const string& default_operation,
+                                const string& test_option, const string& error_option)
+{
+    auto& root_schema = provider.get_session().get_root_schema();
+    auto rpc = create_netconf_rpc(provider, "edit-config");
+    auto& input = rpc->get_input_node();
+    input.create_datanode("target/" + get_datastore_name(target));
+    input.create_datanode("config", get_data_payload(config, root_schema, ydk::EncodingFormat::XML));
+    if (!default_operation.empty())
+        input.create_datanode("default-operation", default_operation);
+    if (!test_option.empty())
+        input.create_datanode("test-option", test_option);
+    if (!error_option.empty())
+        input.create_datanode("error-option", error_option);
+    invoke_rpc(provider, *rpc);
+    return true;
+}
+
+static bool netconf_copy_config(ydk::NetconfServiceProvider& provider, ydk::DataStore target,
+                                vector<ydk::Entity*>& source_config)
+{
+    auto& root_schema = provider.get_session().get_root_schema();
+    auto rpc = create_netconf_rpc(provider, "copy-config");
+    auto& input = rpc->get_input_node();
+    input.create_datanode("target/" + get_datastore_name(target));
+    input.create_datanode("source/config", get_data_payload(source_config, root_schema, ydk::EncodingFormat::XML));
+    invoke_rpc(provider, *rpc);
+    return true;
+}
+
+static bool netconf_validate(ydk::NetconfServiceProvider& provider, ydk::Entity& source_config)
+{
+    vector<ydk::Entity*> entities{&source_config};
+    auto& root_schema = provider.get_session().get_root_schema();
+    auto rpc = create_netconf_rpc(provider, "validate");
+    rpc->get_input_node().create_datanode("source/config",
+        get_data_payload(entities, root_schema, ydk::EncodingFormat::XML));
+    invoke_rpc(provider, *rpc);
+    return true;
+}
+
+static void create_rpc_input(ydk::Entity& entity, ydk::path::DataNode& data_node)
+{
+    for (auto& leaf : entity.get_name_leaf_data())
+    {
+        if (leaf.second.is_set)
+            data_node.create_datanode(leaf.first, leaf.second.value);
+    }
+    for (auto& child : entity.get_children())
+    {
+        if (child.second != nullptr && child.second->has_data())
+            create_rpc_input(*child.second, data_node.create_datanode(child.second->get_segment_path()));
+    }
+}
+
+static shared_ptr<ydk::Entity> execute_rpc(ydk::ServiceProvider& provider, ydk::Entity& rpc_entity,
+                                           shared_ptr<ydk::Entity> top_entity)
+{
+    auto rpc = provider.get_session().get_root_schema().create_rpc(rpc_entity.get_segment_path());
+    auto input = rpc_entity.get_child_by_name("input", "");
+    if (input != nullptr)
+        create_rpc_input(*input, rpc->get_input_node());
+    auto reply = invoke_rpc(provider, *rpc);
+    if (reply == nullptr)
+        return nullptr;
+
+    if (top_entity != nullptr)
+    {
+        ydk::path::DataNode* data_node = find_top_data_node(*reply, *top_entity);
+        if (data_node == nullptr)
+            return nullptr;
+        ydk::get_entity_from_data_node(data_node, top_entity);
+        return top_entity;
+    }
+    auto output = rpc_entity.get_child_by_name("output", "");
+    if (output == nullptr)
+        return nullptr;
+    auto output_nodes = reply->find("output");
+    ydk::get_entity_from_data_node(output_nodes.empty() ? reply.get() : output_nodes[0].get(), output);
+    return output;
+}
+
+
 PYBIND11_MODULE(ydk_, ydk)
 {
     module providers = ydk.def_submodule("providers", "providers module");
@@ -292,8 +527,8 @@ PYBIND11_MODULE(ydk_, ydk)
 
     class_<ydk::path::Session>(path, "Session")
         .def("get_root_schema", &ydk::path::Session::get_root_schema, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::Session::*)(ydk::path::Rpc& rpc) const) &ydk::path::Session::invoke, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::Session::*)(ydk::path::DataNode& rpc) const) &ydk::path::Session::invoke, return_value_policy::reference);
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::Session::*)(ydk::path::Rpc& rpc) const) &ydk::path::Session::invoke, return_value_policy::reference, call_guard<gil_scoped_release>())
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::Session::*)(ydk::path::DataNode& rpc) const) &ydk::path::Session::invoke, return_value_policy::reference, call_guard<gil_scoped_release>());
 
     class_<ydk::path::NetconfSession, ydk::path::Session>(path, "NetconfSession")
         .def("__init__",
@@ -307,7 +542,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=830,
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session, ydk::path::Repository& repo, const string& address, const string& username, const string& password, void* port, const string& protocol, bool on_demand, int timeout) {
                     new(&nc_session) ydk::path::NetconfSession(repo, address, username, password, 830, protocol, on_demand, timeout);
@@ -319,7 +554,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=nullptr,
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session, const string& address, const string& username, const string& password, int port, const string& protocol, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_session) ydk::path::NetconfSession(address, username, password, port, protocol, on_demand, common_cache, timeout);
@@ -331,7 +566,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session, const string& address, const string& username, const string& password, void* port, const string& protocol, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_session) ydk::path::NetconfSession(address, username, password, 830, protocol, on_demand, common_cache, timeout);
@@ -343,7 +578,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
 
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session,
@@ -365,7 +600,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("public_key_path"),
             arg("port")=830,
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session,
                 ydk::path::Repository& repo,
@@ -386,7 +621,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("public_key_path"),
             arg("port")=nullptr,
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session,
                 const string& address,
@@ -407,7 +642,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=830,
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::path::NetconfSession &nc_session,
                 const string& address,
@@ -428,11 +663,11 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=nullptr,
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
 
         .def("get_root_schema", &ydk::path::NetconfSession::get_root_schema, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::NetconfSession::*)(ydk::path::Rpc& rpc) const) &ydk::path::NetconfSession::invoke, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::NetconfSession::*)(ydk::path::DataNode& rpc) const) &ydk::path::NetconfSession::invoke, return_value_policy::reference)
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::NetconfSession::*)(ydk::path::Rpc& rpc) const) &ydk::path::NetconfSession::invoke, return_value_policy::reference, call_guard<gil_scoped_release>())
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::NetconfSession::*)(ydk::path::DataNode& rpc) const) &ydk::path::NetconfSession::invoke, return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("get_capabilities", &ydk::path::NetconfSession::get_capabilities, return_value_policy::reference);
 
     class_<ydk::path::RestconfSession, ydk::path::Session>(path, "RestconfSession")
@@ -454,10 +689,10 @@ PYBIND11_MODULE(ydk_, ydk)
              arg("port"),
              arg("encoding"),
              arg("config_url_root"),
-             arg("state_url_root"))
+             arg("state_url_root"), call_guard<gil_scoped_release>())
         .def("get_root_schema", &ydk::path::RestconfSession::get_root_schema, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::RestconfSession::*)(ydk::path::Rpc& rpc) const) &ydk::path::RestconfSession::invoke, return_value_policy::reference)
-        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::RestconfSession::*)(ydk::path::DataNode& rpc) const) &ydk::path::RestconfSession::invoke, return_value_policy::reference);
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::RestconfSession::*)(ydk::path::Rpc& rpc) const) &ydk::path::RestconfSession::invoke, return_value_policy::reference, call_guard<gil_scoped_release>())
+        .def("invoke", (std::shared_ptr<ydk::path::DataNode> (ydk::path::RestconfSession::*)(ydk::path::DataNode& rpc) const) &ydk::path::RestconfSession::invoke, return_value_policy::reference, call_guard<gil_scoped_release>());
 
     class_<ydk::path::Statement>(path, "Statement")
         .def(init<const string &, const string &>(), arg("keyword"), arg("arg"))
@@ -489,7 +724,7 @@ PYBIND11_MODULE(ydk_, ydk)
         .def("add_annotation", &ydk::path::DataNode::add_annotation, return_value_policy::reference, arg("annotation"))
         .def("remove_annotation", &ydk::path::DataNode::remove_annotation, return_value_policy::reference, arg("annotation"))
         .def("annotations", &ydk::path::DataNode::annotations, return_value_policy::reference)
-        .def("__call__", &ydk::path::DataNode::operator(), arg("service_provider"));
+        .def("__call__", &ydk::path::DataNode::operator(), arg("service_provider"), call_guard<gil_scoped_release>());
 
     class_<ydk::path::RootSchemaNode, shared_ptr<ydk::path::RootSchemaNode>>(path, "RootSchemaNode")
         .def("get_path", &ydk::path::RootSchemaNode::get_path, return_value_policy::reference)
@@ -509,32 +744,33 @@ PYBIND11_MODULE(ydk_, ydk)
         .def("get_schema_node", &ydk::path::Rpc::get_schema_node, return_value_policy::reference)
         .def("get_input_node", &ydk::path::Rpc::get_input_node, return_value_policy::reference)
         .def("has_output_node", &ydk::path::Rpc::has_output_node)
-        .def("__call__", &ydk::path::Rpc::operator(), arg("service_provider"));
+        .def("__call__", &ydk::path::Rpc::operator(), arg("service_provider"), call_guard<gil_scoped_release>());
 
     class_<ydk::path::Repository>(path, "Repository")
         .def(init<>())
         .def(init<ydk::path::ModelCachingOption>())
         .def(init<const string&>())
         .def(init<const string&, ydk::path::ModelCachingOption>())
+        .def_readonly("path", &ydk::path::Repository::path)
         .def("create_root_schema",
             (std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::vector<ydk::path::Capability>&)) &ydk::path::Repository::create_root_schema,
-            return_value_policy::move)
+            return_value_policy::move, call_guard<gil_scoped_release>())
         .def("create_root_schema",
             (std::shared_ptr<ydk::path::RootSchemaNode> (ydk::path::Repository::*)(const std::unordered_map<std::string, ydk::path::Capability>& lookup_tables,
                                                                                    const std::vector<ydk::path::Capability>& caps_to_load))
             &ydk::path::Repository::create_root_schema,
-            return_value_policy::move);
+            return_value_policy::move, call_guard<gil_scoped_release>());
 
     class_<ydk::path::Codec> codec(path, "Codec");
 
     codec
         .def(init<>())
         .def("encode", (std::string (ydk::path::Codec::*)(const ydk::path::DataNode&, ydk::EncodingFormat, bool))
-                &ydk::path::Codec::encode, arg("data_node"), arg("encoding"), arg("pretty"))
+                &ydk::path::Codec::encode, arg("data_node"), arg("encoding"), arg("pretty"), call_guard<gil_scoped_release>())
         .def("encode", (std::string (ydk::path::Codec::*)(std::vector<ydk::path::DataNode*>&, ydk::EncodingFormat, bool))
-                &ydk::path::Codec::encode, arg("data_node"), arg("encoding"), arg("pretty"))
-        .def("decode", &ydk::path::Codec::decode, arg("root_schema_node"), arg("payload"), arg("encoding"))
-        .def("decode_rpc_output", &ydk::path::Codec::decode_rpc_output, arg("root_schema_node"), arg("payload"), arg("rpc_path"), arg("encoding"));
+                &ydk::path::Codec::encode, arg("data_node"), arg("encoding"), arg("pretty"), call_guard<gil_scoped_release>())
+        .def("decode", &ydk::path::Codec::decode, arg("root_schema_node"), arg("payload"), arg("encoding"), call_guard<gil_scoped_release>())
+        .def("decode_rpc_output", &ydk::path::Codec::decode_rpc_output, arg("root_schema_node"), arg("payload"), arg("rpc_path"), arg("encoding"), call_guard<gil_scoped_release>());
 
     enum_<ydk::DataStore>(services, "Datastore")
         .value("candidate", ydk::DataStore::candidate)
@@ -740,7 +976,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=830,
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, ydk::path::Repository& repo, const string& address, const string& username, const string& password, void* port, const string& protocol, bool on_demand, int timeout) {
                     new(&nc_provider) ydk::NetconfServiceProvider(repo, address, username, password, 830, protocol, on_demand, timeout);
@@ -752,7 +988,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=nullptr,
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, int port, const string& protocol, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, port, protocol, on_demand, common_cache, timeout);
@@ -764,7 +1000,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, void* port, const string& protocol, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, 830, protocol, on_demand, common_cache, timeout);
@@ -776,7 +1012,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("protocol")=string("ssh"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, int port, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, port, "ssh", on_demand, common_cache, timeout);
@@ -787,7 +1023,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=830,
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider, const string& address, const string& username, const string& password, bool on_demand, bool common_cache, int timeout) {
                     new(&nc_provider) ydk::NetconfServiceProvider(address, username, password, 830, "ssh", on_demand, common_cache, timeout);
@@ -797,7 +1033,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("password"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
 
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider,
@@ -819,7 +1055,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("public_key_path"),
             arg("port")=830,
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider,
                 ydk::path::Repository& repo,
@@ -840,7 +1076,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("public_key_path"),
             arg("port")=nullptr,
             arg("on_demand")=true,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider,
                 const string& address,
@@ -861,7 +1097,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=830,
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider,
                 const string& address,
@@ -882,7 +1118,7 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("port")=nullptr,
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("__init__",
             [](ydk::NetconfServiceProvider &nc_provider,
                 const string& address,
@@ -901,78 +1137,92 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("public_key_path"),
             arg("on_demand")=true,
             arg("common_cache")=false,
-            arg("timeout")=-1)
+            arg("timeout")=-1, call_guard<gil_scoped_release>())
         .def("get_encoding", &ydk::NetconfServiceProvider::get_encoding, return_value_policy::reference)
         .def("get_session", &ydk::NetconfServiceProvider::get_session, return_value_policy::reference)
         .def("get_capabilities", &ydk::NetconfServiceProvider::get_capabilities, return_value_policy::reference);
 
     class_<ydk::RestconfServiceProvider, ydk::ServiceProvider>(providers, "RestconfServiceProvider")
         .def(init<ydk::path::Repository&, string, string, string, int, ydk::EncodingFormat>(),
-            arg("repo"), arg("address"), arg("username"), arg("password"), arg("port"), arg("encoding"))
+            arg("repo"), arg("address"), arg("username"), arg("password"), arg("port"), arg("encoding"), call_guard<gil_scoped_release>())
         .def("get_encoding", &ydk::RestconfServiceProvider::get_encoding, return_value_policy::reference)
         .def("get_session", &ydk::RestconfServiceProvider::get_session, return_value_policy::reference);
 
     class_<ydk::OpenDaylightServiceProvider>(providers, "OpenDaylightServiceProvider")
         .def(init<ydk::path::Repository&, string, string, string, int, ydk::EncodingFormat>(),
-            arg("repo"), arg("address"), arg("username"), arg("password"), arg("port"), arg("encoding"))
+            arg("repo"), arg("address"), arg("username"), arg("password"), arg("port"), arg("encoding"), call_guard<gil_scoped_release>())
         .def("get_node_provider", &ydk::OpenDaylightServiceProvider::get_node_provider, return_value_policy::reference)
         .def("get_node_ids", &ydk::OpenDaylightServiceProvider::get_node_ids, return_value_policy::reference);
 
+    // bindings taking or returning entities release the GIL only while requests are sent,
+    // see invoke_rpc
     class_<ydk::CrudService>(services, "CRUDService")
         .def(init<>())
         .def("create",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, ydk::Entity& entity)) &ydk::CrudService::create,
-            return_value_policy::reference)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, ydk::Entity& entity) {
+                vector<ydk::Entity*> entities{&entity};
+                return crud_edit(provider, entities, "ydk:create");
+            })
         .def("create",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list)) &ydk::CrudService::create,
-            return_value_policy::reference)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list) {
+                return crud_edit(provider, entity_list, "ydk:create");
+            })
         .def("read",
-            (shared_ptr<ydk::Entity> (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, ydk::Entity& entity)) &ydk::CrudService::read)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, ydk::Entity& entity) {
+                vector<ydk::Entity*> filters{&entity};
+                return crud_read(provider, filters, false)[0];
+            })
         .def("read",
-            (vector<shared_ptr<ydk::Entity>> (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list)) &ydk::CrudService::read)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list) {
+                return crud_read(provider, entity_list, false);
+            })
         .def("read_config",
-            (shared_ptr<ydk::Entity> (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, ydk::Entity& entity)) &ydk::CrudService::read_config)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, ydk::Entity& entity) {
+                vector<ydk::Entity*> filters{&entity};
+                return crud_read(provider, filters, true)[0];
+            })
         .def("read_config",
-            (vector<shared_ptr<ydk::Entity>> (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list)) &ydk::CrudService::read_config)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list) {
+                return crud_read(provider, entity_list, true);
+            })
         .def("update",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, ydk::Entity& entity)) &ydk::CrudService::update,
-            return_value_policy::reference)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, ydk::Entity& entity) {
+                vector<ydk::Entity*> entities{&entity};
+                return crud_edit(provider, entities, "ydk:update");
+            })
         .def("update",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list)) &ydk::CrudService::update,
-            return_value_policy::reference)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list) {
+                return crud_edit(provider, entity_list, "ydk:update");
+            })
         .def("delete",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, ydk::Entity& entity)) &ydk::CrudService::delete_,
-            return_value_policy::reference)
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, ydk::Entity& entity) {
+                vector<ydk::Entity*> entities{&entity};
+                return crud_edit(provider, entities, "ydk:delete");
+            })
         .def("delete",
-            (bool (ydk::CrudService::*)
-                (ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list)) &ydk::CrudService::delete_,
-            return_value_policy::reference);
+            [](ydk::CrudService&, ydk::ServiceProvider& provider, vector<ydk::Entity*>& entity_list) {
+                return crud_edit(provider, entity_list, "ydk:delete");
+            });
 
     class_<ydk::ExecutorService>(services, "ExecutorService")
         .def(init<>())
-        .def("execute_rpc", &ydk::ExecutorService::execute_rpc, arg("provider"), arg("entity"),
-            arg("top_entity") = nullptr);
+        .def("execute_rpc",
+            [](ydk::ExecutorService&, ydk::ServiceProvider& provider, ydk::Entity& entity, shared_ptr<ydk::Entity> top_entity) {
+                return execute_rpc(provider, entity, top_entity);
+            },
+            arg("provider"), arg("entity"), arg("top_entity") = nullptr);
 
     class_<ydk::NetconfService>(services, "NetconfService")
         .def(init<>())
         .def("cancel_commit", &ydk::NetconfService::cancel_commit,
             arg("provider"), arg("persist-id") = -1,
-            return_value_policy::reference)
+            return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("close_session", &ydk::NetconfService::close_session,
-            arg("provider"))
+            arg("provider"), call_guard<gil_scoped_release>())
         .def("commit", &ydk::NetconfService::commit,
             arg("provider"), arg("confirmed") = false,
             arg("confirm_timeout") = -1, arg("persist") = -1,
-            arg("persist-id") = -1, return_value_policy::reference)
+            arg("persist-id") = -1, return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("copy_config",
             (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, ydk::DataStore, std::string))
                 &ydk::NetconfService::copy_config,
@@ -980,60 +1230,76 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("target"),
             arg("source"),
             arg("url") = std::string{""},
-            return_value_policy::reference)
+            return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("copy_config",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, ydk::Entity&))
-                &ydk::NetconfService::copy_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore target, ydk::Entity& source_config) {
+                vector<ydk::Entity*> entities{&source_config};
+                return netconf_copy_config(provider, target, entities);
+            },
             arg("provider"),
             arg("target"),
             arg("source_config"),
             return_value_policy::reference)
         .def("copy_config",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, vector<ydk::Entity*>&))
-                &ydk::NetconfService::copy_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore target, vector<ydk::Entity*>& source_config) {
+                return netconf_copy_config(provider, target, source_config);
+            },
             arg("provider"),
             arg("target"),
             arg("source_config"),
             return_value_policy::reference)
         .def("delete_config", &ydk::NetconfService::delete_config,
             arg("provider"), arg("target"), arg("url") = std::string{""},
-            return_value_policy::reference)
+            return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("discard_changes", &ydk::NetconfService::discard_changes,
-            arg("provider"), return_value_policy::reference)
+            arg("provider"), return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("edit_config",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, ydk::Entity&, string, string, string))
-                &ydk::NetconfService::edit_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore target, ydk::Entity& config,
+               string default_operation, string test_option, string error_option) {
+                vector<ydk::Entity*> entities{&config};
+                return netconf_edit_config(provider, target, entities, default_operation, test_option, error_option);
+            },
             arg("provider"), arg("target"), arg("config"),
             arg("default_operation") = std::string{""}, arg("test_option") = std::string{""},
             arg("error_option") = std::string{""}, return_value_policy::reference)
         .def("edit_config",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, vector<ydk::Entity*>&, string, string, string))
-                &ydk::NetconfService::edit_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore target, vector<ydk::Entity*>& config,
+               string default_operation, string test_option, string error_option) {
+                return netconf_edit_config(provider, target, config, default_operation, test_option, error_option);
+            },
             arg("provider"), arg("target"), arg("config"),
             arg("default_operation") = std::string{""}, arg("test_option") = std::string{""},
             arg("error_option") = std::string{""}, return_value_policy::reference)
         .def("get_config",
-            (shared_ptr<ydk::Entity> (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, ydk::Entity&))
-                &ydk::NetconfService::get_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore source, ydk::Entity& filter) {
+                vector<ydk::Entity*> filters{&filter};
+                return netconf_get_config(provider, source, filters)[0];
+            },
             arg("provider"), arg("source"), arg("filter"))
         .def("get_config",
-            (vector<shared_ptr<ydk::Entity>> (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::DataStore, vector<ydk::Entity*>&))
-                &ydk::NetconfService::get_config,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::DataStore source, vector<ydk::Entity*>& filters) {
+                return netconf_get_config(provider, source, filters);
+            },
             arg("provider"), arg("source"), arg("filter"))
         .def("get",
-            (shared_ptr<ydk::Entity> (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, ydk::Entity&))
-                &ydk::NetconfService::get,
-            arg("provider"), arg("filter"), return_value_policy::reference)
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::Entity& filter) {
+                vector<ydk::Entity*> filters{&filter};
+                auto rpc = create_netconf_rpc(provider, "get");
+                return read_entities(provider, *rpc, filters)[0];
+            },
+            arg("provider"), arg("filter"))
         .def("get",
-            (vector<shared_ptr<ydk::Entity>> (ydk::NetconfService::*)(ydk::NetconfServiceProvider&, vector<ydk::Entity*>&))
-                &ydk::NetconfService::get,
-            arg("provider"), arg("filter"), return_value_policy::reference)
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, vector<ydk::Entity*>& filters) {
+                auto rpc = create_netconf_rpc(provider, "get");
+                return read_entities(provider, *rpc, filters);
+            },
+            arg("provider"), arg("filter"))
         .def("kill_session", &ydk::NetconfService::kill_session,
-            arg("provider"), arg("session_id"), return_value_policy::reference)
+            arg("provider"), arg("session_id"), return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("lock", &ydk::NetconfService::lock,
-            arg("provider"), arg("target"), return_value_policy::reference)
+            arg("provider"), arg("target"), return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("unlock", &ydk::NetconfService::unlock,
-            arg("provider"), arg("target"), return_value_policy::reference)
+            arg("provider"), arg("target"), return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("validate",
             (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
             ydk::DataStore,
@@ -1042,10 +1308,11 @@ PYBIND11_MODULE(ydk_, ydk)
             arg("provider"),
             arg("source"),
             arg("url") = std::string{""},
-            return_value_policy::reference)
+            return_value_policy::reference, call_guard<gil_scoped_release>())
         .def("validate",
-            (bool (ydk::NetconfService::*)(ydk::NetconfServiceProvider&,
-            ydk::Entity&)) &ydk::NetconfService::validate,
+            [](ydk::NetconfService&, ydk::NetconfServiceProvider& provider, ydk::Entity& source_config) {
+                return netconf_validate(provider, source_config);
+            },
             arg("provider"),
             arg("source_config"),
             return_value_policy::reference);
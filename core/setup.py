@@ -19,6 +19,7 @@
 from __future__ import print_function
 import os
 import subprocess
+import sys
 import sysconfig
 
 from setuptools.command.build_ext import build_ext
@@ -33,7 +34,7 @@ NMSP_PKG_DEPENDENCIES = ["$DEPENDENCY$"]
 # Namespace packages are share same prefix: "ydk-models"
 NAME = 'ydk'
 VERSION = '0.7.2'
-INSTALL_REQUIREMENTS = ['pybind11>=2.1.1']
+INSTALL_REQUIREMENTS = ['pybind11>=2.2.0', 'futures;python_version<"3.2"']
 
 
 LONG_DESCRIPTION = '''
@@ -49,6 +50,9 @@ LONG_DESCRIPTION = '''
 
 YDK_PACKAGES = find_packages(exclude=['contrib', 'docs*', 'tests*',
                                       'ncclient', 'samples'])
+if sys.version_info < (3, 5):
+    # asyncio front end uses async/await syntax
+    YDK_PACKAGES = [p for p in YDK_PACKAGES if not p.startswith('ydk.aio')]
 
 
 class CMakeExtension(Extension):
@@ -76,7 +80,7 @@ class YdkBuildExtension(build_ext):
             import pybind11
         except ImportError:
             import pip
-            pip.main(['install', 'pybind11>=2.1.1'])
+            pip.main(['install', 'pybind11>=2.2.0'])
             import pybind11
 
         extdir = os.path.abspath(os.path.dirname(self.get_ext_fullpath(ext.name)))
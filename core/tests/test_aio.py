@@ -0,0 +1,169 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_aio.py
+Tests for running blocking service operations from asyncio with ydk.aio.
+"""
+from __future__ import absolute_import
+
+import sys
+import threading
+import time
+import unittest
+import warnings
+
+from ydk.providers import NetconfServiceProvider
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+try:
+    import asyncio
+    from ydk.aio import services as aio_services
+except (ImportError, SyntaxError):
+    aio_services = None
+
+
+class _Service(object):
+    """Blocking service recording how many calls run at once."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def echo(self, provider, value):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.threads.add(threading.current_thread())
+        try:
+            time.sleep(self.delay)
+            return value
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@unittest.skipIf(aio_services is None, 'asyncio front end requires Python 3.5')
+class SanityAsyncService(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def _service(self, blocking, **kwargs):
+        service = aio_services._AsyncService(blocking, max_workers=4, **kwargs)
+        self.addCleanup(service.shutdown)
+        return service
+
+    def test_runs_in_thread(self):
+        blocking = _Service()
+        service = self._service(blocking)
+        result = self.loop.run_until_complete(service._run('provider', blocking.echo, 'value'))
+        self.assertEqual(result, 'value')
+        self.assertNotIn(threading.current_thread(), blocking.threads)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'get_running_loop requires Python 3.7')
+    def test_running_loop(self):
+        blocking = _Service()
+        service = self._service(blocking)
+        get_event_loop = asyncio.get_event_loop
+
+        def fail():
+            raise AssertionError('get_event_loop called')
+
+        asyncio.get_event_loop = fail
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                result = self.loop.run_until_complete(service._run('provider', blocking.echo, 1))
+        finally:
+            asyncio.get_event_loop = get_event_loop
+        self.assertEqual(result, 1)
+
+    def test_loop_in_other_thread(self):
+        blocking = _Service()
+        service = self._service(blocking)
+        results = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            try:
+                results.append(loop.run_until_complete(service._run('provider', blocking.echo, 2)))
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [2])
+
+    def test_concurrency_per_provider(self):
+        blocking = _Service(delay=0.05)
+        service = self._service(blocking)
+        calls = [service._run('first', blocking.echo, i) for i in range(3)]
+        calls.append(service._run('second', blocking.echo, 3))
+        results = self.loop.run_until_complete(asyncio.gather(*calls))
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertEqual(blocking.max_running, 2)
+        self.assertEqual(service._slots._slots, {})
+
+    def test_timeout(self):
+        blocking = _Service(delay=0.2)
+        service = self._service(blocking)
+        with self.assertRaises(asyncio.TimeoutError):
+            self.loop.run_until_complete(service._run('provider', blocking.echo, 1, timeout=0.01))
+        # the provider is released once the call ends in its thread
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertEqual(service._slots._slots, {})
+
+    def test_loop_runs_during_read(self):
+        latency = 0.3
+        service = aio_services.CRUDService(max_workers=1)
+        self.addCleanup(service.shutdown)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def read(provider):
+            ticker = asyncio.ensure_future(tick())
+            try:
+                return await service.read(provider, openconfig_interfaces.Interfaces())
+            finally:
+                ticker.cancel()
+
+        with NetconfServer('openconfig', latency=latency) as server:
+            provider = NetconfServiceProvider(address='127.0.0.1', username='admin', password='admin',
+                                              port=server.port, protocol='tcp')
+            self.loop.run_until_complete(read(provider))
+        # the loop kept running while the read waited for the device
+        gaps = [second - first for first, second in zip(ticks, ticks[1:])]
+        self.assertGreater(ticks[-1] - ticks[0], latency / 2)
+        self.assertLess(max(gaps), latency / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
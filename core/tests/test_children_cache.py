@@ -0,0 +1,92 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_children_cache.py
+Tests for the cached children map and segment path of entities.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.models.ietf import ietf_interfaces
+from ydk.models.openconfig import openconfig_bgp
+
+
+def _interface(name):
+    interface = ietf_interfaces.Interfaces.Interface()
+    interface.name = name
+    return interface
+
+
+class SanityChildrenCache(unittest.TestCase):
+
+    def test_children_cached(self):
+        bgp = openconfig_bgp.Bgp()
+        children = bgp.get_children()
+        self.assertIs(bgp.get_children(), children)
+        self.assertEqual(sorted(children.keys()), ['global_', 'neighbors', 'peer_groups'])
+
+    def test_child_replaced(self):
+        bgp = openconfig_bgp.Bgp()
+        children = bgp.get_children()
+        bgp.global_ = openconfig_bgp.Bgp.Global()
+        self.assertIsNot(bgp.get_children(), children)
+        self.assertIs(bgp.get_children()['global_'], bgp.global_)
+
+    def test_list_changes(self):
+        interfaces = ietf_interfaces.Interfaces()
+        self.assertEqual(len(interfaces.get_children()), 0)
+        interfaces.interface.append(_interface('Loopback0'))
+        self.assertEqual(list(interfaces.get_children().keys()), ["interface[name='Loopback0']"])
+        interfaces.interface.append(_interface('Loopback1'))
+        self.assertEqual(len(interfaces.get_children()), 2)
+        interfaces.interface.pop('Loopback0')
+        self.assertEqual(list(interfaces.get_children().keys()), ["interface[name='Loopback1']"])
+        interfaces.interface.clear()
+        self.assertEqual(len(interfaces.get_children()), 0)
+
+    def test_key_changed(self):
+        interfaces = ietf_interfaces.Interfaces()
+        interface = _interface('Loopback0')
+        interfaces.interface.append(interface)
+        self.assertEqual(interface.get_segment_path(), "interface[name='Loopback0']")
+        self.assertIn("interface[name='Loopback0']", interfaces.get_children())
+        interface.name = 'Loopback1'
+        self.assertEqual(interface.get_segment_path(), "interface[name='Loopback1']")
+        self.assertIn("interface[name='Loopback1']", interfaces.get_children())
+        self.assertEqual(interface.get_absolute_path(),
+                         "ietf-interfaces:interfaces/interface[name='Loopback1']")
+
+    def test_key_not_set(self):
+        interface = ietf_interfaces.Interfaces.Interface()
+        self.assertEqual(interface.get_segment_path(), "interface[name='None']")
+        interface.name = 'Loopback0'
+        self.assertEqual(interface.get_segment_path(), "interface[name='Loopback0']")
+
+    def test_quoted_key(self):
+        interface = _interface("it's")
+        self.assertEqual(interface.get_segment_path(), 'interface[name="it\'s"]')
+
+    def test_order_of_children(self):
+        interfaces = ietf_interfaces.Interfaces()
+        interfaces.interface.append(_interface('Loopback1'))
+        interfaces.interface.append(_interface('Loopback0'))
+        self.assertEqual(interfaces.get_order_of_children(),
+                         ["interface[name='Loopback1']", "interface[name='Loopback0']"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_codec_batch.py
+Tests for encode and decode of batches in a thread pool with CodecService.
+"""
+from __future__ import absolute_import
+
+import os
+import threading
+import time
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+from ydk.services.codec_service import _get_codec
+from ydk.models import openconfig
+from ydk.models.openconfig import openconfig_bgp
+
+_YANG_PATH = os.path.join(openconfig.__path__[0], '_yang')
+
+
+def _bgp(i):
+    bgp = openconfig_bgp.Bgp()
+    bgp.global_.config.as_ = 65000 + i
+    neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+    neighbor.neighbor_address = '10.0.%d.1' % (i % 256)
+    neighbor.config.neighbor_address = neighbor.neighbor_address
+    neighbor.config.peer_as = 65100 + i
+    bgp.neighbors.neighbor.append(neighbor)
+    return bgp
+
+
+class SanityRunBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CodecService()
+        self.provider = CodecServiceProvider(type='xml')
+
+    def test_per_thread_state(self):
+        self.provider.initialize('openconfig', _YANG_PATH)
+        lock = threading.Lock()
+
+        def run_batch():
+            used = []
+
+            def func(item):
+                with lock:
+                    used.append((threading.current_thread(), id(_get_codec()),
+                                 id(self.provider.get_root_schema('openconfig'))))
+                # keep every worker busy
+                time.sleep(0.01)
+                return item
+
+            self.assertEqual(self.codec._run_batch(func, list(range(50)), 4), list(range(50)))
+            return used
+
+        first = run_batch()
+        by_thread = {}
+        for thread, codec, root_schema in first:
+            self.assertIsNot(thread, threading.current_thread())
+            by_thread.setdefault(thread, set()).add((codec, root_schema))
+        for states in by_thread.values():
+            self.assertEqual(len(states), 1)
+        states = [state for states in by_thread.values() for state in states]
+        self.assertEqual(len(set(codec for codec, _ in states)), len(states))
+        self.assertEqual(len(set(root_schema for _, root_schema in states)), len(states))
+        # workers keep their codec and root schemas across calls
+        second = [entry for entry in run_batch() if entry[0] in by_thread]
+        self.assertNotEqual(second, [])
+        for thread, codec, root_schema in second:
+            self.assertEqual(by_thread[thread], set([(codec, root_schema)]))
+
+    def test_errors_per_item(self):
+        def func(item):
+            if item == 'bad':
+                raise ValueError(item)
+            return item.upper()
+
+        results = self.codec._run_batch(func, {'a': 'x', 'b': 'bad'}, 2)
+        self.assertEqual(results['a'], 'X')
+        self.assertIsInstance(results['b'], ValueError)
+
+    def test_invalid_holder(self):
+        with self.assertRaises(YServiceError):
+            self.codec._run_batch(lambda item: item, 'abc', 2)
+
+
+class SanityCodecBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CodecService()
+        self.provider = CodecServiceProvider(type='xml')
+
+    def test_encode_decode_stress(self):
+        entities = [_bgp(i) for i in range(200)]
+        expected = [self.codec.encode(self.provider, entity) for entity in entities]
+        payloads = self.codec.encode_batch(self.provider, entities, max_workers=8)
+        self.assertEqual(payloads, expected)
+
+        decoded = self.codec.decode_batch(self.provider, payloads, max_workers=8)
+        for i, entity in enumerate(decoded):
+            self.assertIsInstance(entity, openconfig_bgp.Bgp)
+            self.assertEqual(str(entity.global_.config.as_), str(65000 + i))
+
+    def test_error_per_item(self):
+        payloads = {'good': self.codec.encode(self.provider, _bgp(1)), 'bad': '<bgp'}
+        decoded = self.codec.decode_batch(self.provider, payloads, max_workers=2)
+        self.assertIsInstance(decoded['good'], openconfig_bgp.Bgp)
+        self.assertIsInstance(decoded['bad'], Exception)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_codec_provider.py
+Tests for root schemas shared between CodecServiceProvider instances of a
+thread.
+"""
+from __future__ import absolute_import
+
+import os
+import threading
+import unittest
+
+from ydk.errors import YServiceProviderError
+from ydk.path import Repository
+from ydk.providers import CodecServiceProvider
+from ydk.models import openconfig
+
+_YANG_PATH = os.path.join(openconfig.__path__[0], '_yang')
+
+
+class SanityCodecProvider(unittest.TestCase):
+
+    def test_root_schema_shared(self):
+        first = CodecServiceProvider(type='xml')
+        second = CodecServiceProvider(type='json')
+        first.initialize('openconfig', _YANG_PATH)
+        second.initialize('openconfig', _YANG_PATH)
+        self.assertIs(first.get_root_schema('openconfig'), second.get_root_schema('openconfig'))
+
+    def test_user_repository_shared(self):
+        repo = Repository(_YANG_PATH)
+        first = CodecServiceProvider(type='xml', repo=repo)
+        second = CodecServiceProvider(type='xml', repo=repo)
+        first.initialize('openconfig', _YANG_PATH)
+        second.initialize('openconfig', _YANG_PATH)
+        self.assertIs(first.get_root_schema('openconfig'), second.get_root_schema('openconfig'))
+
+    def test_user_repository_same_path(self):
+        first = CodecServiceProvider(type='xml', repo=Repository(_YANG_PATH))
+        second = CodecServiceProvider(type='xml', repo=Repository(_YANG_PATH))
+        first.initialize('openconfig', _YANG_PATH)
+        second.initialize('openconfig', _YANG_PATH)
+        self.assertIs(first.get_root_schema('openconfig'), second.get_root_schema('openconfig'))
+
+    def test_not_shared_between_threads(self):
+        provider = CodecServiceProvider(type='json')
+        provider.initialize('openconfig', _YANG_PATH)
+        other = []
+
+        def run():
+            other.append(provider.get_root_schema('openconfig'))
+            other.append(provider.get_root_schema('openconfig'))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertIs(other[0], other[1])
+        self.assertIsNot(other[0], provider.get_root_schema('openconfig'))
+
+    def test_not_initialized(self):
+        provider = CodecServiceProvider(type='xml')
+        with self.assertRaises(YServiceProviderError):
+            provider.get_root_schema('openconfig')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_crud_batch.py
+Tests for write-behind batching of CRUDService operations.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.providers import NetconfServiceProvider
+from ydk.services import CRUDService
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+
+class _Crud(object):
+    """Core CRUD service recording requests, failing those holding an
+    entity in fail."""
+
+    def __init__(self):
+        self.requests = []
+        self.fail = set()
+        self.fail_all = False
+
+    def _request(self, operation, entities):
+        self.requests.append((operation, list(entities)))
+        if self.fail_all or any(isinstance(e, str) and e in self.fail for e in entities):
+            raise YServiceError('rpc-error')
+        return True
+
+    def create(self, provider, entities):
+        return self._request('create', entities)
+
+    def update(self, provider, entities):
+        return self._request('update', entities)
+
+    def delete(self, provider, entities):
+        return self._request('delete', entities)
+
+    def read(self, provider, read_filter):
+        self.requests.append(('read', [read_filter]))
+        return read_filter
+
+
+def _interface(name):
+    interface = openconfig_interfaces.Interfaces.Interface()
+    interface.name = name
+    interface.config.name = name
+    return interface
+
+
+class SanityCrudBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.crud = CRUDService()
+        self.core = self.crud._crud = _Crud()
+        self.provider = object()
+
+    def test_one_request_per_kind(self):
+        with self.crud.batch(self.provider) as batch:
+            self.assertTrue(self.crud.create(self.provider, 'a'))
+            self.crud.create(self.provider, 'b')
+            self.crud.delete(self.provider, 'c')
+            self.crud.update(self.provider, 'd')
+            self.assertEqual(self.core.requests, [])
+        self.assertEqual(self.core.requests, [('create', ['a', 'b']), ('delete', ['c']), ('update', ['d'])])
+        self.assertEqual(batch.requests, 3)
+
+    def test_max_entities(self):
+        with self.crud.batch(self.provider, max_entities=2):
+            for name in 'abcde':
+                self.crud.create(self.provider, name)
+            self.assertEqual(self.core.requests, [('create', ['a', 'b']), ('create', ['c', 'd'])])
+        self.assertEqual(self.core.requests[-1], ('create', ['e']))
+
+    def test_read_sends_queued(self):
+        with self.crud.batch(self.provider):
+            self.crud.create(self.provider, 'a')
+            self.crud.read(self.provider, 'filter')
+            self.assertEqual(self.core.requests, [('create', ['a']), ('read', ['filter'])])
+
+    def test_exception_drops_queued(self):
+        with self.assertRaises(ValueError):
+            with self.crud.batch(self.provider, max_entities=2):
+                for name in 'abc':
+                    self.crud.create(self.provider, name)
+                raise ValueError()
+        self.assertEqual(self.core.requests, [('create', ['a', 'b'])])
+
+    def test_failed_request_not_retried(self):
+        self.core.fail.add('b')
+        with self.assertRaises(YServiceError):
+            with self.crud.batch(self.provider, max_entities=2) as batch:
+                for name in 'abc':
+                    self.crud.create(self.provider, name)
+        self.assertEqual(self.core.requests, [('create', ['a', 'b']), ('create', ['c'])])
+        self.assertEqual([(operation, entity) for operation, entity, _ in batch.failures],
+                         [('create', 'a'), ('create', 'b')])
+
+    def test_entities_copied(self):
+        interface = _interface('eth0')
+        interface.config.mtu = 1500
+        with self.crud.batch(self.provider) as batch:
+            self.crud.create(self.provider, interface)
+            interface.name = interface.config.name = 'eth1'
+            interface.config.mtu = 9000
+            self.crud.create(self.provider, interface)
+            self.crud.delete(self.provider, interface)
+        created = self.core.requests[0][1]
+        self.assertEqual([(e.name, e.config.name, e.config.mtu) for e in created],
+                         [('eth0', 'eth0', 1500), ('eth1', 'eth1', 9000)])
+        self.assertIsNot(created[1], interface)
+        self.assertIsNot(created[1].config, interface.config)
+        self.assertIs(created[1].config.parent, created[1])
+        self.assertEqual(interface.config.mtu, 9000)
+        self.assertEqual(batch.failures, [])
+
+    def test_copy_keeps_parent(self):
+        interfaces = openconfig_interfaces.Interfaces()
+        interface = _interface('eth0')
+        interfaces.interface.append(interface)
+        with self.crud.batch(self.provider):
+            self.crud.update(self.provider, interface.config)
+        config = self.core.requests[0][1][0]
+        self.assertIsNot(config, interface.config)
+        self.assertIs(config.parent, interface)
+        self.assertEqual(config.name, 'eth0')
+
+    def test_failures_report_queued_entity(self):
+        interface = _interface('eth0')
+        self.core.fail_all = True
+        with self.assertRaises(YServiceError):
+            with self.crud.batch(self.provider) as batch:
+                self.crud.create(self.provider, interface)
+        self.assertIs(batch.failures[0][1], interface)
+
+    def test_other_provider(self):
+        other = object()
+        with self.crud.batch(self.provider):
+            self.crud.create(other, 'a')
+            self.assertEqual(self.core.requests, [('create', ['a'])])
+
+    def test_arguments(self):
+        with self.assertRaises(YServiceError):
+            with self.crud.batch(None):
+                pass
+        with self.assertRaises(YServiceError):
+            with self.crud.batch(self.provider, max_entities=0):
+                pass
+
+
+class SanityCrudBatchServer(unittest.TestCase):
+
+    def test_single_edit_config(self):
+        with NetconfServer('openconfig') as server:
+            provider = NetconfServiceProvider(address='127.0.0.1', username='admin', password='admin',
+                                              port=server.port, protocol='tcp')
+            crud = CRUDService()
+            requests = server.requests
+            with crud.batch(provider):
+                for i in range(5):
+                    interfaces = openconfig_interfaces.Interfaces()
+                    interfaces.interface.append(_interface('eth%d' % i))
+                    crud.create(provider, interfaces)
+            self.assertEqual(server.requests - requests, 1)
+            read = crud.read_config(provider, openconfig_interfaces.Interfaces())
+            self.assertEqual(sorted(entry.name for entry in read.interface),
+                             ['eth%d' % i for i in range(5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
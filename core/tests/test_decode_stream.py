@@ -0,0 +1,98 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_decode_stream.py
+Tests for incremental decode of list entries with CodecService.decode_stream.
+"""
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+from ydk.models.openconfig import openconfig_bgp
+
+_NEIGHBOR = '''    <neighbor>
+      <neighbor-address>{0}</neighbor-address>
+      <config>
+        <neighbor-address>{0}</neighbor-address>
+        <peer-as>{1}</peer-as>
+      </config>
+    </neighbor>
+'''
+
+
+def _bgp_payload(count):
+    neighbors = ''.join(_NEIGHBOR.format('10.0.0.%d' % i, 65100 + i) for i in range(count))
+    return ('<bgp xmlns="http://openconfig.net/yang/bgp">\n'
+            '  <global>\n    <config>\n      <as>65001</as>\n    </config>\n  </global>\n'
+            '  <neighbors>\n' + neighbors + '  </neighbors>\n</bgp>\n')
+
+
+class SanityDecodeStream(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CodecService()
+        self.provider = CodecServiceProvider(type='xml')
+
+    def test_entries(self):
+        stream = io.BytesIO(_bgp_payload(3).encode('utf-8'))
+        entries = list(self.codec.decode_stream(self.provider, stream, 'neighbors/neighbor'))
+        self.assertEqual([entry.neighbor_address for entry in entries],
+                         ['10.0.0.0', '10.0.0.1', '10.0.0.2'])
+        for i, entry in enumerate(entries):
+            self.assertIsInstance(entry, openconfig_bgp.Bgp.Neighbors.Neighbor)
+            self.assertEqual(str(entry.config.peer_as), str(65100 + i))
+            self.assertIsInstance(entry.parent.parent, openconfig_bgp.Bgp)
+            self.assertEqual(len(entry.parent.neighbor), 1)
+            # containers absent from the payload are not built
+            self.assertNotIn('global_', entry.parent.parent.__dict__)
+            self.assertNotIn('timers', entry.__dict__)
+
+    def test_file_name(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'bgp.xml')
+            with open(path, 'w') as f:
+                f.write(_bgp_payload(2))
+            entries = list(self.codec.decode_stream(self.provider, path, 'neighbors/neighbor'))
+            self.assertEqual(len(entries), 2)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_no_entries(self):
+        stream = io.BytesIO(_bgp_payload(0).encode('utf-8'))
+        self.assertEqual(list(self.codec.decode_stream(self.provider, stream, 'neighbors/neighbor')), [])
+
+    def test_json_provider(self):
+        provider = CodecServiceProvider(type='json')
+        stream = io.BytesIO(_bgp_payload(1).encode('utf-8'))
+        with self.assertRaises(YServiceError):
+            list(self.codec.decode_stream(provider, stream, 'neighbors/neighbor'))
+
+    def test_empty_entry_path(self):
+        stream = io.BytesIO(_bgp_payload(1).encode('utf-8'))
+        with self.assertRaises(YServiceError):
+            list(self.codec.decode_stream(self.provider, stream, '/'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_encode_stream.py
+Tests for encode of list entries one at a time with CodecService.encode_stream.
+"""
+from __future__ import absolute_import
+
+import io
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+from ydk.types.py_types import _attach_shared, _encoding_copy
+from ydk.models.openconfig import openconfig_bgp
+from ydk.models.openconfig import openconfig_interfaces
+
+
+def _bgp(count):
+    bgp = openconfig_bgp.Bgp()
+    bgp.global_.config.as_ = 65001
+    for i in range(count):
+        neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+        neighbor.neighbor_address = '10.0.0.%d' % i
+        neighbor.config.neighbor_address = '10.0.0.%d' % i
+        neighbor.config.peer_as = 65100 + i
+        bgp.neighbors.neighbor.append(neighbor)
+    return bgp
+
+
+def _interfaces(counts):
+    interfaces = openconfig_interfaces.Interfaces()
+    for i, count in enumerate(counts):
+        interface = openconfig_interfaces.Interfaces.Interface()
+        interface.name = 'eth%d' % i
+        interface.config.name = 'eth%d' % i
+        interface.config.mtu = 1500
+        for j in range(count):
+            subinterface = openconfig_interfaces.Interfaces.Interface.Subinterfaces.Subinterface()
+            subinterface.index = j
+            subinterface.config.index = j
+            subinterface.config.description = 'sub%d' % j
+            interface.subinterfaces.subinterface.append(subinterface)
+        interfaces.interface.append(interface)
+    return interfaces
+
+
+class SanityEncodingCopy(unittest.TestCase):
+
+    def test_copy(self):
+        bgp = _bgp(2)
+        copy = _encoding_copy(bgp, exclude=('neighbors',))
+        self.assertIsInstance(copy, openconfig_bgp.Bgp)
+        self.assertIs(copy.global_, bgp.global_)
+        self.assertIs(bgp.global_.parent, bgp)
+        self.assertIsNot(copy.neighbors, bgp.neighbors)
+        self.assertEqual(len(copy.neighbors.neighbor), 0)
+
+    def test_keys_only(self):
+        neighbor = _bgp(1).neighbors.neighbor[0]
+        copy = _encoding_copy(neighbor, keys_only=True)
+        self.assertEqual(copy.neighbor_address, '10.0.0.0')
+        self.assertIsNone(copy.config.peer_as)
+
+    def test_attach_shared(self):
+        bgp = _bgp(2)
+        entry = bgp.neighbors.neighbor[1]
+        copy = _encoding_copy(bgp.neighbors, keys_only=True)
+        _attach_shared(copy, 'neighbor', [entry])
+        self.assertEqual(len(copy.neighbor), 1)
+        self.assertIs(copy.neighbor[0], entry)
+        self.assertIs(entry.parent, bgp.neighbors)
+        self.assertEqual(len(bgp.neighbors.neighbor), 2)
+
+
+class SanityEncodeStream(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = CodecService()
+        self.provider = CodecServiceProvider(type='xml')
+
+    def _encode_stream(self, entity, entry_path):
+        chunks = []
+        self.codec.encode_stream(self.provider, entity, chunks.append, entry_path)
+        return chunks
+
+    def test_entries(self):
+        bgp = _bgp(3)
+        chunks = self._encode_stream(bgp, 'neighbors/neighbor')
+        self.assertEqual(''.join(chunks), self.codec.encode(self.provider, bgp))
+        # payload outside of the list, then one chunk per entry
+        self.assertEqual(len(chunks), 5)
+
+    def test_nested_lists(self):
+        interfaces = _interfaces([2, 0, 3])
+        chunks = self._encode_stream(interfaces, 'interface/subinterfaces/subinterface')
+        self.assertEqual(''.join(chunks), self.codec.encode(self.provider, interfaces))
+
+    def test_entity_unchanged(self):
+        bgp = _bgp(3)
+        neighbors = bgp.neighbors.neighbor
+        entries = list(neighbors)
+        payload = self.codec.encode(self.provider, bgp)
+        self._encode_stream(bgp, 'neighbors/neighbor')
+        self.assertIs(bgp.neighbors.neighbor, neighbors)
+        self.assertEqual(list(neighbors), entries)
+        for entry in entries:
+            self.assertIs(entry.parent, bgp.neighbors)
+        self.assertEqual(self.codec.encode(self.provider, bgp), payload)
+
+    def test_file_object(self):
+        bgp = _bgp(2)
+        stream = io.StringIO() if str is not bytes else io.BytesIO()
+        self.codec.encode_stream(self.provider, bgp, stream, 'neighbors/neighbor')
+        self.assertEqual(stream.getvalue(), self.codec.encode(self.provider, bgp))
+
+    def test_no_entries(self):
+        bgp = _bgp(0)
+        self.assertEqual(''.join(self._encode_stream(bgp, 'neighbors/neighbor')),
+                         self.codec.encode(self.provider, bgp))
+
+    def test_unknown_node(self):
+        with self.assertRaises(YServiceError):
+            self._encode_stream(_bgp(1), 'neighbors/peer')
+
+    def test_json_provider(self):
+        provider = CodecServiceProvider(type='json')
+        with self.assertRaises(YServiceError):
+            self.codec.encode_stream(provider, _bgp(1), [].append, 'neighbors/neighbor')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_entity_collection.py
+Tests for keyed and positional access to YList and EntityCollection.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.errors import YInvalidArgumentError
+from ydk.types import Config
+from ydk.models.openconfig import openconfig_bgp
+
+
+def _neighbor(address):
+    neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+    neighbor.neighbor_address = address
+    return neighbor
+
+
+class SanityYList(unittest.TestCase):
+
+    def setUp(self):
+        self.bgp = openconfig_bgp.Bgp()
+        self.neighbors = self.bgp.neighbors.neighbor
+        for i in range(5):
+            self.neighbors.append(_neighbor('10.0.0.%d' % i))
+
+    def test_access_by_key(self):
+        self.assertEqual(self.neighbors['10.0.0.3'].neighbor_address, '10.0.0.3')
+        self.assertTrue(self.neighbors.has_key('10.0.0.4'))
+        self.assertFalse(self.neighbors.has_key('10.0.0.5'))
+        self.assertIsNone(self.neighbors['10.0.0.5'])
+
+    def test_access_by_position(self):
+        self.assertEqual(len(self.neighbors), 5)
+        self.assertEqual(self.neighbors[0].neighbor_address, '10.0.0.0')
+        self.assertEqual(self.neighbors[4].neighbor_address, '10.0.0.4')
+        with self.assertRaises(KeyError):
+            self.neighbors[5]
+        self.assertEqual([n.neighbor_address for n in self.neighbors],
+                         ['10.0.0.%d' % i for i in range(5)])
+
+    def test_position_after_pop(self):
+        self.neighbors.pop('10.0.0.1')
+        self.assertEqual(len(self.neighbors), 4)
+        self.assertEqual(self.neighbors[1].neighbor_address, '10.0.0.2')
+        self.neighbors.pop(0)
+        self.assertEqual(self.neighbors[0].neighbor_address, '10.0.0.2')
+        self.neighbors.append(_neighbor('10.0.0.9'))
+        self.assertEqual(self.neighbors[3].neighbor_address, '10.0.0.9')
+        self.assertEqual(self.neighbors.keys(), ['10.0.0.2', '10.0.0.3', '10.0.0.4', '10.0.0.9'])
+
+    def test_key_reuse(self):
+        replacement = _neighbor('10.0.0.2')
+        self.neighbors.append(replacement)
+        self.assertEqual(len(self.neighbors), 5)
+        self.assertIs(self.neighbors['10.0.0.2'], replacement)
+        self.assertIs(self.neighbors[2], replacement)
+
+    def test_parent(self):
+        self.assertIs(self.neighbors[0].parent, self.bgp.neighbors)
+
+    def test_clear(self):
+        self.neighbors.clear()
+        self.assertEqual(len(self.neighbors), 0)
+        self.assertEqual(self.neighbors.entities(), [])
+        self.assertFalse(self.bgp.has_data())
+
+
+class SanityEntityCollection(unittest.TestCase):
+
+    def test_access(self):
+        bgp = openconfig_bgp.Bgp()
+        neighbor = _neighbor('10.0.0.1')
+        config = Config(bgp, neighbor)
+        self.assertEqual(len(config), 2)
+        self.assertIs(config[0], bgp)
+        self.assertIs(config[1], neighbor)
+        self.assertIs(config[bgp.path()], bgp)
+        self.assertIs(config[neighbor], neighbor)
+        self.assertIsNone(config[2])
+
+    def test_pop(self):
+        bgp = openconfig_bgp.Bgp()
+        neighbor = _neighbor('10.0.0.1')
+        config = Config([bgp, neighbor])
+        self.assertIs(config.pop(0), bgp)
+        self.assertIs(config[0], neighbor)
+        self.assertIs(config.pop(), neighbor)
+        self.assertEqual(len(config), 0)
+
+    def test_invalid(self):
+        config = Config()
+        with self.assertRaises(YInvalidArgumentError):
+            config.append('bgp')
+        with self.assertRaises(YInvalidArgumentError):
+            config[1.5]
+
+
+if __name__ == '__main__':
+    unittest.main()
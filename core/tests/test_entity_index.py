@@ -0,0 +1,91 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_entity_index.py
+Tests for the index of top level entity classes of installed bundles.
+"""
+from __future__ import absolute_import
+
+import os
+import unittest
+
+from ydk.errors import YModelError
+from ydk.types import EncodingFormat
+from ydk.entity_utils.entity_utils import _get_entity_class, _get_entity_index
+from ydk.entity_utils.entity_utils import _get_ns_ename, _payload_to_top_entity
+from ydk.entity_utils.entity_utils import _iter_bundles, _read_yang_ns
+from ydk.models.openconfig import openconfig_bgp
+
+_BGP_NS = 'http://openconfig.net/yang/bgp'
+
+
+class SanityEntityIndex(unittest.TestCase):
+
+    def test_entity_class(self):
+        self.assertIs(_get_entity_class((_BGP_NS, 'bgp')), openconfig_bgp.Bgp)
+        self.assertIs(_get_entity_class(('openconfig-bgp', 'bgp')), openconfig_bgp.Bgp)
+        self.assertIsNone(_get_entity_class(('openconfig-bgp', 'neighbors')))
+        self.assertIsNone(_get_entity_class(('urn:unknown', 'bgp')))
+
+    def test_index_shared(self):
+        self.assertIs(_get_entity_index(), _get_entity_index())
+        self.assertEqual(_get_entity_index()[(_BGP_NS, 'bgp')], ('openconfig', 'openconfig_bgp.Bgp'))
+
+    def test_xml_root(self):
+        payload = '<?xml version="1.0"?>\n<bgp xmlns="{}"><global><config/></global></bgp>'.format(_BGP_NS)
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_xml_root_prefixed(self):
+        payload = '<oc:bgp xmlns:oc="{}"><oc:global/></oc:bgp>'.format(_BGP_NS)
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_xml_root_without_namespace(self):
+        self.assertEqual(_get_ns_ename('<bgp/>', EncodingFormat.XML), (None, None))
+
+    def test_xml_large_payload(self):
+        payload = '<bgp xmlns="{}">{}</bgp>'.format(_BGP_NS, '<global/>' * 10000)
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_json_root(self):
+        payload = '{\n  "openconfig-bgp:bgp": {"global": {}}\n}'
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.JSON), ('openconfig-bgp', 'bgp'))
+
+    def test_payload_to_top_entity(self):
+        payload = '<bgp xmlns="{}"/>'.format(_BGP_NS)
+        self.assertIsInstance(_payload_to_top_entity(payload, EncodingFormat.XML), openconfig_bgp.Bgp)
+        with self.assertRaises(YModelError):
+            _payload_to_top_entity('<bgp xmlns="urn:unknown"/>', EncodingFormat.XML)
+
+
+class SanityBundleLookup(unittest.TestCase):
+
+    def test_iter_bundles(self):
+        bundles = dict(_iter_bundles())
+        self.assertIn('openconfig', bundles)
+        self.assertTrue(os.path.isdir(os.path.join(bundles['openconfig'], '_yang')))
+
+    def test_read_yang_ns(self):
+        state = _read_yang_ns('openconfig')
+        self.assertEqual(state['capabilities']['openconfig-bgp'], '2017-02-02')
+        self.assertEqual(state['namespace_lookup']['openconfig-bgp'], _BGP_NS)
+        self.assertEqual(state['entity_lookup'][(_BGP_NS, 'bgp')], 'openconfig_bgp.Bgp')
+
+    def test_read_yang_ns_not_installed(self):
+        self.assertIsNone(_read_yang_ns('no_such_bundle'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_entity_metadata.py
+Tests for schema metadata shared between instances of an entity class.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.types import YList, enable_lazy_children
+from ydk.models.openconfig import openconfig_bgp
+
+
+class CustomConfig(openconfig_bgp.Bgp.Global.Config):
+
+    def __init__(self):
+        super(CustomConfig, self).__init__()
+        self.as_ = 65001
+
+
+class SanityEntityMetadata(unittest.TestCase):
+
+    def test_metadata_shared(self):
+        first = openconfig_bgp.Bgp.Global.Config()
+        second = openconfig_bgp.Bgp.Global.Config()
+        self.assertIs(first._metadata, second._metadata)
+        self.assertIs(first._leafs, second._leafs)
+        self.assertIs(first._child_classes, second._child_classes)
+        self.assertNotIn('_leafs', first.__dict__)
+        self.assertNotIn('_child_classes', first.__dict__)
+
+    def test_metadata_per_class(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        state = openconfig_bgp.Bgp.Global.State()
+        self.assertIsNot(config._metadata, state._metadata)
+        self.assertNotIn('total_paths', config._leafs)
+        self.assertIn('total_paths', state._leafs)
+
+    def test_leaf_values_per_instance(self):
+        first = openconfig_bgp.Bgp.Global.Config()
+        second = openconfig_bgp.Bgp.Global.Config()
+        first.as_ = 65001
+        second.as_ = 65002
+        second.router_id = '10.0.0.2'
+        self.assertEqual(first.as_, 65001)
+        self.assertIsNone(first.router_id)
+        self.assertEqual([(name, data.value) for name, data in first.get_name_leaf_data()],
+                         [('as', '65001')])
+        self.assertEqual([(name, data.value) for name, data in second.get_name_leaf_data()],
+                         [('as', '65002'), ('router-id', '10.0.0.2')])
+
+    def test_children_name_map(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertEqual(bgp._children_name_map['global_'], 'global')
+        self.assertIs(bgp._children_name_map, openconfig_bgp.Bgp()._children_name_map)
+
+    def test_paths(self):
+        bgp = openconfig_bgp.Bgp()
+        neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+        neighbor.neighbor_address = '10.0.0.1'
+        bgp.neighbors.neighbor.append(neighbor)
+        other = openconfig_bgp.Bgp.Neighbors.Neighbor()
+        other.neighbor_address = '10.0.0.2'
+        self.assertEqual(neighbor.get_segment_path(), "neighbor[neighbor-address='10.0.0.1']")
+        self.assertEqual(other.get_segment_path(), "neighbor[neighbor-address='10.0.0.2']")
+        self.assertEqual(bgp.global_.config.get_absolute_path(), 'openconfig-bgp:bgp/global/config')
+        self.assertEqual(bgp.neighbors.get_absolute_path(), 'openconfig-bgp:bgp/neighbors')
+
+    def test_template_skips_constructor(self):
+        clazz = openconfig_bgp.Bgp.Neighbors.Neighbor
+        clazz()
+        self.assertTrue(clazz._metadata.template)
+        generated_init = clazz.__dict__['__init__']
+
+        def fail(self):
+            raise AssertionError('generated constructor called')
+        clazz.__init__ = fail
+        try:
+            neighbor = clazz()
+        finally:
+            clazz.__init__ = generated_init
+        self.assertEqual(neighbor.yang_name, 'neighbor')
+        self.assertEqual(neighbor.ylist_key_names, ['neighbor_address'])
+        self.assertIsNone(neighbor.neighbor_address)
+        self.assertIsInstance(neighbor.config, clazz.Config)
+        self.assertIs(neighbor.config.parent, neighbor)
+        self.assertIsNot(neighbor.config, clazz().config)
+
+    def test_template_state(self):
+        first = openconfig_bgp.Bgp()
+        second = openconfig_bgp.Bgp()
+        self.assertEqual(sorted(second.__dict__), sorted(first.__dict__))
+        self.assertIsInstance(second.neighbors.neighbor, YList)
+        self.assertIs(second.neighbors.neighbor.parent, second.neighbors)
+        self.assertTrue(second.is_top_level_class)
+        self.assertFalse(second.has_data())
+        second.neighbors.neighbor.append(openconfig_bgp.Bgp.Neighbors.Neighbor())
+        self.assertEqual(len(first.neighbors.neighbor), 0)
+
+    def test_template_lazy(self):
+        openconfig_bgp.Bgp()
+        enable_lazy_children()
+        try:
+            bgp = openconfig_bgp.Bgp()
+        finally:
+            enable_lazy_children(False)
+        self.assertNotIn('global_', bgp.__dict__)
+        self.assertIs(bgp.global_.parent, bgp)
+        self.assertIn('global_', bgp.__dict__)
+
+    def test_subclass_constructor(self):
+        openconfig_bgp.Bgp.Global.Config()
+        self.assertEqual(CustomConfig().as_, 65001)
+
+
+if __name__ == '__main__':
+    unittest.main()
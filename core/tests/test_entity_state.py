@@ -0,0 +1,131 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_entity_state.py
+Tests for cached has_data and has_operation state of entities.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.filters import YFilter
+from ydk.models.openconfig import openconfig_bgp
+
+
+def _neighbor(address):
+    neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+    neighbor.neighbor_address = address
+    return neighbor
+
+
+class SanityEntityState(unittest.TestCase):
+
+    def test_leaf_marks_ancestors(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertFalse(bgp.has_data())
+        self.assertFalse(bgp.has_operation())
+        bgp.global_.config.as_ = 65001
+        self.assertTrue(bgp.has_data())
+        self.assertTrue(bgp.global_.has_data())
+        self.assertTrue(bgp.has_operation())
+        self.assertFalse(bgp.neighbors.has_data())
+
+    def test_leaf_reset(self):
+        bgp = openconfig_bgp.Bgp()
+        bgp.global_.config.as_ = 65001
+        bgp.global_.config.router_id = '10.0.0.1'
+        self.assertTrue(bgp.has_data())
+        bgp.global_.config.as_ = None
+        self.assertTrue(bgp.has_data())
+        bgp.global_.config.router_id = None
+        self.assertFalse(bgp.has_data())
+        self.assertFalse(bgp.has_operation())
+
+    def test_leaf_list_in_place(self):
+        bgp = openconfig_bgp.Bgp()
+        config = bgp.global_.confederation.config
+        self.assertFalse(bgp.has_data())
+        config.member_as.append(65010)
+        self.assertTrue(bgp.has_data())
+        config.member_as.remove(65010)
+        self.assertFalse(bgp.has_data())
+        config.member_as = [65011, 65012]
+        self.assertTrue(bgp.has_data())
+        del config.member_as[:]
+        self.assertFalse(bgp.has_data())
+
+    def test_list_entries(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertFalse(bgp.has_data())
+        bgp.neighbors.neighbor.append(_neighbor('10.0.0.1'))
+        self.assertTrue(bgp.has_data())
+        bgp.neighbors.neighbor.pop('10.0.0.1')
+        self.assertFalse(bgp.has_data())
+        bgp.neighbors.neighbor.append(_neighbor('10.0.0.2'))
+        self.assertTrue(bgp.has_data())
+        bgp.neighbors.neighbor.clear()
+        self.assertFalse(bgp.has_data())
+
+    def test_entry_changed_after_append(self):
+        bgp = openconfig_bgp.Bgp()
+        neighbor = openconfig_bgp.Bgp.Neighbors.Neighbor()
+        bgp.neighbors.neighbor.append(neighbor)
+        self.assertFalse(bgp.has_data())
+        neighbor.config.peer_as = 65002
+        self.assertTrue(bgp.has_data())
+
+    def test_yfilter(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertFalse(bgp.has_operation())
+        bgp.global_.yfilter = YFilter.delete
+        self.assertTrue(bgp.has_operation())
+        self.assertFalse(bgp.has_data())
+        bgp.global_.yfilter = YFilter.not_set
+        self.assertFalse(bgp.has_operation())
+
+    def test_leaf_yfilter(self):
+        bgp = openconfig_bgp.Bgp()
+        bgp.global_.config.as_ = YFilter.read
+        self.assertTrue(bgp.has_data())
+        self.assertTrue(bgp.has_operation())
+
+    def test_child_replaced(self):
+        bgp = openconfig_bgp.Bgp()
+        bgp.global_.config.as_ = 65001
+        self.assertTrue(bgp.has_data())
+        bgp.global_ = openconfig_bgp.Bgp.Global()
+        self.assertFalse(bgp.has_data())
+        self.assertIs(bgp.global_.parent, bgp)
+
+    def test_state_in_slots(self):
+        bgp = openconfig_bgp.Bgp()
+        config = bgp.global_.config
+        self.assertIsNone(config._has_data)
+        self.assertIsNone(config._segment_path_cache)
+        config.as_ = YFilter.read
+        self.assertFalse(bgp.neighbors.has_operation())
+        bgp.get_children()
+        config.get_segment_path()
+        self.assertTrue(config._has_data)
+        self.assertFalse(bgp.neighbors._has_operation)
+        for entity in (bgp, bgp.neighbors, config):
+            for name in ('_has_data', '_has_operation', '_children_cache',
+                         '_segment_path_cache', '_filtered_leaf_values'):
+                self.assertNotIn(name, entity.__dict__)
+
+
+if __name__ == '__main__':
+    unittest.main()
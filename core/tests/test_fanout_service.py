@@ -0,0 +1,180 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_fanout_service.py
+Tests for running operations on several devices with FanoutService.
+"""
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.ext.services import Datastore
+from ydk.providers import NetconfProviderPool
+from ydk.services import CRUDService, FanoutService
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+from test_netconf_server import _INTERFACE, _OC_IF
+from test_netconf_transaction import _Netconf
+
+
+class _Store(object):
+    """Schema store creating fake providers, as dicts of their parameters."""
+
+    def provider(self, **params):
+        return dict(params)
+
+
+class SanityFanout(unittest.TestCase):
+
+    def test_results_in_order(self):
+        fanout = FanoutService(max_workers=4)
+        results = fanout.run(['a', 'b', 'c'], lambda provider, suffix: provider + suffix, '!')
+        self.assertEqual([r.device for r in results], ['a', 'b', 'c'])
+        self.assertEqual([r.result for r in results], ['a!', 'b!', 'c!'])
+        self.assertTrue(all(r.ok and r.elapsed >= 0 for r in results))
+
+    def test_errors_per_device(self):
+        def operation(provider):
+            if provider == 'bad':
+                raise ValueError(provider)
+            return provider
+
+        results = FanoutService().run(['good', 'bad'], operation)
+        self.assertTrue(results[0].ok)
+        self.assertFalse(results[1].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertIsNone(results[1].result)
+
+    def test_bounded_concurrency(self):
+        state = {'running': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def operation(provider):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.02)
+            with lock:
+                state['running'] -= 1
+
+        FanoutService(max_workers=3).run(range(12), operation)
+        self.assertEqual(state['max'], 3)
+
+    def test_connection_parameters(self):
+        pool = NetconfProviderPool(schema_store=_Store())
+        devices = [{'address': '10.0.0.%d' % i, 'username': 'admin'} for i in range(3)]
+        results = FanoutService(pool=pool).run(devices, lambda provider: provider['address'])
+        self.assertEqual([r.device for r in results], ['10.0.0.0', '10.0.0.1', '10.0.0.2'])
+        self.assertEqual([r.result for r in results], ['10.0.0.0', '10.0.0.1', '10.0.0.2'])
+
+    def test_unknown_operation(self):
+        fanout = FanoutService()
+        with self.assertRaises(YServiceError):
+            fanout.run(['a'], 'reboot')
+        with self.assertRaises(YServiceError):
+            fanout.run(['a'], '_run')
+
+
+class SanityFanoutEditConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.servers = [NetconfServer('openconfig').start() for _ in range(2)]
+        for server in self.servers:
+            self.addCleanup(server.stop)
+        self.ports = [server.port for server in self.servers]
+        self.fanout = FanoutService()
+        self.fanout._netconf = self.netconf = _Netconf()
+        self.observer = _Netconf()
+        self.addCleanup(self.netconf.close)
+        self.addCleanup(self.observer.close)
+
+    def test_edit_config(self):
+        results = self.fanout.edit_config(self.ports, _INTERFACE.format(_OC_IF, 'eth0', 1500))
+        self.assertTrue(all(r.ok and r.result for r in results), results)
+        for port in self.ports:
+            self.assertEqual(self.observer.get_config(port, Datastore.running), {'eth0': '1500'})
+        self.assertEqual(sorted(set(self.netconf.operations)),
+                         ['commit', 'edit-config', 'lock', 'unlock'])
+        self.assertEqual(self.netconf.operations.count('lock'), 4)
+
+    def test_other_session_changes(self):
+        config = _INTERFACE.format(_OC_IF, 'eth1', 9000)
+        self.observer.edit_config(self.ports[0], Datastore.candidate, config)
+        results = self.fanout.edit_config(self.ports, _INTERFACE.format(_OC_IF, 'eth0', 1500))
+        self.assertFalse(results[0].ok)
+        self.assertTrue(results[1].ok)
+        self.assertNotIn('discard-changes', self.netconf.operations)
+        # the pending changes of the other session are neither committed nor discarded
+        self.assertEqual(self.observer.get_config(self.ports[0], Datastore.candidate), {'eth1': '9000'})
+        self.assertEqual(self.observer.get_config(self.ports[0], Datastore.running), {})
+
+    def test_commit_failure(self):
+        commit = self.netconf.commit
+
+        def fail_commit(provider, *args):
+            if provider == self.ports[0]:
+                raise YServiceError('operation-failed')
+            return commit(provider, *args)
+
+        self.netconf.commit = fail_commit
+        results = self.fanout.edit_config(self.ports, _INTERFACE.format(_OC_IF, 'eth0', 1500))
+        self.assertFalse(results[0].ok)
+        self.assertTrue(results[1].ok)
+        self.assertIn('discard-changes', self.netconf.operations)
+        self.assertEqual(self.observer.get_config(self.ports[0], Datastore.candidate), {})
+        self.assertEqual(self.observer.get_config(self.ports[0], Datastore.running), {})
+        self.assertEqual(self.observer.get_config(self.ports[1], Datastore.running), {'eth0': '1500'})
+
+    def test_no_commit(self):
+        results = self.fanout.edit_config(self.ports, _INTERFACE.format(_OC_IF, 'eth0', 1500), commit=False)
+        self.assertTrue(all(r.ok for r in results), results)
+        self.assertEqual(self.netconf.operations, ['edit-config', 'edit-config'])
+        self.assertEqual(self.observer.get_config(self.ports[0], Datastore.candidate), {'eth0': '1500'})
+
+
+class SanityFanoutServer(unittest.TestCase):
+
+    def test_create_on_devices(self):
+        servers = [NetconfServer('openconfig').start() for _ in range(3)]
+        try:
+            devices = [{'address': '127.0.0.1', 'username': 'admin', 'password': 'admin',
+                        'port': server.port, 'protocol': 'tcp'} for server in servers]
+            interfaces = openconfig_interfaces.Interfaces()
+            interface = openconfig_interfaces.Interfaces.Interface()
+            interface.name = 'eth0'
+            interface.config.name = 'eth0'
+            interfaces.interface.append(interface)
+
+            fanout = FanoutService(max_workers=3)
+            results = fanout.create(devices, interfaces)
+            self.assertTrue(all(r.ok for r in results), results)
+
+            results = fanout.read_config(devices, openconfig_interfaces.Interfaces())
+            for result in results:
+                self.assertTrue(result.ok, result)
+                self.assertEqual([entry.name for entry in result.result.interface], ['eth0'])
+        finally:
+            for server in servers:
+                server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
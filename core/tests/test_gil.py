@@ -0,0 +1,127 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_gil.py
+Tests for bindings releasing the GIL, run from several threads against a
+local NETCONF server.
+"""
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+from ydk.path import NetconfSession
+from ydk.providers import NetconfServiceProvider
+from ydk.services import CRUDService
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+_LATENCY = 0.2
+
+
+def _interfaces(name, mtu):
+    interfaces = openconfig_interfaces.Interfaces()
+    interface = openconfig_interfaces.Interfaces.Interface()
+    interface.name = name
+    interface.config.name = name
+    interface.config.mtu = mtu
+    interfaces.interface.append(interface)
+    return interfaces
+
+
+class SanityGil(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = NetconfServer('openconfig', latency=_LATENCY).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _provider(self):
+        return NetconfServiceProvider(address='127.0.0.1', username='admin', password='admin',
+                                      port=self.server.port, protocol='tcp')
+
+    def test_invoke_releases_gil(self):
+        session = NetconfSession('127.0.0.1', 'admin', 'admin', port=self.server.port, protocol='tcp')
+        rpc = session.get_root_schema().create_rpc('ietf-netconf:get-config')
+        rpc.get_input_node().create_datanode('source/running')
+        done = threading.Event()
+        thread = threading.Thread(target=lambda: (session.invoke(rpc), done.set()))
+        thread.start()
+        # this thread keeps running Python code while the reply is awaited
+        longest, last = 0.0, time.time()
+        while not done.is_set():
+            now = time.time()
+            longest, last = max(longest, now - last), now
+        thread.join()
+        self.assertLess(longest, _LATENCY / 2)
+
+    def test_read_from_threads(self):
+        providers = [self._provider() for _ in range(4)]
+        crud = CRUDService()
+        errors = []
+
+        def run(provider):
+            try:
+                crud.read(provider, openconfig_interfaces.Interfaces())
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=run, args=(provider,)) for provider in providers]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - start
+        self.assertEqual(errors, [])
+        # the reads wait for the device at the same time, not one after another
+        self.assertLess(elapsed, 2 * _LATENCY)
+
+    def test_entities_from_threads(self):
+        errors = []
+        results = {}
+
+        def run(i):
+            try:
+                provider = self._provider()
+                crud = CRUDService()
+                name = 'eth%d' % i
+                crud.create(provider, _interfaces(name, 1500 + i))
+                read = crud.read_config(provider, openconfig_interfaces.Interfaces())
+                results[i] = [entry.config.mtu for entry in read.interface if entry.name == name][0]
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        # entities are built and dropped here while the threads run
+        while any(thread.is_alive() for thread in threads):
+            _interfaces('lo0', 1500).interface[0].config.mtu = 9000
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(dict((i, int(mtu)) for i, mtu in results.items()),
+                         dict((i, 1500 + i) for i in range(4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_lazy_children.py
+Tests for lazy instantiation of child containers.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.types import enable_lazy_children
+from ydk.types.py_types import _lazy_children
+from ydk.models.openconfig import openconfig_bgp
+
+
+class CustomGlobal(openconfig_bgp.Bgp.Global):
+    """User defined subclass building a child in its own constructor."""
+
+    def __init__(self):
+        super(CustomGlobal, self).__init__()
+        self.config = openconfig_bgp.Bgp.Global.Config()
+        self.config.as_ = 65001
+
+
+class CustomBgp(openconfig_bgp.Bgp):
+
+    def __init__(self):
+        super(CustomBgp, self).__init__()
+        self.global_ = CustomGlobal()
+        self.global_.config.router_id = '10.0.0.1'
+
+
+class SanityLazyChildren(unittest.TestCase):
+
+    def tearDown(self):
+        enable_lazy_children(False)
+
+    def test_eager(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertIn('global_', bgp.__dict__)
+        self.assertIs(bgp.global_.parent, bgp)
+        self.assertIn('config', bgp.global_.__dict__)
+        self.assertFalse(bgp.has_data())
+
+    def test_lazy(self):
+        enable_lazy_children()
+        bgp = openconfig_bgp.Bgp()
+        self.assertNotIn('global_', bgp.__dict__)
+        self.assertFalse(bgp.has_data())
+        self.assertEqual(len(bgp.get_children()), 0)
+
+        bgp.global_.config.as_ = 65001
+        self.assertIsInstance(bgp.global_, openconfig_bgp.Bgp.Global)
+        self.assertIs(bgp.global_.parent, bgp)
+        self.assertIs(bgp.global_.config.parent, bgp.global_)
+        self.assertNotIn('graceful_restart', bgp.global_.__dict__)
+        self.assertTrue(bgp.has_data())
+        self.assertIn('global_', bgp.get_order_of_children())
+
+    def test_lazy_in_context(self):
+        with _lazy_children():
+            bgp = openconfig_bgp.Bgp()
+        self.assertNotIn('global_', bgp.__dict__)
+        self.assertIs(bgp.global_.parent, bgp)
+        self.assertIn('config', openconfig_bgp.Bgp().global_.__dict__)
+
+    def test_lazy_child_by_name(self):
+        enable_lazy_children()
+        bgp = openconfig_bgp.Bgp()
+        child = bgp.get_child_by_name('global', 'global')
+        self.assertIs(child, bgp.global_)
+        self.assertIs(child.parent, bgp)
+
+    def test_user_subclass_eager(self):
+        bgp = CustomBgp()
+        self.assertEqual(bgp.global_.config.as_, 65001)
+        self.assertEqual(bgp.global_.config.router_id, '10.0.0.1')
+
+    def test_user_subclass_lazy(self):
+        enable_lazy_children()
+        bgp = CustomBgp()
+        self.assertIsInstance(bgp.global_, CustomGlobal)
+        self.assertIsInstance(bgp.global_.config, openconfig_bgp.Bgp.Global.Config)
+        self.assertEqual(bgp.global_.config.as_, 65001)
+        self.assertEqual(bgp.global_.config.router_id, '10.0.0.1')
+        self.assertIs(bgp.global_.config.parent, bgp.global_)
+        self.assertTrue(bgp.has_data())
+
+    def test_user_subclass_standalone_lazy(self):
+        enable_lazy_children()
+        global_ = CustomGlobal()
+        self.assertEqual(global_.config.as_, 65001)
+        self.assertTrue(global_.has_data())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_leaf_setters.py
+Tests for validation of values assigned to leafs.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.errors import YModelError
+from ydk.models.openconfig import openconfig_bgp
+
+
+class SanityLeafSetters(unittest.TestCase):
+
+    def test_integer_range(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = 2 ** 32 - 1
+        self.assertEqual(config.as_, 2 ** 32 - 1)
+        for value in (2 ** 32, -1, 2 ** 70):
+            with self.assertRaises(YModelError) as context:
+                config.as_ = value
+            self.assertIn("'as'", str(context.exception))
+        self.assertEqual(config.as_, 2 ** 32 - 1)
+
+    def test_narrow_integer_range(self):
+        distance = openconfig_bgp.Bgp.Global.DefaultRouteDistance.Config()
+        distance.external_route_distance = 255
+        with self.assertRaises(YModelError):
+            distance.external_route_distance = 256
+
+    def test_invalid_type(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        with self.assertRaises(YModelError) as context:
+            config.router_id = {'address': '10.0.0.1'}
+        self.assertIn("'router-id'", str(context.exception))
+        self.assertIsNone(config.router_id)
+        with self.assertRaises(YModelError):
+            config.router_id = 2 ** 64
+
+    def test_string_value(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = '65001'
+        config.router_id = '10.0.0.1'
+        self.assertEqual([data.value for _, data in config.get_name_leaf_data()],
+                         ['65001', '10.0.0.1'])
+
+    def test_encode_after_assignment(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = 65001
+        self.assertEqual(len(config.get_name_leaf_data()), 1)
+        self.assertEqual(len(openconfig_bgp.Bgp.Global.Config().get_name_leaf_data()), 0)
+        self.assertFalse(config._leafs['as_'].is_set)
+
+
+if __name__ == '__main__':
+    unittest.main()
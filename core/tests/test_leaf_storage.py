@@ -0,0 +1,126 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_leaf_storage.py
+Tests for leaf values of entities walked through class metadata.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.filters import YFilter
+from ydk.types import enable_compact_storage
+from ydk.types.py_types import _encoding_copy
+from ydk.models.openconfig import openconfig_bgp, openconfig_telemetry
+
+
+class SanityLeafStorage(unittest.TestCase):
+
+    def test_values_in_instance(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        self.assertIsNone(config.as_)
+        config.as_ = 65001
+        self.assertEqual(config.as_, 65001)
+        self.assertEqual(config.__dict__['as_'], 65001)
+
+    def test_leaf_data_in_schema_order(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.router_id = '10.0.0.1'
+        config.as_ = 65001
+        self.assertEqual([name for name, _ in config.get_name_leaf_data()], ['as', 'router-id'])
+
+    def test_has_data(self):
+        bgp = openconfig_bgp.Bgp()
+        self.assertFalse(bgp.has_data())
+        bgp.global_.config.as_ = 65001
+        self.assertTrue(bgp.global_.config.has_data())
+        self.assertTrue(bgp.has_data())
+        bgp.global_.config.as_ = None
+        self.assertFalse(bgp.has_data())
+
+    def test_leaf_filter(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = 65001
+        config.as_ = YFilter.delete
+        self.assertTrue(config.has_operation())
+        name, data = config.get_name_leaf_data()[0]
+        self.assertEqual(name, 'as')
+        self.assertEqual(data.value, '65001')
+
+    def test_set_value(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.set_value('router-id', '10.0.0.1')
+        self.assertEqual(config.router_id, '10.0.0.1')
+        self.assertTrue(config.has_data())
+
+
+class SanityCompactStorage(SanityLeafStorage):
+
+    def setUp(self):
+        enable_compact_storage()
+
+    def tearDown(self):
+        enable_compact_storage(False)
+
+    def test_values_in_instance(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = 65001
+        self.assertEqual(config.as_, 65001)
+        self.assertEqual(config._values[config._metadata.leaf_index['as_']], 65001)
+        self.assertNotIn('as_', config.__dict__)
+
+    def test_no_instance_dictionary(self):
+        openconfig_bgp.Bgp.Global.Config()
+        config = openconfig_bgp.Bgp.Global.Config()
+        self.assertIsNone(config.router_id)
+        self.assertEqual(config.__dict__, {})
+
+    def test_defaults_shared(self):
+        first = openconfig_bgp.Bgp.Global.Config()
+        second = openconfig_bgp.Bgp.Global.Config()
+        self.assertIs(first._values, second._values)
+        first.as_ = 65001
+        self.assertIsNot(first._values, second._values)
+        self.assertIsNone(second.as_)
+
+    def test_leaf_named_as_method(self):
+        config = openconfig_telemetry.TelemetrySystem.SensorGroups.SensorGroup \
+            .SensorPaths.SensorPath.Config()
+        self.assertIsNone(config.path)
+        config.path = '/interfaces'
+        self.assertEqual(config.path, '/interfaces')
+
+    def test_copy(self):
+        config = openconfig_bgp.Bgp.Global.Config()
+        config.as_ = 65001
+        copy = _encoding_copy(config)
+        copy.router_id = '10.0.0.1'
+        self.assertEqual(copy.as_, 65001)
+        self.assertIsNone(config.router_id)
+
+    def test_mixed_storage(self):
+        enable_compact_storage(False)
+        default = openconfig_bgp.Bgp.Global.Config()
+        enable_compact_storage()
+        compact = openconfig_bgp.Bgp.Global.Config()
+        default.as_ = 65001
+        compact.as_ = 65002
+        self.assertEqual((default.as_, compact.as_), (65001, 65002))
+        self.assertIsNone(default._values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_netconf_pipeline.py
+Tests for NETCONF sessions with several requests in flight, against a
+local NETCONF server.
+"""
+from __future__ import absolute_import
+
+import concurrent.futures
+import time
+import unittest
+
+from ydk.errors import YClientError, YServiceError
+from ydk.services import NetconfPipeline
+from ydk.services import netconf_pipeline
+from ydk.testing import NetconfServer
+
+_GET_CONFIG = '<get-config><source><running/></source></get-config>'
+
+
+class _SSHClient(object):
+
+    def __init__(self):
+        self.policy = None
+        self.system_host_keys = False
+
+    def load_system_host_keys(self):
+        self.system_host_keys = True
+
+    def set_missing_host_key_policy(self, policy):
+        self.policy = policy
+
+    def connect(self, *args, **kwargs):
+        pass
+
+    def get_transport(self):
+        return self
+
+    def open_session(self):
+        return self
+
+    def invoke_subsystem(self, name):
+        pass
+
+
+class _Paramiko(object):
+    """Stand-in for the paramiko module."""
+
+    class AutoAddPolicy(object):
+        pass
+
+    class RejectPolicy(object):
+        pass
+
+    def __init__(self):
+        self.clients = []
+
+    def SSHClient(self):
+        client = _SSHClient()
+        self.clients.append(client)
+        return client
+
+
+class SanityPipelineHostKeys(unittest.TestCase):
+
+    def setUp(self):
+        self.paramiko = _Paramiko()
+        saved = netconf_pipeline.paramiko
+        netconf_pipeline.paramiko = self.paramiko
+        self.addCleanup(setattr, netconf_pipeline, 'paramiko', saved)
+        self.pipeline = NetconfPipeline.__new__(NetconfPipeline)
+
+    def _connect(self, accept_unknown_host_keys):
+        self.pipeline._connect('10.0.0.1', 830, 'admin', 'admin', 'ssh', None, None,
+                               accept_unknown_host_keys)
+        return self.paramiko.clients[-1]
+
+    def test_reject_unknown(self):
+        client = self._connect(False)
+        self.assertTrue(client.system_host_keys)
+        self.assertIsInstance(client.policy, _Paramiko.RejectPolicy)
+
+    def test_accept_unknown(self):
+        client = self._connect(True)
+        self.assertTrue(client.system_host_keys)
+        self.assertIsInstance(client.policy, _Paramiko.AutoAddPolicy)
+
+
+class SanityPipeline(unittest.TestCase):
+
+    def _pipeline(self, latency=0.0, **kwargs):
+        server = NetconfServer('openconfig', latency=latency).start()
+        self.addCleanup(server.stop)
+        pipeline = NetconfPipeline('127.0.0.1', 'admin', 'admin', port=server.port,
+                                   protocol='tcp', **kwargs)
+        self.addCleanup(pipeline.close, 1)
+        return pipeline
+
+    def test_in_flight(self):
+        pipeline = self._pipeline(latency=0.2)
+        start = time.time()
+        futures = [pipeline.submit(_GET_CONFIG) for _ in range(8)]
+        for future in futures:
+            self.assertEqual(future.result(5).tag, '{urn:ietf:params:xml:ns:netconf:base:1.0}rpc-reply')
+        self.assertLess(time.time() - start, 0.2 * 4)
+
+    def test_rpc_error(self):
+        pipeline = self._pipeline()
+        with self.assertRaises(YServiceError):
+            pipeline.submit('<reboot/>').result(5)
+
+    def test_close(self):
+        pipeline = self._pipeline()
+        pipeline.close()
+        with self.assertRaises(YClientError):
+            pipeline.submit(_GET_CONFIG)
+
+    def test_close_timeout(self):
+        pipeline = self._pipeline(latency={'get-config': 30, 'close-session': 30}, max_in_flight=1)
+        future = pipeline.submit(_GET_CONFIG)
+        start = time.time()
+        pipeline.close(timeout=0.2)
+        self.assertLess(time.time() - start, 5)
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(concurrent.futures.CancelledError):
+            future.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
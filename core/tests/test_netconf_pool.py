@@ -0,0 +1,226 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_netconf_pool.py
+Tests for reuse of providers with NetconfProviderPool.
+"""
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+from ydk.errors import YClientError, YServiceProviderError
+from ydk.providers import NetconfProviderPool
+from ydk.services import CRUDService
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+
+class _Provider(object):
+
+    def __init__(self, params):
+        self.params = params
+        self.healthy = True
+        self.closed = False
+
+
+class _Store(object):
+    """Schema store creating fake providers."""
+
+    def __init__(self):
+        self.created = []
+
+    def provider(self, **params):
+        provider = _Provider(params)
+        self.created.append(provider)
+        return provider
+
+
+def _keepalive(provider):
+    if not provider.healthy:
+        raise YClientError('session closed')
+
+
+def _close_session(provider):
+    provider.closed = True
+    if not provider.healthy:
+        raise YClientError('session closed')
+
+
+class SanityProviderPool(unittest.TestCase):
+
+    def _pool(self, **kwargs):
+        self.store = _Store()
+        kwargs.setdefault('keepalive', _keepalive)
+        kwargs.setdefault('close_session', _close_session)
+        return NetconfProviderPool(schema_store=self.store, **kwargs)
+
+    def test_reuse(self):
+        pool = self._pool()
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        second = pool.acquire('10.0.0.1', 'admin', 'admin')
+        self.assertIs(second, first)
+        self.assertEqual(len(self.store.created), 1)
+        self.assertEqual(first.params, {'address': '10.0.0.1', 'username': 'admin',
+                                        'password': 'admin', 'port': 830})
+
+    def test_keys(self):
+        pool = self._pool()
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        self.assertIsNot(pool.acquire('10.0.0.2', 'admin', 'admin'), first)
+        self.assertIsNot(pool.acquire('10.0.0.1', 'oper', 'admin'), first)
+        self.assertIsNot(pool.acquire('10.0.0.1', 'admin', 'admin', protocol='tcp'), first)
+
+    def test_max_size(self):
+        pool = self._pool(max_size=1)
+        provider = pool.acquire('10.0.0.1', 'admin', 'admin')
+        with self.assertRaises(YServiceProviderError):
+            pool.acquire('10.0.0.1', 'admin', 'admin', wait_timeout=0.05)
+        timer = threading.Timer(0.05, pool.release, (provider,))
+        timer.start()
+        self.assertIs(pool.acquire('10.0.0.1', 'admin', 'admin', wait_timeout=5), provider)
+        timer.join()
+
+    def test_keepalive(self):
+        pool = self._pool(keepalive_interval=0)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        first.healthy = False
+        second = pool.acquire('10.0.0.1', 'admin', 'admin')
+        self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+        self.assertEqual(list(pool._sizes.values()), [1])
+
+    def test_max_idle(self):
+        pool = self._pool(max_idle=0)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        self.assertIsNot(pool.acquire('10.0.0.1', 'admin', 'admin'), first)
+        self.assertTrue(first.closed)
+
+    def test_expire_other_devices(self):
+        pool = self._pool(max_idle=0.05)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        time.sleep(0.1)
+        # expiry is not limited to the device being acquired or released
+        second = pool.acquire('10.0.0.2', 'admin', 'admin')
+        self.assertTrue(first.closed)
+        self.assertEqual(list(pool._sizes.values()), [1])
+        pool.release(second)
+        self.assertFalse(second.closed)
+        time.sleep(0.1)
+        pool.expire()
+        self.assertTrue(second.closed)
+        self.assertEqual(pool._sizes, {})
+        self.assertEqual(pool._idle, {})
+
+    def test_idle_lifetime(self):
+        pool = self._pool(max_lifetime=0.1)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        pool.expire()
+        self.assertFalse(first.closed)
+        time.sleep(0.15)
+        pool.expire()
+        self.assertTrue(first.closed)
+
+    def test_expiry_after_reuse(self):
+        pool = self._pool(max_idle=0.1)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        time.sleep(0.06)
+        self.assertIs(pool.acquire('10.0.0.1', 'admin', 'admin'), first)
+        pool.release(first)
+        time.sleep(0.06)
+        # idle for less than max_idle since it was last released
+        pool.expire()
+        self.assertFalse(first.closed)
+
+    def test_close_errors_ignored(self):
+        pool = self._pool()
+        provider = pool.acquire('10.0.0.1', 'admin', 'admin')
+        provider.healthy = False
+        pool.release(provider, discard=True)
+        self.assertTrue(provider.closed)
+        self.assertEqual(pool._sizes, {})
+
+    def test_max_lifetime(self):
+        pool = self._pool(max_lifetime=0)
+        first = pool.acquire('10.0.0.1', 'admin', 'admin')
+        pool.release(first)
+        self.assertEqual(pool._idle, {})
+        self.assertTrue(first.closed)
+        self.assertIsNot(pool.acquire('10.0.0.1', 'admin', 'admin'), first)
+
+    def test_context_discards_on_error(self):
+        pool = self._pool()
+        with self.assertRaises(YClientError):
+            with pool.provider('10.0.0.1', 'admin', 'admin') as provider:
+                raise YClientError('connection reset')
+        self.assertIsNot(pool.acquire('10.0.0.1', 'admin', 'admin'), provider)
+
+    def test_context_keeps_on_other_error(self):
+        pool = self._pool()
+        with self.assertRaises(ValueError):
+            with pool.provider('10.0.0.1', 'admin', 'admin') as provider:
+                raise ValueError()
+        self.assertIs(pool.acquire('10.0.0.1', 'admin', 'admin'), provider)
+
+    def test_release_unknown(self):
+        pool = self._pool()
+        with self.assertRaises(YServiceProviderError):
+            pool.release(_Provider({}))
+
+    def test_close(self):
+        pool = self._pool()
+        provider = pool.acquire('10.0.0.1', 'admin', 'admin')
+        idle = pool.acquire('10.0.0.2', 'admin', 'admin')
+        pool.release(idle)
+        pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(provider.closed)
+        pool.release(provider)
+        self.assertTrue(provider.closed)
+        self.assertEqual(pool._sizes, {})
+        with self.assertRaises(YServiceProviderError):
+            pool.acquire('10.0.0.1', 'admin', 'admin')
+
+    def test_size(self):
+        with self.assertRaises(YServiceProviderError):
+            NetconfProviderPool(max_size=0)
+
+
+class SanityProviderPoolServer(unittest.TestCase):
+
+    def test_reuse_session(self):
+        pool = NetconfProviderPool()
+        crud = CRUDService()
+        with NetconfServer('openconfig') as server:
+            with pool.provider('127.0.0.1', 'admin', 'admin', port=server.port, protocol='tcp') as first:
+                crud.read_config(first, openconfig_interfaces.Interfaces())
+            with pool.provider('127.0.0.1', 'admin', 'admin', port=server.port, protocol='tcp') as second:
+                crud.read_config(second, openconfig_interfaces.Interfaces())
+            self.assertIs(second, first)
+            pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
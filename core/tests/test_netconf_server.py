@@ -0,0 +1,277 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_netconf_server.py
+Tests for the local NETCONF server, driven by a raw socket client.
+"""
+from __future__ import absolute_import
+
+import socket
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+from ydk.testing import NetconfServer
+
+_NC = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_OC_IF = 'http://openconfig.net/yang/interfaces'
+_EOM = b']]>]]>'
+_NAMESPACES = {'nc': _NC, 'oc': _OC_IF}
+
+_INTERFACE = ('<interfaces xmlns="{0}"><interface><name>{1}</name>'
+              '<config><name>{1}</name><mtu>{2}</mtu></config></interface></interfaces>')
+
+
+def _nc(tag):
+    return '{%s}%s' % (_NC, tag)
+
+
+class _Client(object):
+    """NETCONF client over TCP, with end-of-message or chunked framing."""
+
+    def __init__(self, port, chunked=False):
+        self.sock = socket.create_connection(('127.0.0.1', port))
+        self.buffer = b''
+        self.chunked = False
+        self.message_id = 0
+        self.hello = ET.fromstring(self._receive())
+        version = '1.1' if chunked else '1.0'
+        self._send(('<hello xmlns="{}"><capabilities><capability>urn:ietf:params:netconf:base:{}'
+                    '</capability></capabilities></hello>').format(_NC, version).encode('utf-8'))
+        self.chunked = chunked
+
+    def rpc(self, operation):
+        self.message_id += 1
+        self._send('<rpc xmlns="{}" message-id="{}">{}</rpc>'.format(
+            _NC, self.message_id, operation).encode('utf-8'))
+        return ET.fromstring(self._receive())
+
+    def close(self):
+        self.sock.close()
+
+    def _send(self, message):
+        if self.chunked:
+            message = b'\n#' + str(len(message)).encode('ascii') + b'\n' + message + b'\n##\n'
+        else:
+            message += _EOM
+        self.sock.sendall(message)
+
+    def _read(self):
+        data = self.sock.recv(65536)
+        if not data:
+            raise socket.error('connection closed')
+        self.buffer += data
+
+    def _receive(self):
+        if not self.chunked:
+            while _EOM not in self.buffer:
+                self._read()
+            message, self.buffer = self.buffer.split(_EOM, 1)
+            return message
+        while not self.buffer.endswith(b'\n##\n'):
+            self._read()
+        message, self.buffer = self.buffer, b''
+        chunks = []
+        while message.startswith(b'\n#') and not message.startswith(b'\n##'):
+            header, message = message[2:].split(b'\n', 1)
+            size = int(header)
+            chunks.append(message[:size])
+            message = message[size:]
+        return b''.join(chunks)
+
+
+def _edit(target, config, operation=''):
+    return '<edit-config><target><{}/></target>{}<config>{}</config></edit-config>'.format(
+        target, operation, config)
+
+
+def _get_config(source):
+    return ('<get-config><source><{}/></source><filter type="subtree">'
+            '<interfaces xmlns="{}"/></filter></get-config>').format(source, _OC_IF)
+
+
+def _mtus(reply):
+    return dict((interface.findtext('oc:name', namespaces=_NAMESPACES),
+                 interface.findtext('oc:config/oc:mtu', namespaces=_NAMESPACES))
+                for interface in reply.iter('{%s}interface' % _OC_IF))
+
+
+def _error_tag(reply):
+    return reply.findtext('nc:rpc-error/nc:error-tag', namespaces=_NAMESPACES)
+
+
+class SanityNetconfServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = NetconfServer('openconfig').start()
+        self.addCleanup(self.server.stop)
+
+    def _client(self, chunked=False):
+        client = _Client(self.server.port, chunked)
+        self.addCleanup(client.close)
+        return client
+
+    def test_hello(self):
+        client = self._client()
+        capabilities = [c.text for c in client.hello.iter(_nc('capability'))]
+        self.assertIn('urn:ietf:params:netconf:capability:candidate:1.0', capabilities)
+        self.assertTrue(any('module=openconfig-interfaces' in c for c in capabilities))
+        self.assertEqual(client.hello.findtext(_nc('session-id')), '1')
+
+    def test_edit_running(self):
+        client = self._client()
+        reply = client.rpc(_edit('running', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertIsNotNone(reply.find(_nc('ok')))
+        self.assertEqual(reply.get('message-id'), '1')
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+        # list entries are merged by key
+        client.rpc(_edit('running', _INTERFACE.format(_OC_IF, 'eth0', 9000)))
+        client.rpc(_edit('running', _INTERFACE.format(_OC_IF, 'eth1', 1500)))
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '9000', 'eth1': '1500'})
+
+    def test_candidate(self):
+        client = self._client()
+        client.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {})
+        client.rpc('<commit/>')
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+        client.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth1', 1500)))
+        client.rpc('<discard-changes/>')
+        self.assertEqual(_mtus(client.rpc(_get_config('candidate'))), {'eth0': '1500'})
+
+    def test_delete_missing(self):
+        client = self._client()
+        config = _INTERFACE.format(_OC_IF, 'eth0', 1500).replace(
+            '<interface>', '<interface xmlns:nc="{}" nc:operation="delete">'.format(_NC))
+        self.assertEqual(_error_tag(client.rpc(_edit('running', config))), 'data-missing')
+
+    def test_lock(self):
+        first, second = self._client(), self._client()
+        self.assertIsNotNone(first.rpc('<lock><target><running/></target></lock>').find(_nc('ok')))
+        self.assertEqual(_error_tag(second.rpc('<lock><target><running/></target></lock>')), 'lock-denied')
+        reply = second.rpc(_edit('running', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertEqual(_error_tag(reply), 'in-use')
+        # locks are released when their session ends
+        first.rpc('<close-session/>')
+        first.close()
+        for _ in range(100):
+            reply = second.rpc('<lock><target><running/></target></lock>')
+            if _error_tag(reply) is None:
+                break
+            time.sleep(0.01)
+        self.assertIsNotNone(reply.find(_nc('ok')))
+
+    def test_discard_locked(self):
+        first, second = self._client(), self._client()
+        first.rpc('<lock><target><candidate/></target></lock>')
+        first.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertEqual(_error_tag(second.rpc('<discard-changes/>')), 'in-use')
+        self.assertEqual(_mtus(second.rpc(_get_config('candidate'))), {'eth0': '1500'})
+        self.assertIsNotNone(first.rpc('<discard-changes/>').find(_nc('ok')))
+        self.assertEqual(_mtus(second.rpc(_get_config('candidate'))), {})
+
+    def test_lock_modified_candidate(self):
+        first, second = self._client(), self._client()
+        first.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        for client in (first, second):
+            reply = client.rpc('<lock><target><candidate/></target></lock>')
+            self.assertEqual(_error_tag(reply), 'lock-denied')
+        # the running datastore can still be locked
+        self.assertIsNotNone(second.rpc('<lock><target><running/></target></lock>').find(_nc('ok')))
+        first.rpc('<discard-changes/>')
+        self.assertIsNotNone(second.rpc('<lock><target><candidate/></target></lock>').find(_nc('ok')))
+
+    def test_confirmed_commit(self):
+        client = self._client()
+        client.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertIsNotNone(client.rpc('<commit><confirmed/></commit>').find(_nc('ok')))
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+        # a commit on the same session confirms it
+        self.assertIsNotNone(client.rpc('<commit/>').find(_nc('ok')))
+        self.assertEqual(_error_tag(client.rpc('<cancel-commit/>')), 'operation-failed')
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+
+    def test_cancel_commit(self):
+        first, second = self._client(), self._client()
+        first.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        first.rpc('<commit><confirmed/></commit>')
+        self.assertEqual(_error_tag(second.rpc('<cancel-commit/>')), 'in-use')
+        self.assertEqual(_error_tag(second.rpc('<commit/>')), 'in-use')
+        self.assertIsNotNone(first.rpc('<cancel-commit/>').find(_nc('ok')))
+        self.assertEqual(_mtus(first.rpc(_get_config('running'))), {})
+        self.assertEqual(_mtus(first.rpc(_get_config('candidate'))), {})
+
+    def test_confirmed_commit_persist(self):
+        first, second = self._client(), self._client()
+        first.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        first.rpc('<commit><confirmed/><persist>tx1</persist></commit>')
+        first.close()
+        self.assertEqual(_error_tag(second.rpc('<commit/>')), 'invalid-value')
+        self.assertEqual(_error_tag(second.rpc('<commit><persist-id>tx2</persist-id></commit>')),
+                         'invalid-value')
+        self.assertIsNotNone(second.rpc('<commit><persist-id>tx1</persist-id></commit>').find(_nc('ok')))
+        self.assertEqual(_mtus(second.rpc(_get_config('running'))), {'eth0': '1500'})
+
+    def test_confirmed_commit_timeout(self):
+        client = self._client()
+        client.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        client.rpc('<commit><confirmed/><confirm-timeout>1</confirm-timeout></commit>')
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+        time.sleep(1.5)
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {})
+
+    def test_confirmed_commit_session_end(self):
+        first, second = self._client(), self._client()
+        first.rpc(_edit('candidate', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        first.rpc('<commit><confirmed/></commit>')
+        first.rpc('<close-session/>')
+        first.close()
+        for _ in range(100):
+            if not _mtus(second.rpc(_get_config('running'))):
+                break
+            time.sleep(0.01)
+        self.assertEqual(_mtus(second.rpc(_get_config('running'))), {})
+
+    def test_get_schema(self):
+        client = self._client()
+        reply = client.rpc('<get-schema xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring">'
+                           '<identifier>openconfig-interfaces</identifier></get-schema>')
+        self.assertIn('module openconfig-interfaces', ''.join(reply.itertext()))
+
+    def test_unsupported(self):
+        client = self._client()
+        self.assertEqual(_error_tag(client.rpc('<reboot/>')), 'operation-not-supported')
+
+    def test_chunked(self):
+        client = self._client(chunked=True)
+        client.rpc(_edit('running', _INTERFACE.format(_OC_IF, 'eth0', 1500)))
+        self.assertEqual(_mtus(client.rpc(_get_config('running'))), {'eth0': '1500'})
+        self.assertEqual(self.server.requests, 2)
+
+    def test_latency(self):
+        self.server.latency = {'get-config': 0.2, 'default': 0.0}
+        client = self._client()
+        start = time.time()
+        client.rpc('<discard-changes/>')
+        self.assertLess(time.time() - start, 0.2)
+        start = time.time()
+        client.rpc(_get_config('running'))
+        self.assertGreaterEqual(time.time() - start, 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
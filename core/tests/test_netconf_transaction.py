@@ -0,0 +1,224 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_netconf_transaction.py
+Tests for NetconfService.transaction, against a local NETCONF server.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.errors import YServiceError
+from ydk.ext.services import Datastore
+from ydk.services import NetconfService
+from ydk.testing import NetconfServer
+
+from test_netconf_server import _Client, _INTERFACE, _OC_IF, _error_tag, _get_config, _mtus
+
+
+class _Netconf(NetconfService):
+    """NetconfService sending operations to local servers as RPCs, with
+    providers given as server ports and entities as XML. Each instance
+    has one session per server."""
+
+    def __init__(self):
+        super(_Netconf, self).__init__()
+        self.clients = {}
+        self.operations = []
+        self._names = {Datastore.running: 'running', Datastore.candidate: 'candidate'}
+
+    def close(self):
+        for client in self.clients.values():
+            client.close()
+
+    def lock(self, provider, datastore):
+        return self._rpc(provider, 'lock', '<target><{}/></target>'.format(self._names[datastore]))
+
+    def unlock(self, provider, datastore):
+        return self._rpc(provider, 'unlock', '<target><{}/></target>'.format(self._names[datastore]))
+
+    def edit_config(self, provider, target, config, *options):
+        return self._rpc(provider, 'edit-config', '<target><{}/></target><config>{}</config>'.format(
+            self._names[target], config))
+
+    def validate(self, provider, source):
+        return self._rpc(provider, 'validate', '<source><{}/></source>'.format(self._names[source]))
+
+    def commit(self, provider, confirmed=False, confirm_timeout=None, persist=None, persist_id=None):
+        body = '<confirmed/>' if confirmed else ''
+        for tag, value in (('confirm-timeout', confirm_timeout), ('persist', persist), ('persist-id', persist_id)):
+            if value is not None:
+                body += '<{0}>{1}</{0}>'.format(tag, value)
+        return self._rpc(provider, 'commit', body)
+
+    def cancel_commit(self, provider, persist_id=None):
+        body = '<persist-id>{}</persist-id>'.format(persist_id) if persist_id is not None else ''
+        return self._rpc(provider, 'cancel-commit', body)
+
+    def discard_changes(self, provider):
+        return self._rpc(provider, 'discard-changes', '')
+
+    def get_config(self, provider, source):
+        return _mtus(self._client(provider).rpc(_get_config(self._names[source])))
+
+    def _client(self, provider):
+        client = self.clients.get(provider)
+        if client is None:
+            client = self.clients[provider] = _Client(provider)
+        return client
+
+    def _rpc(self, provider, name, body):
+        self.operations.append(name)
+        reply = self._client(provider).rpc('<{0}>{1}</{0}>'.format(name, body))
+        if _error_tag(reply) is not None:
+            raise YServiceError(_error_tag(reply))
+        return True
+
+
+class SanityNetconfTransaction(unittest.TestCase):
+
+    def setUp(self):
+        self.server = NetconfServer('openconfig').start()
+        self.addCleanup(self.server.stop)
+        self.port = self.server.port
+        self.observer = self._netconf()
+
+    def _netconf(self):
+        netconf = _Netconf()
+        self.addCleanup(netconf.close)
+        return netconf
+
+    def _transaction(self, netconf, lock=True, confirmed=False, persist=None, mtu=1500):
+        with netconf.transaction(self.port, lock=lock, confirmed=confirmed, persist=persist) as transaction:
+            transaction.edit_config(_INTERFACE.format(_OC_IF, 'eth0', mtu))
+        return transaction
+
+    def _running(self):
+        return self.observer.get_config(self.port, Datastore.running)
+
+    def _candidate(self):
+        return self.observer.get_config(self.port, Datastore.candidate)
+
+    def test_commit(self):
+        netconf = self._netconf()
+        transaction = self._transaction(netconf)
+        self.assertTrue(transaction.committed)
+        self.assertEqual(netconf.operations, ['lock', 'lock', 'edit-config', 'validate',
+                                              'commit', 'unlock', 'unlock'])
+        self.assertEqual(transaction.requests, 7)
+        self.assertEqual(self._running(), {'eth0': '1500'})
+
+    def test_lock_failure(self):
+        # changes of the session holding the candidate lock are kept
+        self.observer.lock(self.port, Datastore.candidate)
+        self.observer.edit_config(self.port, Datastore.candidate, _INTERFACE.format(_OC_IF, 'eth1', 1500))
+        netconf = self._netconf()
+        with self.assertRaises(YServiceError):
+            self._transaction(netconf)
+        self.assertEqual(netconf.operations, ['lock', 'lock', 'unlock'])
+        self.assertEqual(self._candidate(), {'eth1': '1500'})
+
+    def test_modified_candidate(self):
+        # the candidate can not be locked while it holds changes of others
+        self.observer.edit_config(self.port, Datastore.candidate, _INTERFACE.format(_OC_IF, 'eth1', 1500))
+        netconf = self._netconf()
+        with self.assertRaises(YServiceError):
+            self._transaction(netconf)
+        self.assertNotIn('discard-changes', netconf.operations)
+        self.assertEqual(self._candidate(), {'eth1': '1500'})
+
+    def test_no_lock_failure(self):
+        self.observer.edit_config(self.port, Datastore.candidate, _INTERFACE.format(_OC_IF, 'eth1', 1500))
+        self.observer.lock(self.port, Datastore.running)
+        netconf = self._netconf()
+        with self.assertRaises(YServiceError):
+            self._transaction(netconf, lock=False)
+        self.assertEqual(netconf.operations, ['edit-config', 'validate', 'commit'])
+        # without locks, changes are left for the caller to discard
+        self.assertEqual(self._candidate(), {'eth0': '1500', 'eth1': '1500'})
+
+    def test_failure_discards(self):
+        netconf = self._netconf()
+        netconf.edit_config = self._fail_second(netconf.edit_config)
+        with self.assertRaises(YServiceError):
+            with netconf.transaction(self.port) as transaction:
+                transaction.edit_config(_INTERFACE.format(_OC_IF, 'eth0', 1500))
+                transaction.edit_config(_INTERFACE.format(_OC_IF, 'eth1', 1500), 'replace')
+        self.assertEqual(netconf.operations[-3:], ['discard-changes', 'unlock', 'unlock'])
+        self.assertEqual(self._candidate(), {})
+
+    def _fail_second(self, edit_config):
+        calls = []
+
+        def wrapper(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise YServiceError('operation-failed')
+            return edit_config(*args)
+        return wrapper
+
+    def test_context_error(self):
+        netconf = self._netconf()
+        with self.assertRaises(ValueError):
+            with netconf.transaction(self.port) as transaction:
+                transaction.edit_config(_INTERFACE.format(_OC_IF, 'eth0', 1500))
+                raise ValueError()
+        self.assertEqual(netconf.operations, [])
+
+    def test_confirm(self):
+        netconf = self._netconf()
+        transaction = self._transaction(netconf, confirmed=True)
+        transaction.confirm()
+        self.assertEqual(netconf.operations[-1], 'commit')
+        with self.assertRaises(YServiceError):
+            netconf.cancel_commit(self.port)
+        self.assertEqual(self._running(), {'eth0': '1500'})
+
+    def test_cancel(self):
+        self._transaction(self._netconf(), mtu=1500)
+        transaction = self._transaction(self._netconf(), confirmed=True, mtu=9000)
+        self.assertEqual(self._running(), {'eth0': '9000'})
+        transaction.cancel()
+        self.assertEqual(self._running(), {'eth0': '1500'})
+
+    def test_confirm_persist(self):
+        netconf = self._netconf()
+        transaction = self._transaction(netconf, confirmed=True, persist='tx1')
+        netconf.close()
+        transaction._netconf = self._netconf()
+        transaction.confirm()
+        with self.assertRaises(YServiceError):
+            self.observer.cancel_commit(self.port, 'tx1')
+        self.assertEqual(self._running(), {'eth0': '1500'})
+
+    def test_not_confirmed(self):
+        netconf = self._netconf()
+        transaction = self._transaction(netconf)
+        with self.assertRaises(YServiceError):
+            transaction.confirm()
+        with self.assertRaises(YServiceError):
+            transaction.cancel()
+        self.assertNotIn('cancel-commit', netconf.operations)
+
+    def test_no_edits(self):
+        with NetconfService().transaction('provider') as transaction:
+            pass
+        self.assertEqual(transaction.requests, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
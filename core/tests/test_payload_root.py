@@ -0,0 +1,92 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_payload_root.py
+Tests for resolving the top level entity from the root of a payload.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.providers import CodecServiceProvider
+from ydk.services import CodecService
+from ydk.types import EncodingFormat
+from ydk.entity_utils.entity_utils import _get_ns_ename
+from ydk.models.openconfig import openconfig_bgp
+
+_BGP_NS = 'http://openconfig.net/yang/bgp'
+_BGP_XML = '''<bgp xmlns="http://openconfig.net/yang/bgp">
+  <global>
+    <config>
+      <as>65001</as>
+    </config>
+  </global>
+</bgp>
+'''
+_BGP_JSON = '''{
+  "openconfig-bgp:bgp": {
+    "global": {
+      "config": {
+        "as": 65001
+      }
+    }
+  }
+}
+'''
+
+
+class SanityPayloadRoot(unittest.TestCase):
+
+    def test_xml_prolog(self):
+        payload = '<?xml version="1.0"?>\n<!-- comment -->\n<?pi data?>\n' + _BGP_XML
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_xml_malformed_after_root(self):
+        payload = '<bgp xmlns="{}"><global></config></bgp>'.format(_BGP_NS)
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_xml_malformed_root(self):
+        self.assertEqual(_get_ns_ename('<<bgp/>', EncodingFormat.XML), (None, None))
+
+    def test_xml_root_in_later_chunk(self):
+        payload = '<!--{}-->{}'.format(' ' * 10000, _BGP_XML)
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.XML), (_BGP_NS, 'bgp'))
+
+    def test_json(self):
+        self.assertEqual(_get_ns_ename(_BGP_JSON, EncodingFormat.JSON), ('openconfig-bgp', 'bgp'))
+
+    def test_json_escaped_key(self):
+        payload = '{"openconfig-bgp:\\u0062gp": {}}'
+        self.assertEqual(_get_ns_ename(payload, EncodingFormat.JSON), ('openconfig-bgp', 'bgp'))
+
+
+class SanityDecode(unittest.TestCase):
+
+    def test_decode_xml(self):
+        provider = CodecServiceProvider(type='xml')
+        bgp = CodecService().decode(provider, _BGP_XML)
+        self.assertIsInstance(bgp, openconfig_bgp.Bgp)
+        self.assertEqual(str(bgp.global_.config.as_), '65001')
+
+    def test_decode_json(self):
+        provider = CodecServiceProvider(type='json')
+        bgp = CodecService().decode(provider, _BGP_JSON)
+        self.assertIsInstance(bgp, openconfig_bgp.Bgp)
+        self.assertEqual(str(bgp.global_.config.as_), '65001')
+
+
+if __name__ == '__main__':
+    unittest.main()
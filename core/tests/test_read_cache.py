@@ -0,0 +1,234 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_read_cache.py
+Tests for caching of read results with ReadCache.
+"""
+from __future__ import absolute_import
+
+import time
+import unittest
+
+from ydk.providers import NetconfServiceProvider
+from ydk.ext.services import Datastore
+from ydk.services import CRUDService, NetconfService, ReadCache
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+
+class _Reader(object):
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class _Provider(object):
+
+    def get_session(self):
+        raise RuntimeError('not connected')
+
+
+class _Crud(object):
+    """CRUD stand-in calling during_write while a write is in progress."""
+
+    def __init__(self, during_write=None, error=None):
+        self.during_write = during_write
+        self.error = error
+        self.writes = 0
+
+    def create(self, provider, entity):
+        self.writes += 1
+        if self.during_write is not None:
+            self.during_write()
+        if self.error is not None:
+            raise self.error
+        return True
+
+
+class _Netconf(object):
+
+    def __init__(self, during_write):
+        self.during_write = during_write
+
+    def edit_config(self, provider, *args):
+        self.during_write()
+        return True
+
+    def commit(self, provider, *args):
+        self.during_write()
+        return True
+
+
+class SanityReadCache(unittest.TestCase):
+
+    def test_hit(self):
+        cache = ReadCache()
+        read = _Reader()
+        provider = object()
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 1)
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 1)
+        self.assertEqual((read.calls, cache.hits, cache.misses), (1, 1, 1))
+
+    def test_keys(self):
+        cache = ReadCache()
+        read = _Reader()
+        provider = object()
+        cache.fetch(provider, 'get', None, read)
+        cache.fetch(provider, 'get-config', None, read)
+        cache.fetch(object(), 'get', None, read)
+        self.assertEqual(read.calls, 3)
+
+    def test_expiry(self):
+        cache = ReadCache(ttl=0.05)
+        read = _Reader()
+        provider = object()
+        cache.fetch(provider, 'get', None, read)
+        time.sleep(0.1)
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 2)
+
+    def test_ttl_per_class(self):
+        cache = ReadCache(ttls={openconfig_interfaces.Interfaces: 0})
+        read = _Reader()
+        provider = object()
+        for _ in range(2):
+            cache.fetch(provider, 'get', openconfig_interfaces.Interfaces(), read)
+        self.assertEqual(read.calls, 2)
+        self.assertEqual(cache.hits + cache.misses, 0)
+
+    def test_lru(self):
+        cache = ReadCache(max_entries=2)
+        read = _Reader()
+        first, second, third = object(), object(), object()
+        cache.fetch(first, 'get', None, read)
+        cache.fetch(second, 'get', None, read)
+        cache.fetch(first, 'get', None, read)
+        cache.fetch(third, 'get', None, read)
+        self.assertEqual(read.calls, 3)
+        cache.fetch(first, 'get', None, read)
+        self.assertEqual(read.calls, 3)
+        cache.fetch(second, 'get', None, read)
+        self.assertEqual(read.calls, 4)
+
+    def test_invalidate(self):
+        cache = ReadCache()
+        read = _Reader()
+        first, second = object(), object()
+        cache.fetch(first, 'get', None, read)
+        cache.fetch(second, 'get', None, read)
+        cache.invalidate(first)
+        cache.fetch(first, 'get', None, read)
+        cache.fetch(second, 'get', None, read)
+        self.assertEqual(read.calls, 3)
+        cache.invalidate()
+        cache.fetch(second, 'get', None, read)
+        self.assertEqual(read.calls, 4)
+
+    def test_invalidated_during_read(self):
+        cache = ReadCache()
+        provider = object()
+
+        def read():
+            cache.invalidate(provider)
+            return 'old'
+
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 'old')
+        self.assertEqual(cache.fetch(provider, 'get', None, lambda: 'new'), 'new')
+
+    def test_filter_not_encoded(self):
+        cache = ReadCache()
+        read = _Reader()
+        provider = _Provider()
+        for _ in range(2):
+            cache.fetch(provider, 'get', openconfig_interfaces.Interfaces(), read)
+        self.assertEqual(read.calls, 2)
+
+    def test_invalidated_by_crud(self):
+        cache = ReadCache()
+        crud = CRUDService(cache=cache)
+        read = _Reader()
+        provider = object()
+        # a read during the write caches the state before the write
+        crud._crud = _Crud(lambda: cache.fetch(provider, 'get', None, read))
+        crud.create(provider, openconfig_interfaces.Interfaces())
+        self.assertEqual(read.calls, 1)
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 2)
+
+    def test_invalidated_by_failed_crud(self):
+        cache = ReadCache()
+        crud = CRUDService(cache=cache)
+        read = _Reader()
+        provider = object()
+        crud._crud = _Crud(lambda: cache.fetch(provider, 'get', None, read), RuntimeError('failed'))
+        with self.assertRaises(Exception):
+            crud.create(provider, openconfig_interfaces.Interfaces())
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 2)
+
+    def test_invalidated_by_netconf(self):
+        cache = ReadCache()
+        netconf = NetconfService(cache=cache)
+        read = _Reader()
+        provider = object()
+        netconf._ns = _Netconf(lambda: cache.fetch(provider, 'get', None, read))
+        netconf.edit_config(provider, Datastore.candidate, openconfig_interfaces.Interfaces())
+        netconf.commit(provider)
+        self.assertEqual(read.calls, 2)
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 3)
+
+    def test_invalidated_by_batch_flush(self):
+        cache = ReadCache()
+        crud = CRUDService(cache=cache)
+        crud._crud = _Crud()
+        read = _Reader()
+        provider = object()
+        with crud.batch(provider):
+            cache.fetch(provider, 'get', None, read)
+            crud.create(provider, openconfig_interfaces.Interfaces())
+            # queued writes leave cached results until they are sent
+            self.assertEqual(cache.fetch(provider, 'get', None, read), 1)
+        self.assertEqual(crud._crud.writes, 1)
+        self.assertEqual(cache.fetch(provider, 'get', None, read), 2)
+
+
+class SanityReadCacheServer(unittest.TestCase):
+
+    def test_cached_reads(self):
+        with NetconfServer('openconfig') as server:
+            provider = NetconfServiceProvider(address='127.0.0.1', username='admin', password='admin',
+                                              port=server.port, protocol='tcp')
+            crud = CRUDService(cache=ReadCache(ttl=60))
+            requests = server.requests
+            first = crud.read_config(provider, openconfig_interfaces.Interfaces())
+            second = crud.read_config(provider, openconfig_interfaces.Interfaces())
+            self.assertIs(second, first)
+            self.assertEqual(server.requests - requests, 1)
+
+            interfaces = openconfig_interfaces.Interfaces()
+            interface = openconfig_interfaces.Interfaces.Interface()
+            interface.name = 'eth0'
+            interface.config.name = 'eth0'
+            interfaces.interface.append(interface)
+            crud.create(provider, interfaces)
+            read = crud.read_config(provider, openconfig_interfaces.Interfaces())
+            self.assertEqual([entry.name for entry in read.interface], ['eth0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
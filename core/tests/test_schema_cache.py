@@ -0,0 +1,100 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_schema_cache.py
+Tests for the persistent schema lookup cache.
+"""
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ydk.path import enable_schema_cache
+from ydk.path import schema_cache
+from ydk.entity_utils.entity_utils import _import_yang_ns
+
+
+class SanitySchemaCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'openconfig.json')
+        self.reads = []
+        enable_schema_cache(directory=self.directory)
+
+    def tearDown(self):
+        enable_schema_cache(False)
+        shutil.rmtree(self.directory)
+
+    def _read(self, bundle_name):
+        self.reads.append(bundle_name)
+        return _import_yang_ns(bundle_name)
+
+    def _get_state(self):
+        # as in a new process
+        schema_cache._BUNDLE_STATES.clear()
+        return schema_cache._get_bundle_state('openconfig', self._read)
+
+    def test_disabled(self):
+        enable_schema_cache(False)
+        self._get_state()
+        self._get_state()
+        self.assertEqual(self.reads, ['openconfig', 'openconfig'])
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_reuse(self):
+        expected = _import_yang_ns('openconfig')
+        self.assertEqual(self._get_state(), expected)
+        self.assertTrue(os.path.isfile(self.path))
+        self.assertEqual(self._get_state(), expected)
+        self.assertEqual(self.reads, ['openconfig'])
+        self.assertEqual(os.listdir(self.directory), ['openconfig.json'])
+
+    def test_not_installed(self):
+        self.assertIsNone(schema_cache._get_bundle_state('not_a_bundle', self._read))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_bundle_changed(self):
+        self._get_state()
+        with open(self.path) as f:
+            entry = json.load(f)
+        entry['stamp'][1] += 1
+        entry['capabilities'] = {}
+        with open(self.path, 'w') as f:
+            json.dump(entry, f)
+        self.assertNotEqual(self._get_state()['capabilities'], {})
+        self.assertEqual(self.reads, ['openconfig', 'openconfig'])
+
+    def test_invalid_entry(self):
+        self._get_state()
+        with open(self.path) as f:
+            entry = json.load(f)
+        entry['entity_lookup'][0] = ['ns', 'name']
+        with open(self.path, 'w') as f:
+            json.dump(entry, f)
+        self.assertEqual(self._get_state(), _import_yang_ns('openconfig'))
+        with open(self.path, 'w') as f:
+            f.write('{"format":')
+        self.assertEqual(self._get_state(), _import_yang_ns('openconfig'))
+        self.assertEqual(self.reads, ['openconfig'] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+
+"""test_schema_store.py
+Tests for YANG modules shared by NETCONF providers through NetconfSchemaStore.
+"""
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ydk.providers import NetconfSchemaStore
+from ydk.providers.schema_store import _parse_capability
+from ydk.services import CRUDService
+from ydk.testing import NetconfServer
+from ydk.models.openconfig import openconfig_interfaces
+
+_INTERFACES = 'http://openconfig.net/yang/interfaces?module=openconfig-interfaces&revision=2016-05-26'
+
+
+class SanitySchemaStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = NetconfSchemaStore(self.directory)
+
+    def test_parse_capability(self):
+        self.assertEqual(_parse_capability(_INTERFACES),
+                         ('openconfig-interfaces', '2016-05-26', (), ()))
+        self.assertEqual(_parse_capability('urn:x?module=x&features=b,a&deviations=x-dev'),
+                         ('x', '', ('a', 'b'), ('x-dev',)))
+        self.assertIsNone(_parse_capability('urn:ietf:params:netconf:base:1.1'))
+        self.assertIsNone(_parse_capability('urn:x?revision=2016-01-01'))
+
+    def test_layout(self):
+        self.assertEqual(sorted(os.listdir(self.directory)), ['capability-sets', 'modules'])
+        self.assertEqual(self.store.repository().path, self.store.modules_dir)
+
+    def test_seed(self):
+        self.assertEqual(self.store.missing_modules([_INTERFACES]), ['openconfig-interfaces@2016-05-26'])
+        added = self.store.seed('openconfig')
+        self.assertGreater(added, 0)
+        self.assertEqual(len(os.listdir(self.store.modules_dir)), added)
+        self.assertEqual(self.store.seed('openconfig'), 0)
+        self.assertEqual(self.store.missing_modules([_INTERFACES, 'urn:ietf:params:netconf:base:1.1']), [])
+
+    def test_fingerprint(self):
+        other = 'urn:x?module=x&revision=2017-01-01&features=b,a'
+        same = 'urn:x?module=x&revision=2017-01-01&features=a,b'
+        base = 'urn:ietf:params:netconf:base:1.1'
+        self.assertEqual(self.store.fingerprint([_INTERFACES, other]),
+                         self.store.fingerprint([same, base, _INTERFACES]))
+        self.assertNotEqual(self.store.fingerprint([_INTERFACES]),
+                            self.store.fingerprint([_INTERFACES, other]))
+        self.assertNotEqual(self.store.fingerprint([other]),
+                            self.store.fingerprint(['urn:x?module=x&revision=2017-01-01&features=a']))
+
+    def test_record(self):
+        capabilities = [_INTERFACES]
+        self.assertFalse(self.store.is_known(capabilities))
+        fingerprint = self.store.record(capabilities)
+        # recorded before its module is in the store
+        self.assertFalse(self.store.is_known(capabilities))
+        self.store.seed('openconfig')
+        self.assertEqual(self.store.record(capabilities), fingerprint)
+        self.assertTrue(self.store.is_known(capabilities))
+        with open(os.path.join(self.store.sets_dir, fingerprint + '.json')) as f:
+            manifest = json.load(f)
+        self.assertEqual([entry['file'] for entry in manifest['modules']],
+                         ['openconfig-interfaces@2016-05-26.yang'])
+
+    def test_module_changed(self):
+        capabilities = [_INTERFACES]
+        self.store.seed('openconfig')
+        self.store.record(capabilities)
+        with open(os.path.join(self.store.modules_dir, 'openconfig-interfaces@2016-05-26.yang'), 'ab') as f:
+            f.write(b'\n')
+        self.assertFalse(self.store.is_known(capabilities))
+        self.store.record(capabilities)
+        self.assertTrue(self.store.is_known(capabilities))
+
+    def test_invalid_manifest(self):
+        capabilities = [_INTERFACES]
+        self.store.seed('openconfig')
+        path = os.path.join(self.store.sets_dir, self.store.fingerprint(capabilities) + '.json')
+        for content in ('{', '[]', '{"version": 1, "modules": [{"file": "../x.yang", "sha256": null}]}'):
+            with open(path, 'w') as f:
+                f.write(content)
+            self.assertFalse(self.store.is_known(capabilities))
+        self.store.record(capabilities)
+        self.assertTrue(self.store.is_known(capabilities))
+
+    def test_provider(self):
+        self.store.seed('openconfig')
+        with NetconfServer('openconfig') as server:
+            provider = self.store.provider('127.0.0.1', 'admin', 'admin', port=server.port, protocol='tcp')
+            interfaces = CRUDService().read_config(provider, openconfig_interfaces.Interfaces())
+            self.assertIsInstance(interfaces, openconfig_interfaces.Interfaces)
+        self.assertEqual(os.listdir(self.store.sets_dir),
+                         [self.store.fingerprint(provider.get_capabilities()) + '.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
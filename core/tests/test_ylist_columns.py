@@ -0,0 +1,86 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+
+"""test_ylist_columns.py
+Tests for bulk creation of list entries with YList.from_columns.
+"""
+from __future__ import absolute_import
+
+import unittest
+
+from ydk.errors import YInvalidArgumentError, YModelError
+from ydk.models.ietf import ietf_interfaces
+
+
+class SanityYListColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.interfaces = ietf_interfaces.Interfaces()
+        self.entries = self.interfaces.interface
+
+    def test_from_columns(self):
+        names = ['GigabitEthernet0/0/0/%d' % i for i in range(3)]
+        entities = self.entries.from_columns({'name': names},
+                                             {'description': ['uplink', None, 'spare'],
+                                              'enabled': [True, False, True]})
+        self.assertEqual(len(entities), 3)
+        self.assertEqual(self.entries.keys(), names)
+        for name, entity in zip(names, entities):
+            self.assertIsInstance(entity, ietf_interfaces.Interfaces.Interface)
+            self.assertEqual(entity.name, name)
+            self.assertIs(entity.parent, self.interfaces)
+            self.assertIs(self.entries[name], entity)
+        self.assertEqual(entities[0].description, 'uplink')
+        self.assertIsNone(entities[1].description)
+        self.assertEqual(entities[1].enabled, False)
+        self.assertTrue(self.interfaces.has_data())
+
+    def test_appends_after_existing(self):
+        interface = ietf_interfaces.Interfaces.Interface()
+        interface.name = 'Loopback0'
+        self.entries.append(interface)
+        self.entries.from_columns({'name': ['Loopback1']})
+        self.assertEqual(self.entries.keys(), ['Loopback0', 'Loopback1'])
+        self.assertIs(self.entries[0], interface)
+
+    def test_missing_key(self):
+        entities = self.entries.from_columns({'name': ['Loopback0', None]})
+        self.assertEqual(len(self.entries), 2)
+        self.assertIsNone(entities[1].name)
+
+    def test_empty_columns(self):
+        self.assertEqual(self.entries.from_columns({'name': []}), [])
+        self.assertEqual(len(self.entries), 0)
+        self.assertFalse(self.interfaces.has_data())
+
+    def test_length_mismatch(self):
+        with self.assertRaises(YInvalidArgumentError):
+            self.entries.from_columns({'name': ['Loopback0', 'Loopback1']},
+                                      {'description': ['loopback']})
+        self.assertEqual(len(self.entries), 0)
+
+    def test_unknown_leaf(self):
+        with self.assertRaises(YInvalidArgumentError):
+            self.entries.from_columns({'interface_name': ['Loopback0']})
+        self.assertEqual(len(self.entries), 0)
+
+    def test_invalid_value(self):
+        with self.assertRaises(YModelError):
+            self.entries.from_columns({'name': [['Loopback0']]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Awaitable counterparts of ydk.services.
+
+Service operations are blocking calls into the YDK core, so they run in a
+thread pool. The core releases the GIL while a request is on the device,
+and the event loop keeps serving other tasks meanwhile; encoding entities
+into requests and replies into entities holds the GIL, so the loop is
+held up while large entities are converted. Operations on
+the same provider are limited to a number of concurrent calls, one by
+default, as a provider holds a single session to the device.
+
+A timed out or cancelled operation raises asyncio.TimeoutError or
+asyncio.CancelledError right away; if it had already started, the call
+into the YDK core still runs to completion in its thread, and the provider
+is only handed to the next operation after that.
+"""
+import asyncio
+import concurrent.futures
+import functools
+
+from ydk.ext.services import Datastore
+from ydk.services import CRUDService as _CRUDService
+from ydk.services import ExecutorService as _ExecutorService
+from ydk.services import NetconfService as _NetconfService
+
+try:
+    _get_running_loop = asyncio.get_running_loop
+except AttributeError:
+    # Python < 3.7, where get_event_loop returns the running loop in a coroutine
+    _get_running_loop = asyncio.get_event_loop
+
+
+class _ProviderSlots(object):
+    """Limits the number of concurrent operations per provider.
+
+    Semaphores are dropped once a provider has no operation in flight, so
+    providers are not kept alive by the service.
+    """
+    def __init__(self, limit):
+        self._limit = limit
+        self._slots = {}
+
+    async def acquire(self, provider):
+        key = id(provider)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = [asyncio.Semaphore(self._limit), 0]
+            self._slots[key] = slot
+        slot[1] += 1
+        try:
+            await slot[0].acquire()
+        except BaseException:
+            self._done(key)
+            raise
+
+    def release(self, provider):
+        key = id(provider)
+        self._slots[key][0].release()
+        self._done(key)
+
+    def _done(self, key):
+        slot = self._slots[key]
+        slot[1] -= 1
+        if slot[1] == 0:
+            del self._slots[key]
+
+
+class _AsyncService(object):
+    """Runs operations of a blocking service in a thread pool.
+
+    Args:
+        service: The blocking ydk.services instance.
+        executor (concurrent.futures.Executor, optional): Executor running the
+            operations; a thread pool with max_workers threads by default.
+        max_workers (int, optional): Size of the default thread pool.
+        max_concurrency (int): Maximum number of concurrent operations per
+            provider, defaults to 1.
+        timeout (float, optional): Default timeout of operations in seconds.
+    """
+    def __init__(self, service, executor=None, max_workers=None, max_concurrency=1, timeout=None):
+        self._service = service
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._executor = executor
+        self._slots = _ProviderSlots(max_concurrency)
+        self._timeout = timeout
+
+    async def _run(self, provider, method, *args, **kwargs):
+        timeout = kwargs.pop('timeout', self._timeout)
+        loop = _get_running_loop()
+        await self._slots.acquire(provider)
+        try:
+            future = self._executor.submit(functools.partial(method, provider, *args, **kwargs))
+        except BaseException:
+            self._slots.release(provider)
+            raise
+        # release the provider when the call ends, not when the caller stops waiting
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._slots.release, provider))
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def shutdown(self, wait=True):
+        """Shut down the executor of the service."""
+        self._executor.shutdown(wait)
+
+
+class CRUDService(_AsyncService):
+    """asyncio counterpart of ydk.services.CRUDService.
+
+    Every operation accepts an optional 'timeout' keyword argument, which
+    overrides the default timeout of the service.
+    """
+    def __init__(self, executor=None, max_workers=None, max_concurrency=1, timeout=None):
+        super(CRUDService, self).__init__(_CRUDService(), executor, max_workers, max_concurrency, timeout)
+
+    async def create(self, provider, entity, **kwargs):
+        return await self._run(provider, self._service.create, entity, **kwargs)
+
+    async def read(self, provider, read_filter=None, **kwargs):
+        return await self._run(provider, self._service.read, read_filter, **kwargs)
+
+    async def read_config(self, provider, read_filter=None, **kwargs):
+        return await self._run(provider, self._service.read_config, read_filter, **kwargs)
+
+    async def update(self, provider, entity, **kwargs):
+        return await self._run(provider, self._service.update, entity, **kwargs)
+
+    async def delete(self, provider, entity, **kwargs):
+        return await self._run(provider, self._service.delete, entity, **kwargs)
+
+
+class NetconfService(_AsyncService):
+    """asyncio counterpart of ydk.services.NetconfService.
+
+    Every operation accepts an optional 'timeout' keyword argument, which
+    overrides the default timeout of the service.
+    """
+    def __init__(self, executor=None, max_workers=None, max_concurrency=1, timeout=None):
+        super(NetconfService, self).__init__(_NetconfService(), executor, max_workers, max_concurrency, timeout)
+
+    async def cancel_commit(self, provider, persist_id=None, **kwargs):
+        return await self._run(provider, self._service.cancel_commit, persist_id, **kwargs)
+
+    async def close_session(self, provider, **kwargs):
+        return await self._run(provider, self._service.close_session, **kwargs)
+
+    async def commit(self, provider, confirmed=False, confirm_timeout=None, persist=None, persist_id=None, **kwargs):
+        return await self._run(provider, self._service.commit, confirmed, confirm_timeout, persist, persist_id, **kwargs)
+
+    async def copy_config(self, provider, target, source=None, url="", source_config=None, **kwargs):
+        return await self._run(provider, self._service.copy_config, target, source, url, source_config, **kwargs)
+
+    async def delete_config(self, provider, target, url="", **kwargs):
+        return await self._run(provider, self._service.delete_config, target, url, **kwargs)
+
+    async def discard_changes(self, provider, **kwargs):
+        return await self._run(provider, self._service.discard_changes, **kwargs)
+
+    async def edit_config(self, provider, target, config,
+                          default_operation="", test_option="", error_option="", **kwargs):
+        return await self._run(provider, self._service.edit_config, target, config,
+                               default_operation, test_option, error_option, **kwargs)
+
+    async def get_config(self, provider, source=Datastore.running, read_filter=None, **kwargs):
+        return await self._run(provider, self._service.get_config, source, read_filter, **kwargs)
+
+    async def get(self, provider, read_filter=None, **kwargs):
+        return await self._run(provider, self._service.get, read_filter, **kwargs)
+
+    async def kill_session(self, provider, session_id, **kwargs):
+        return await self._run(provider, self._service.kill_session, session_id, **kwargs)
+
+    async def lock(self, provider, target, **kwargs):
+        return await self._run(provider, self._service.lock, target, **kwargs)
+
+    async def unlock(self, provider, target, **kwargs):
+        return await self._run(provider, self._service.unlock, target, **kwargs)
+
+    async def validate(self, provider, source=None, url="", source_config=None, **kwargs):
+        return await self._run(provider, self._service.validate, source, url, source_config, **kwargs)
+
+
+class ExecutorService(_AsyncService):
+    """asyncio counterpart of ydk.services.ExecutorService.
+
+    Every operation accepts an optional 'timeout' keyword argument, which
+    overrides the default timeout of the service.
+    """
+    def __init__(self, executor=None, max_workers=None, max_concurrency=1, timeout=None):
+        super(ExecutorService, self).__init__(_ExecutorService(), executor, max_workers, max_concurrency, timeout)
+
+    async def execute_rpc(self, provider, entity, top_entity=None, **kwargs):
+        return await self._run(provider, self._service.execute_rpc, entity, top_entity, **kwargs)
@@ -14,12 +14,16 @@
 # limitations under the License.
 # ------------------------------------------------------------------
 
+import os
+import re
 import sys
 import json
 import pkgutil
 import importlib
 import logging
-import xml.etree.ElementTree as _ET
+import threading
+from json.decoder import scanstring as _scanstring
+from xml.parsers import expat as _expat
 
 from ydk.ext.entity_utils import get_entity_from_data_node
 from ydk.ext.services import Datastore
@@ -27,10 +31,18 @@ from ydk.ext.services import Datastore
 from ydk.types import Config, EncodingFormat
 
 from ydk.errors import YModelError, YServiceError
+from ydk.path.schema_cache import _get_bundle_state
 
 _ENTITY_ERROR_MSG = "No YDK bundle installed for node path '{}'"
 _PATH_ERROR_MSG   = "A string value '{}' does not represent valid node path"
 
+_PEEK_CHUNK_SIZE = 4096
+_JSON_FIRST_KEY = re.compile(r'\s*\{\s*"')
+
+_ENTITY_INDEX = None
+_ENTITY_INDEX_LOCK = threading.Lock()
+_ENTITY_CLASSES = {}
+
 def _read_entities(provider, get_config=True, source=Datastore.running):
     session = provider.get_session()
     root_schema = session.get_root_schema()
@@ -66,18 +78,11 @@ def _datanode_to_entity(data_node):
     module, container = tuple(node_path[1:].split(':', 1))
     if '[' in container:
         container = container.split('[', 1)[0]
-    ydk_models = importlib.import_module('ydk.models')
-    for (_, name, ispkg) in pkgutil.iter_modules(ydk_models.__path__):
-        if ispkg:
-            yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
-            entity_lookup = yang_ns.__dict__['ENTITY_LOOKUP']
-            if (module, container) in entity_lookup:
-                mod, entity_str = entity_lookup[(module, container)].split('.', 1)
-                mod = importlib.import_module('ydk.models.{}.{}'.format(name, mod))
-                entity = getattr(mod, entity_str)()
-                top_entity = entity.clone_ptr()
-                get_entity_from_data_node(data_node, top_entity);
-                return top_entity
+    entity_class = _get_entity_class((module, container))
+    if entity_class is not None:
+        top_entity = entity_class().clone_ptr()
+        get_entity_from_data_node(data_node, top_entity);
+        return top_entity
 
     raise YModelError(_ENTITY_ERROR_MSG.format(node_path))
 
@@ -106,25 +111,98 @@ def _payload_to_top_entity(payload, encoding):
     ns_ename = _get_ns_ename(payload, encoding)
     if None in ns_ename:
         raise YModelError("Could not retrieve namespace and container name")
-    ydk_models = importlib.import_module('ydk.models')
-    for (_, name, ispkg) in pkgutil.iter_modules(ydk_models.__path__):
-        if ispkg:
-            yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
-            entity_lookup = yang_ns.__dict__['ENTITY_LOOKUP']
-            if ns_ename in entity_lookup:
-                entity_mod = entity_lookup[ns_ename]
-                mod = '.'.join(entity_mod.split('.')[:-1])
-                entity = entity_mod.split('.')[-1]
-                mod = importlib.import_module('ydk.models.{}.{}'.format(name, mod))
-                entity = getattr(mod, entity)()
-                return entity.clone_ptr()
+    entity_class = _get_entity_class(ns_ename)
+    if entity_class is not None:
+        return entity_class().clone_ptr()
 
     raise YModelError(_ENTITY_ERROR_MSG.format(ns_ename[0]+':'+ns_ename[1]))
 
 
+def _get_entity_class(key):
+    """Return top level entity class for key.
+
+    Args:
+        key (tuple(str, str)): Namespace or module name, and top level
+            container name, as used in `ENTITY_LOOKUP` of YDK bundles.
+
+    Returns:
+        A YDK entity class, or None if no installed bundle defines key.
+    """
+    entity_class = _ENTITY_CLASSES.get(key)
+    if entity_class is None:
+        entry = _get_entity_index().get(key)
+        if entry is None:
+            return None
+        bundle, entity_path = entry
+        mod, entity = entity_path.rsplit('.', 1)
+        mod = importlib.import_module('ydk.models.{}.{}'.format(bundle, mod))
+        entity_class = getattr(mod, entity)
+        _ENTITY_CLASSES[key] = entity_class
+    return entity_class
+
+
+def _get_entity_index():
+    """Return index of top level entities of installed YDK bundles.
+
+    The index maps the keys of `ENTITY_LOOKUP` of all bundles to a tuple
+    of bundle package name and entity path. It is built on first use and
+    shared by the whole process; when several bundles define the same
+    key, the first bundle found wins.
+    """
+    global _ENTITY_INDEX
+    index = _ENTITY_INDEX
+    if index is None:
+        with _ENTITY_INDEX_LOCK:
+            if _ENTITY_INDEX is None:
+                index = {}
+                for name, _ in _iter_bundles():
+                    state = _read_yang_ns(name)
+                    if state is None:
+                        continue
+                    for key, entity_path in state['entity_lookup'].items():
+                        index.setdefault(key, (name, entity_path))
+                _ENTITY_INDEX = index
+            index = _ENTITY_INDEX
+    return index
+
+
+def _iter_bundles():
+    """Yield name and location of installed YDK bundles."""
+    models = importlib.import_module('ydk.models')
+    for (finder, name, ispkg) in pkgutil.iter_modules(models.__path__):
+        if ispkg:
+            yield name, os.path.join(getattr(finder, 'path', ''), name)
+
+
+def _read_yang_ns(bundle_name):
+    """Return lookup tables of bundle, or None if it is not installed.
+
+    The tables are read from the persistent schema cache when it is
+    enabled, see ydk.path.enable_schema_cache.
+
+    Returns:
+        dict with 'capabilities', 'namespace_lookup' and 'entity_lookup'
+        entries, as defined in the bundle's _yang_ns module.
+    """
+    return _get_bundle_state(bundle_name, _import_yang_ns)
+
+
+def _import_yang_ns(bundle_name):
+    try:
+        yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(bundle_name))
+    except ImportError:
+        return None
+    return {'capabilities': yang_ns.__dict__['CAPABILITIES'],
+            'namespace_lookup': yang_ns.__dict__['NAMESPACE_LOOKUP'],
+            'entity_lookup': yang_ns.__dict__['ENTITY_LOOKUP']}
+
+
 def _get_ns_ename(payload, encoding):
     """Return namespace and entity name from incoming payload.
 
+    Only the beginning of the payload, up to the first start tag or JSON
+    key, is parsed; the payload is validated when it is decoded.
+
     Args:
         payload (str): Incoming payload.
         encoding (ydk.types.EncodingFormat): Payload encoding format.
@@ -136,25 +214,53 @@ def _get_ns_ename(payload, encoding):
     if encoding == EncodingFormat.XML:
         log = logging.getLogger('ydk')
         try:
-            payload_root = _ET.fromstring(payload)
-            if '{' in payload_root.tag and '}' in payload_root.tag:
-                ns, ename = payload_root.tag.rsplit('}')
-                ns = ns.strip('{')
+            tag = _get_xml_root_tag(payload)
+            if tag is not None and '}' in tag:
+                ns, ename = tag.rsplit('}', 1)
             else:
                 log.error("Top tag does not have namespace attribute\n{}".format(payload))
-        except _ET.ParseError as err:
-            log.error("xml.etree.ElementTree.ParseError: {}\n{}".format(err, payload))
+        except _expat.ExpatError as err:
+            log.error("xml.parsers.expat.ExpatError: {}\n{}".format(err, payload))
     else:
-        keys = json.loads(payload).keys()
-        # for Python 3
-        keys = list(keys)
-        ns, ename = keys[0].split(':')
+        match = _JSON_FIRST_KEY.match(payload)
+        if match is not None:
+            key, _ = _scanstring(payload, match.end())
+        else:
+            keys = json.loads(payload).keys()
+            # for Python 3
+            keys = list(keys)
+            key = keys[0]
+        ns, ename = key.split(':')
         ns = _to_utf8(ns)
         ename = _to_utf8(ename)
 
     return (ns, ename)
 
 
+class _RootTagFound(Exception):
+    pass
+
+
+def _get_xml_root_tag(payload):
+    """Return tag of the root element of XML payload, in the form
+    'namespace}name', parsing the payload only up to the first start tag.
+    """
+    tags = []
+
+    def start_element(name, attrs):
+        tags.append(name)
+        raise _RootTagFound()
+
+    parser = _expat.ParserCreate(namespace_separator='}')
+    parser.StartElementHandler = start_element
+    try:
+        for i in range(0, len(payload), _PEEK_CHUNK_SIZE):
+            parser.Parse(payload[i:i + _PEEK_CHUNK_SIZE], False)
+    except _RootTagFound:
+        pass
+    return tags[0] if tags else None
+
+
 def _to_utf8(string):
     """Convert unicode to str if running under Python 2 environment."""
     if sys.version_info < (3, 0):
@@ -26,6 +26,7 @@ from ydk.ext.path import Statement
 
 from .sessions import NetconfSession
 from .sessions import RestconfSession
+from .schema_cache import enable_schema_cache
 
 
 
@@ -39,4 +40,5 @@ __all__ = [ "Annotation",
             "RootSchemaNode",
             "Rpc",
             "SchemaNode",
-            "Statement" ]
+            "Statement",
+            "enable_schema_cache" ]
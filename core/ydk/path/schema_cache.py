@@ -0,0 +1,191 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Persistent cache of the schema lookup state of installed YDK bundles.
+
+The lookup state of a bundle (capabilities, namespace and entity lookup
+tables from its _yang_ns module) is needed before any root schema can be
+created for it. When the cache is enabled, it is stored on disk as JSON,
+one file per bundle, and reused by later processes without importing the
+bundle's _yang_ns module. An entry is only used while the installed
+version of the bundle and the size and modification time of its _yang_ns
+module match those it was read from; otherwise it is read and written
+again.
+
+Entries are plain data and are validated when read, a corrupted or
+unexpected entry being ignored. Compiled root schemas live in libyang
+contexts of the core library and are not cached.
+"""
+import json
+import logging
+import os
+import pkgutil
+import sys
+import tempfile
+import threading
+
+
+_CACHE_DIR = None
+_CACHE_LOCK = threading.Lock()
+_BUNDLE_STATES = {}
+_CACHE_FORMAT = 1
+
+if sys.version_info < (3, 0):
+    _STRING_TYPES = (str, unicode)
+else:
+    _STRING_TYPES = (str,)
+
+logger = logging.getLogger(__name__)
+
+
+def enable_schema_cache(enabled=True, directory=None):
+    """Enable or disable the persistent schema lookup cache.
+
+    Args:
+        enabled (bool): Defaults to True.
+        directory (str, optional): Cache location, defaults to
+            '~/.ydk/schema-cache'.
+    """
+    global _CACHE_DIR
+    with _CACHE_LOCK:
+        if enabled:
+            if directory is None:
+                directory = os.path.join(os.path.expanduser('~'), '.ydk', 'schema-cache')
+            _CACHE_DIR = directory
+        else:
+            _CACHE_DIR = None
+        _BUNDLE_STATES.clear()
+
+
+def _get_bundle_state(bundle_name, read):
+    """Return lookup state of bundle, from the cache if it is enabled.
+
+    Args:
+        bundle_name (str): Bundle package name, such as 'openconfig'.
+        read (callable): Called with bundle_name to read the state from
+            the bundle when it is not cached.
+
+    Returns:
+        dict with 'capabilities', 'namespace_lookup' and 'entity_lookup'
+        entries, as returned by read, or None if the bundle is not
+        installed.
+    """
+    directory = _CACHE_DIR
+    if directory is None:
+        return read(bundle_name)
+    state = _BUNDLE_STATES.get(bundle_name)
+    if state is not None:
+        return state
+
+    with _CACHE_LOCK:
+        state = _BUNDLE_STATES.get(bundle_name)
+        if state is None:
+            stamp = _get_stamp(bundle_name)
+            if stamp is None:
+                return read(bundle_name)
+            path = os.path.join(directory, '{}.json'.format(bundle_name))
+            state = _load(path, bundle_name, stamp)
+            if state is None:
+                state = read(bundle_name)
+                if state is None:
+                    return None
+                _store(path, bundle_name, stamp, state)
+            _BUNDLE_STATES[bundle_name] = state
+    return state
+
+
+def _get_stamp(bundle_name):
+    """Return installed version of the bundle, with size and modification
+    time of its _yang_ns module, or None if it can not be located."""
+    try:
+        loader = pkgutil.get_loader('ydk.models.{}._yang_ns'.format(bundle_name))
+        stat = os.stat(loader.get_filename())
+    except Exception:
+        return None
+    return [_get_version(bundle_name), stat.st_size, stat.st_mtime]
+
+
+def _get_version(bundle_name):
+    """Return version of the ydk-models distribution of the bundle, None
+    if the bundle is not installed as a distribution."""
+    try:
+        import pkg_resources
+        return pkg_resources.get_distribution('ydk-models-{}'.format(bundle_name)).version
+    except Exception:
+        return None
+
+
+def _load(path, bundle_name, stamp):
+    """Return state read from path, None if there is no valid entry for
+    bundle_name and stamp."""
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+    except (IOError, OSError):
+        return None
+    except ValueError as err:
+        logger.debug("Ignoring corrupted schema cache entry {}: {}".format(path, err))
+        return None
+
+    if not isinstance(entry, dict) or entry.get('format') != _CACHE_FORMAT \
+            or entry.get('bundle') != bundle_name or entry.get('stamp') != stamp:
+        return None
+    capabilities = entry.get('capabilities')
+    namespace_lookup = entry.get('namespace_lookup')
+    entity_lookup = entry.get('entity_lookup')
+    if not (_is_string_map(capabilities) and _is_string_map(namespace_lookup)
+            and isinstance(entity_lookup, list)):
+        logger.debug("Ignoring invalid schema cache entry {}".format(path))
+        return None
+    for item in entity_lookup:
+        if not (isinstance(item, list) and len(item) == 3
+                and all(isinstance(s, _STRING_TYPES) for s in item)):
+            logger.debug("Ignoring invalid schema cache entry {}".format(path))
+            return None
+    return {'capabilities': capabilities,
+            'namespace_lookup': namespace_lookup,
+            'entity_lookup': dict(((ns, name), entity_path)
+                                  for ns, name, entity_path in entity_lookup)}
+
+
+def _is_string_map(value):
+    return isinstance(value, dict) and all(
+        isinstance(k, _STRING_TYPES) and isinstance(v, _STRING_TYPES)
+        for k, v in value.items())
+
+
+def _store(path, bundle_name, stamp, state):
+    """Write entry of bundle_name to path atomically, as other processes
+    may read it."""
+    entry = {'format': _CACHE_FORMAT,
+             'bundle': bundle_name,
+             'stamp': stamp,
+             'capabilities': state['capabilities'],
+             'namespace_lookup': state['namespace_lookup'],
+             'entity_lookup': sorted([ns, name, entity_path] for (ns, name), entity_path
+                                     in state['entity_lookup'].items())}
+    directory = os.path.dirname(path)
+    tmp_path = None
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.{}-'.format(bundle_name))
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f, sort_keys=True)
+        os.rename(tmp_path, path)
+    except (IOError, OSError) as err:
+        logger.debug("Could not write schema cache entry {}: {}".format(path, err))
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -15,6 +15,8 @@
 # ------------------------------------------------------------------
 
 from .codec_provider import CodecServiceProvider
+from .netconf_pool import NetconfProviderPool
+from .schema_store import NetconfSchemaStore
 from ydk.ext.providers import ServiceProvider
 from ydk.ext.providers import NetconfServiceProvider
 from ydk.ext.providers import RestconfServiceProvider
@@ -25,4 +27,6 @@ __all__ = [ "ServiceProvider",
             "CodecServiceProvider",
             "NetconfServiceProvider",
             "RestconfServiceProvider",
-            "OpenDaylightServiceProvider" ]
+            "OpenDaylightServiceProvider",
+            "NetconfProviderPool",
+            "NetconfSchemaStore" ]
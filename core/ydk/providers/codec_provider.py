@@ -14,19 +14,27 @@
 # limitations under the License.
 # ------------------------------------------------------------------
 import logging
-import pkgutil
 import importlib
+import threading
 
-from ydk import models
 from ydk.types import EncodingFormat
 from ydk.errors import YServiceProviderError
 from ydk.path import Capability as _Capability
 from ydk.path import Repository as _Repository
+from ydk.entity_utils.entity_utils import _read_yang_ns
 
 
 _TRACE_LEVEL_NUM = 5
 _USER_PROVIDED_REPO = "ydk-user-provider-repo"
 
+# Root schemas shared by the provider instances of a thread, keyed by
+# repository, bundle name and bundle capabilities. Values are tuples of
+# repository and root schema, the repository is kept alive with its root
+# schema. A libyang context must not be used by several threads at once,
+# so each thread creates root schemas of its own, kept until it exits.
+_ROOT_SCHEMA_CACHE = threading.local()
+_ROOT_SCHEMA_CACHE_LOCK = threading.Lock()
+
 
 class CodecServiceProvider(object):
     """Python CodecServiceProvider wrapper.
@@ -38,9 +46,13 @@ class CodecServiceProvider(object):
     Attributes:
         logger (logging.Logger): CodecServiceProvider logger.
         encoding (ydk.types.EncodingFormat): Codec encoding format.
-        _root_schema_table (dict(str, ydk.path.RootSchemaNode)): A dictionary
-            of root schemas, key is bundle name or _USER_PROVIDED_REPO, value
-            is corresponding repository.
+        _root_schema_table (dict(str, tuple)): A dictionary of root schema
+            cache keys, key is bundle name or _USER_PROVIDED_REPO, value is
+            the cache key and the arguments creating the root schema.
+
+    Root schemas are created once per thread, repository, bundle and set of
+    bundle capabilities, and shared by all provider instances used in the
+    thread.
     """
 
     def __init__(self, **kwargs):
@@ -72,44 +84,69 @@ class CodecServiceProvider(object):
         """
         if self._user_provided_repo:
             self._initialize_root_schema(bundle_name, self._repo, True)
+            return
 
         if bundle_name in self._root_schema_table:
             return
 
-        self.logger.log(_TRACE_LEVEL_NUM, "Creating repo in path {}".format(models_path))
-        repo = _Repository(models_path)
-        self._initialize_root_schema(bundle_name, repo)
+        self._initialize_root_schema(bundle_name, models_path)
 
     def get_root_schema(self, bundle_name):
-        """Return root_schema for bundle_name.
+        """Return root_schema for bundle_name, which belongs to the calling
+        thread.
 
         Args:
             bundle_name (str): bundle name.
         """
-        if self._user_provided_repo:
-            return self._root_schema_table[_USER_PROVIDED_REPO]
-
-        if bundle_name not in self._root_schema_table:
+        name = bundle_name if not self._user_provided_repo else _USER_PROVIDED_REPO
+        if name not in self._root_schema_table:
             self.logger.error("Root schema not created")
             raise YServiceProviderError(error_msg="Root schema not created")
 
-        return self._root_schema_table[bundle_name]
+        return self._get_root_schema(*self._root_schema_table[name])
 
     def _initialize_root_schema(self, bundle_name, repo, user_provided_repo=False):
         """Update root schema table entry.
 
         Args:
             name (str): bundle name.
-            repo (ydk.path.Repository): default repository or repository provided by the user.
+            repo (ydk.path.Repository or str): repository provided by the user,
+                or location of local YANG models for the default repository.
             user_provided_repo (bool, optional): Defaults to False.
 
         """
         name = bundle_name if not user_provided_repo else _USER_PROVIDED_REPO
-        self.logger.log(_TRACE_LEVEL_NUM, "Initializing root schema for {}".format(name))
-        # TODO: turn on and off libyang logging
-        capabilities = []
-        lookup_tables = self._get_bundle_capability_lookup_table(bundle_name)
-        self._root_schema_table[name] = repo.create_root_schema(lookup_tables, capabilities)
+        if user_provided_repo:
+            repo_key = getattr(repo, 'path', None) or id(repo)
+        else:
+            repo_key = repo
+        capability_map, _ = self._get_bundle_lookup_maps(bundle_name)
+        key = (repo_key, bundle_name, frozenset(capability_map.items()))
+
+        self._root_schema_table[name] = (key, bundle_name, repo, user_provided_repo)
+        self._get_root_schema(*self._root_schema_table[name])
+
+    def _get_root_schema(self, key, bundle_name, repo, user_provided_repo):
+        """Return root schema of the calling thread for key, creating it
+        from repo if needed.
+        """
+        cache = getattr(_ROOT_SCHEMA_CACHE, 'entries', None)
+        if cache is None:
+            cache = _ROOT_SCHEMA_CACHE.entries = {}
+        entry = cache.get(key)
+        if entry is None:
+            # repositories are shared between threads, creation is serialized
+            with _ROOT_SCHEMA_CACHE_LOCK:
+                if not user_provided_repo:
+                    self.logger.log(_TRACE_LEVEL_NUM, "Creating repo in path {}".format(repo))
+                    repo = _Repository(repo)
+                self.logger.log(_TRACE_LEVEL_NUM, "Initializing root schema for {}".format(bundle_name))
+                # TODO: turn on and off libyang logging
+                capabilities = []
+                lookup_tables = self._get_bundle_capability_lookup_table(bundle_name)
+                entry = (repo, repo.create_root_schema(lookup_tables, capabilities))
+            cache[key] = entry
+        return entry[1]
 
     def _get_bundle_yang_ns(self, bundle_name):
         """Search installed local ydk-models python packages, and return _yang_ns
@@ -121,16 +158,29 @@ class CodecServiceProvider(object):
             mod_yang_ns (module): bundle's _yang_ns module.
         """
         mod_yang_ns = None
-        for (_, name, ispkg) in pkgutil.iter_modules(models.__path__):
-            if ispkg and name == bundle_name:
-                try:
-                    mod_yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(name))
-                    break
-                except ImportError:
-                    continue
+        try:
+            mod_yang_ns = importlib.import_module('ydk.models.{}._yang_ns'.format(bundle_name))
+        except ImportError:
+            pass
 
         return mod_yang_ns
 
+    def _get_bundle_lookup_maps(self, bundle_name):
+        """Return capability and namespace lookup maps of bundle, from the
+        persistent schema cache if enabled, or from bundle's _yang_ns.
+
+        Args:
+            bundle_name (str): bundle name.
+
+        Returns:
+            tuple of capability map and namespace map, empty if the bundle
+            is not installed.
+        """
+        state = _read_yang_ns(bundle_name)
+        if state is None:
+            return {}, {}
+        return state['capabilities'], state['namespace_lookup']
+
     def _get_bundle_capability_lookup_table(self, bundle_name):
         """Search installed local ydk-models python packages, and return corresponding
         capability lookup tables.
@@ -143,19 +193,16 @@ class CodecServiceProvider(object):
         """
         name_namespace_lookup = {}
 
-        mod_yang_ns = self._get_bundle_yang_ns(bundle_name)
-        if mod_yang_ns is not None:
-            capability_map = mod_yang_ns.__dict__['CAPABILITIES']
-            namespace_map = mod_yang_ns.__dict__['NAMESPACE_LOOKUP']
-            for d in (capability_map, namespace_map):
-                name_namespace_lookup.update(d)
+        capability_map, namespace_map = self._get_bundle_lookup_maps(bundle_name)
+        for d in (capability_map, namespace_map):
+            name_namespace_lookup.update(d)
 
-            for name in capability_map:
-                cap = _Capability(name, capability_map[name])
-                name_namespace_lookup[name] = cap
-                # submodule
-                if name in namespace_map:
-                    name_namespace_lookup[namespace_map[name]] = cap
+        for name in capability_map:
+            cap = _Capability(name, capability_map[name])
+            name_namespace_lookup[name] = cap
+            # submodule
+            if name in namespace_map:
+                name_namespace_lookup[namespace_map[name]] = cap
 
         return name_namespace_lookup
 
@@ -170,12 +217,9 @@ class CodecServiceProvider(object):
             capabilities (list): List of ydk.path.Capability available for this bundle.
         """
         capabilities = []
-        capability_map = {}
 
-        mod_yang_ns = self._get_bundle_yang_ns(bundle_name)
-        if mod_yang_ns is not None:
-            capability_map = mod_yang_ns.__dict__['CAPABILITIES']
-            for name in capability_map:
-                capabilities.append(_Capability(name, capability_map[name]))
+        capability_map, _ = self._get_bundle_lookup_maps(bundle_name)
+        for name in capability_map:
+            capabilities.append(_Capability(name, capability_map[name]))
 
         return capabilities
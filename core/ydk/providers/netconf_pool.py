@@ -0,0 +1,318 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Pool of NETCONF service providers.
+
+Setting up a NetconfServiceProvider connects to the device, exchanges
+capabilities and builds a root schema from the device models. The pool
+keeps providers open after use and hands them out again for the same
+device and credentials, so this cost is paid once per session rather than
+once per job.
+"""
+import contextlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from ydk.errors import YClientError, YServiceProviderError
+from ydk.errors.error_handler import handle_runtime_error as _handle_error
+from ydk.ext.providers import NetconfServiceProvider
+
+
+_KEEPALIVE_FILTER = ('<netconf-state xmlns="urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring">'
+                     '<datastores/></netconf-state>')
+
+logger = logging.getLogger(__name__)
+
+
+def _keepalive(provider):
+    """Send a small get request over the provider session."""
+    session = provider.get_session()
+    rpc = session.get_root_schema().create_rpc("ietf-netconf:get")
+    rpc.get_input_node().create_datanode("filter", _KEEPALIVE_FILTER)
+    rpc(session)
+
+
+def _close_session(provider):
+    """Close the provider session with a close-session request."""
+    session = provider.get_session()
+    rpc = session.get_root_schema().create_rpc("ietf-netconf:close-session")
+    rpc(session)
+
+
+class _PooledProvider(object):
+    __slots__ = ('provider', 'key', 'created', 'last_used', 'idle')
+
+    def __init__(self, provider, key):
+        self.provider = provider
+        self.key = key
+        self.created = self.last_used = time.time()
+        self.idle = False
+
+
+class NetconfProviderPool(object):
+    """Pool of NetconfServiceProvider instances keyed by device and credentials.
+
+    Args:
+        max_size (int): Maximum number of providers per key, in use or idle.
+        max_idle (float, optional): Idle providers are closed after that many
+            seconds, defaults to 300. Expired providers of all devices are
+            closed on every acquire and release, see expire.
+        max_lifetime (float, optional): Providers are closed instead of
+            returned to the pool once they are that many seconds old.
+        keepalive_interval (float, optional): Providers idle for longer are
+            checked with a keepalive request before being handed out; None
+            disables the check. Defaults to 30.
+        keepalive (callable, optional): Check run on a provider, raising an
+            exception if its session is not usable. Defaults to a NETCONF get
+            with a filter selecting the ietf-netconf-monitoring datastores.
+        close_session (callable, optional): Closes the session of a provider
+            dropped from the pool. Defaults to a NETCONF close-session.
+        schema_store (ydk.providers.NetconfSchemaStore, optional): Store of
+            YANG modules used by new providers.
+
+    Example:
+        >>> pool = NetconfProviderPool(max_size=2)
+        >>> with pool.provider('10.0.0.1', 'admin', 'admin') as provider:
+        ...     crud.read(provider, Interfaces())
+    """
+
+    def __init__(self, max_size=4, max_idle=300, max_lifetime=None,
+                 keepalive_interval=30, keepalive=_keepalive, schema_store=None,
+                 close_session=_close_session):
+        if max_size < 1:
+            raise YServiceProviderError("Pool size must be at least 1")
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.keepalive_interval = keepalive_interval
+        self._keepalive = keepalive
+        self._close_session = close_session
+        self._schema_store = schema_store
+        self._cond = threading.Condition()
+        self._idle = {}
+        # heap of expiry time, sequence, last use and idle entry
+        self._expiries = []
+        self._sequence = itertools.count()
+        self._sizes = {}
+        self._in_use = {}
+        self._closed = False
+
+    def acquire(self, address, username, password=None, port=830, wait_timeout=None, **kwargs):
+        """Return a provider connected to address with given credentials.
+
+        A matching idle provider is reused if its session is healthy,
+        otherwise a new provider is created. Remaining keyword arguments are
+        passed to NetconfServiceProvider, and are part of the pool key.
+
+        Args:
+            address (str): Device address.
+            username (str): Username.
+            password (str, optional): Password, omitted with key authentication.
+            port (int): Device port, defaults to 830.
+            wait_timeout (float, optional): Seconds to wait for a provider
+                when max_size providers of the key are in use; waits
+                indefinitely by default.
+
+        Raises:
+            YServiceProviderError if no provider became available in time or
+            the pool is closed.
+        """
+        params = dict(kwargs, address=address, username=username, port=port)
+        if password is not None:
+            params['password'] = password
+        key = tuple(sorted(params.items()))
+
+        while True:
+            entry = self._checkout(key, wait_timeout)
+            if entry is None:
+                break
+            if self._is_healthy(entry):
+                return self._lend(entry)
+            self._discard(entry)
+
+        try:
+            if self._schema_store is not None:
+                provider = self._schema_store.provider(**params)
+            else:
+                with _handle_error():
+                    provider = NetconfServiceProvider(**params)
+        except BaseException:
+            with self._cond:
+                self._shrink(key)
+            raise
+        return self._lend(_PooledProvider(provider, key))
+
+    def release(self, provider, discard=False):
+        """Return provider to the pool.
+
+        Args:
+            provider (ydk.providers.NetconfServiceProvider): Provider returned
+                by acquire.
+            discard (bool): Close the provider instead, for instance after a
+                connection error.
+        """
+        with self._cond:
+            entry = self._in_use.pop(id(provider), None)
+            if entry is None:
+                raise YServiceProviderError("Provider does not belong to the pool")
+            expired = self._expire()
+            now = time.time()
+            expiry = self._expiry(entry, now)
+            if discard or self._closed or expiry <= now:
+                self._shrink(entry.key)
+                expired.append(entry)
+            else:
+                entry.last_used = now
+                entry.idle = True
+                self._idle.setdefault(entry.key, []).append(entry)
+                if expiry != float('inf'):
+                    heapq.heappush(self._expiries, (expiry, next(self._sequence), now, entry))
+                self._cond.notify_all()
+        self._close(expired)
+
+    @contextlib.contextmanager
+    def provider(self, address, username, password=None, port=830, wait_timeout=None, **kwargs):
+        """Context manager acquiring and releasing a provider.
+
+        The provider is closed instead of returned to the pool if a client or
+        service provider error is raised within the context.
+        """
+        provider = self.acquire(address, username, password, port, wait_timeout, **kwargs)
+        discard = False
+        try:
+            yield provider
+        except (YClientError, YServiceProviderError):
+            discard = True
+            raise
+        finally:
+            self.release(provider, discard)
+
+    def close(self):
+        """Close idle providers, and providers in use once released."""
+        with self._cond:
+            self._closed = True
+            entries = [e for idle in self._idle.values() for e in idle]
+            for entry in entries:
+                entry.idle = False
+                self._shrink(entry.key)
+            self._idle.clear()
+            self._expiries = []
+        self._close(entries)
+
+    def expire(self):
+        """Close idle providers past max_idle or max_lifetime, of any device.
+
+        This runs on every acquire and release; call it periodically to close
+        sessions while the pool is not used.
+        """
+        with self._cond:
+            expired = self._expire()
+        self._close(expired)
+
+    def _checkout(self, key, wait_timeout):
+        """Return idle entry for key, or None after reserving room for a new
+        provider."""
+        deadline = None if wait_timeout is None else time.time() + wait_timeout
+        expired = []
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise YServiceProviderError("Provider pool is closed")
+                    expired.extend(self._expire())
+                    idle = self._idle.get(key)
+                    if idle:
+                        entry = idle.pop()
+                        entry.idle = False
+                        break
+                    if self._sizes.get(key, 0) < self.max_size:
+                        self._sizes[key] = self._sizes.get(key, 0) + 1
+                        entry = None
+                        break
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise YServiceProviderError(
+                            "Timed out waiting for a provider to {}".format(dict(key)['address']))
+                    self._cond.wait(remaining)
+        finally:
+            self._close(expired)
+        return entry
+
+    def _expiry(self, entry, last_used):
+        """Return the time entry expires at when idle since last_used."""
+        expiry = float('inf')
+        if self.max_idle is not None:
+            expiry = last_used + self.max_idle
+        if self.max_lifetime is not None:
+            expiry = min(expiry, entry.created + self.max_lifetime)
+        return expiry
+
+    def _expire(self):
+        """Drop idle entries of all keys past their expiry, and return them
+        to be closed; the caller holds the lock.
+
+        Entries handed out since they were queued for expiry are skipped.
+        """
+        expired = []
+        now = time.time()
+        while self._expiries and self._expiries[0][0] <= now:
+            _, _, last_used, entry = heapq.heappop(self._expiries)
+            if entry.idle and entry.last_used == last_used:
+                entry.idle = False
+                self._idle[entry.key].remove(entry)
+                self._shrink(entry.key)
+                expired.append(entry)
+        return expired
+
+    def _is_healthy(self, entry):
+        if (self.keepalive_interval is None or
+                time.time() - entry.last_used < self.keepalive_interval):
+            return True
+        try:
+            self._keepalive(entry.provider)
+        except Exception as err:
+            logger.debug("Dropping pooled provider to {}: {}".format(dict(entry.key)['address'], err))
+            return False
+        return True
+
+    def _lend(self, entry):
+        with self._cond:
+            self._in_use[id(entry.provider)] = entry
+        return entry.provider
+
+    def _discard(self, entry):
+        """Drop entry and close its session."""
+        with self._cond:
+            self._shrink(entry.key)
+        self._close([entry])
+
+    def _close(self, entries):
+        """Close sessions of entries dropped from the pool, without the lock."""
+        for entry in entries:
+            try:
+                self._close_session(entry.provider)
+            except Exception as err:
+                logger.debug("Could not close pooled provider to {}: {}".format(
+                    dict(entry.key)['address'], err))
+
+    def _shrink(self, key):
+        self._sizes[key] -= 1
+        if self._sizes[key] == 0:
+            del self._sizes[key]
+            self._idle.pop(key, None)
+        self._cond.notify_all()
@@ -0,0 +1,231 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""On-disk store of YANG modules used by NETCONF sessions.
+
+A NetconfServiceProvider looks up the modules advertised by a device in
+its repository directory and downloads the missing ones with get-schema.
+NetconfSchemaStore gives all providers one repository directory, shared
+across processes, where each module revision is stored once; sessions to
+devices advertising an already seen capability set find all of their
+modules on disk.
+
+Capability sets seen in device hellos are recorded under a fingerprint of
+their modules, revisions, features and deviations, as JSON manifests
+listing the SHA-256 digest of each module file. Schemas are still compiled
+once per session: the core library has no way to load a compiled schema.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+try:
+    from urllib.parse import parse_qs
+except ImportError:
+    from urlparse import parse_qs
+
+from ydk.errors.error_handler import handle_runtime_error as _handle_error
+from ydk.ext.providers import NetconfServiceProvider
+from ydk.path import Repository
+from ydk.entity_utils.entity_utils import _iter_bundles, _read_yang_ns
+
+_MANIFEST_VERSION = 1
+
+if sys.version_info < (3, 0):
+    _STRING_TYPES = (str, unicode)
+else:
+    _STRING_TYPES = (str,)
+
+
+def _parse_capability(capability):
+    """Return module, revision, features and deviations of a module
+    capability, or None for other capabilities."""
+    if '?' not in capability:
+        return None
+    query = parse_qs(capability.split('?', 1)[1])
+    module = query.get('module', [None])[0]
+    if module is None:
+        return None
+    features = sorted(f for v in query.get('features', []) for f in v.split(','))
+    deviations = sorted(d for v in query.get('deviations', []) for d in v.split(','))
+    return (module, query.get('revision', [''])[0], tuple(features), tuple(deviations))
+
+
+def _get_modules(capabilities):
+    """Return sorted module tuples of capabilities, see _parse_capability."""
+    return sorted(set(m for m in (_parse_capability(c) for c in capabilities) if m is not None))
+
+
+def _get_file_name(module, revision):
+    return '{}@{}.yang'.format(module, revision) if revision else module + '.yang'
+
+
+class NetconfSchemaStore(object):
+    """Store of YANG modules shared by NETCONF providers.
+
+    Args:
+        directory (str, optional): Store location, defaults to
+            '~/.ydk/netconf-schemas'.
+
+    Example:
+        >>> store = NetconfSchemaStore()
+        >>> store.seed('cisco_ios_xr')
+        >>> provider = store.provider('10.0.0.1', 'admin', 'admin')
+    """
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = os.path.join(os.path.expanduser('~'), '.ydk', 'netconf-schemas')
+        self.directory = directory
+        self.modules_dir = os.path.join(directory, 'modules')
+        self.sets_dir = os.path.join(directory, 'capability-sets')
+        for d in (self.modules_dir, self.sets_dir):
+            if not os.path.isdir(d):
+                os.makedirs(d)
+
+    def repository(self):
+        """Return a repository over the store modules."""
+        return Repository(self.modules_dir)
+
+    def provider(self, address, username, password=None, port=830, **kwargs):
+        """Return NetconfServiceProvider using the store repository, and
+        record the capability set of the device.
+
+        Remaining keyword arguments are passed to NetconfServiceProvider.
+        """
+        params = dict(kwargs, repo=self.repository(), address=address, username=username, port=port)
+        if password is not None:
+            params['password'] = password
+        with _handle_error():
+            provider = NetconfServiceProvider(**params)
+        self.record(provider.get_capabilities())
+        return provider
+
+    def fingerprint(self, capabilities):
+        """Return fingerprint of the module capabilities of a hello message,
+        which does not depend on their order."""
+        modules = [list(m[:2]) + [list(m[2]), list(m[3])] for m in _get_modules(capabilities)]
+        return hashlib.sha256(json.dumps(modules).encode('utf-8')).hexdigest()
+
+    def record(self, capabilities):
+        """Record capability set with the digests of its modules in the
+        store, unless it is known already.
+
+        Returns:
+            Fingerprint of the capability set.
+        """
+        fingerprint = self.fingerprint(capabilities)
+        if self.is_known(capabilities):
+            return fingerprint
+        modules = []
+        for module, revision, features, deviations in _get_modules(capabilities):
+            file_name = _get_file_name(module, revision)
+            modules.append({'module': module, 'revision': revision,
+                            'features': list(features), 'deviations': list(deviations),
+                            'file': file_name, 'sha256': self._digest(file_name)})
+        manifest = {'version': _MANIFEST_VERSION, 'modules': modules}
+        self._write(os.path.join(self.sets_dir, fingerprint + '.json'),
+                    json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+        return fingerprint
+
+    def is_known(self, capabilities):
+        """Return True if the capability set was recorded with all of its
+        modules, and these are unchanged in the store."""
+        manifest = self._read_manifest(self.fingerprint(capabilities))
+        if manifest is None:
+            return False
+        for entry in manifest['modules']:
+            if entry['sha256'] is None or self._digest(entry['file']) != entry['sha256']:
+                return False
+        return True
+
+    def missing_modules(self, capabilities):
+        """Return names of the modules of capabilities absent from the store,
+        as 'module@revision'."""
+        missing = []
+        for module in _get_modules(capabilities):
+            file_name = _get_file_name(module[0], module[1])
+            if not os.path.exists(os.path.join(self.modules_dir, file_name)):
+                missing.append(file_name[:-len('.yang')])
+        return sorted(set(missing))
+
+    def seed(self, bundle=None):
+        """Copy YANG modules of installed bundles into the store.
+
+        Args:
+            bundle (str, optional): Bundle name, all installed bundles by default.
+
+        Returns:
+            Number of modules added.
+        """
+        added = 0
+        for name, bundle_dir in _iter_bundles():
+            if bundle is not None and name != bundle:
+                continue
+            state = _read_yang_ns(name)
+            yang_dir = os.path.join(bundle_dir, '_yang')
+            if state is None or not os.path.isdir(yang_dir):
+                continue
+            for module, revision in state['capabilities'].items():
+                source = os.path.join(yang_dir, module + '.yang')
+                target = os.path.join(self.modules_dir, _get_file_name(module, revision))
+                if os.path.exists(source) and not os.path.exists(target):
+                    with open(source, 'rb') as f:
+                        self._write(target, f.read())
+                    added += 1
+        return added
+
+    def _digest(self, file_name):
+        """Return SHA-256 digest of a module file, None if it is absent."""
+        try:
+            with open(os.path.join(self.modules_dir, file_name), 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except (IOError, OSError):
+            return None
+
+    def _read_manifest(self, fingerprint):
+        """Return manifest of the capability set, None if it is absent or
+        not valid; manifests are plain JSON, checked before use."""
+        try:
+            with open(os.path.join(self.sets_dir, fingerprint + '.json'), 'rb') as f:
+                manifest = json.loads(f.read().decode('utf-8'))
+        except (IOError, OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get('version') != _MANIFEST_VERSION:
+            return None
+        modules = manifest.get('modules')
+        if not isinstance(modules, list):
+            return None
+        for entry in modules:
+            if not isinstance(entry, dict) or not isinstance(entry.get('file'), _STRING_TYPES):
+                return None
+            if os.path.basename(entry['file']) != entry['file']:
+                return None
+            if not isinstance(entry.get('sha256'), _STRING_TYPES + (type(None),)):
+                return None
+        return manifest
+
+    def _write(self, path, content):
+        """Write file atomically, as other processes may read the store."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.rename(tmp_path, path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
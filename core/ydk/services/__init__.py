@@ -18,8 +18,13 @@ from .codec_service import CodecService
 from .crud_service import CRUDService
 from .netconf_service import NetconfService
 from .executor_service import ExecutorService
+from .fanout_service import FanoutService, DeviceResult
+from .read_cache import ReadCache
+from .netconf_pipeline import NetconfPipeline
 from ydk.ext.services import Datastore
 
 
 __all__ = [ "CodecService", "CRUDService",
-            "ExecutorService", "NetconfService", "Datastore" ]
+            "ExecutorService", "NetconfService", "Datastore",
+            "FanoutService", "DeviceResult", "ReadCache",
+            "NetconfPipeline" ]
@@ -15,8 +15,13 @@
 # ------------------------------------------------------------------
 
 import os
+import sys
 import logging
 import importlib
+import threading
+import xml.etree.ElementTree as _ET
+from multiprocessing.pool import ThreadPool as _ThreadPool
+from xml.parsers import expat as _expat
 
 from ydk.entity_utils import get_data_node_from_entity as _get_data_node_from_entity
 from ydk.entity_utils import get_entity_from_data_node as _get_entity_from_data_node
@@ -29,11 +34,21 @@ from ydk.errors import YServiceError as _YServiceError
 from ydk.errors.error_handler import handle_runtime_error as _handle_error
 from ydk.errors.error_handler import check_argument as _check_argument
 from ydk.types import EncodingFormat
+from ydk.types import Entity as _Entity
+from ydk.types.py_types import _attach_shared, _encoding_copy, _lazy_children
 
 
 _TRACE_LEVEL_NUM = 5
 _PAYLOAD_ERROR_MSG = "Codec service only supports one entity per payload, please split payload"
 
+# Codecs are not shared between threads, like the root schemas of
+# CodecServiceProvider; batches run in pools of threads kept for the
+# lifetime of the process, so the codec and root schemas of each worker
+# are reused across calls.
+_CODECS = threading.local()
+_BATCH_POOLS = {}
+_BATCH_POOLS_LOCK = threading.Lock()
+
 
 class CodecService(object):
     """CodecService wrapper.
@@ -104,11 +119,131 @@ class CodecService(object):
 
         with _handle_error():
             data_node = _get_data_node_from_entity(entity, root_schema)
-            codec_service = _Codec()
-            result = codec_service.encode(data_node, provider.encoding, pretty)
+            result = _get_codec().encode(data_node, provider.encoding, pretty)
             self.logger.debug("Performing encode operation, resulting in {}".format(result))
             return result
 
+    @_check_argument
+    def encode_batch(self, provider, entity_holder, pretty=True, subtree=False, max_workers=None):
+        """Encode entities from entity_holder in parallel, using a pool of threads.
+
+        Args:
+            provider: An instance of ydk.provider.CodecServiceProvider class.
+            entity_holder: dict(str, ydk.types.Entity) or list(ydk.types.Entity).
+            pretty: Pretty formatting of payload string, default - True.
+            subtree: Bool flag, which specifies encode to XML subtree; default= False
+            max_workers: Number of threads, defaults to the number of CPUs.
+
+        Returns:
+            A dict or list, matching entity_holder, of payloads in XML or JSON
+            format. Entities which could not be encoded are mapped to the
+            exception raised for them.
+        """
+        return self._run_batch(
+            lambda entity: self._encode(provider, entity, pretty, subtree),
+            entity_holder, max_workers)
+
+    @_check_argument
+    def decode_batch(self, provider, payload_holder, subtree=False, max_workers=None):
+        """Decode payloads from payload_holder in parallel, using a pool of threads.
+
+        Args:
+            provider: (ydk.providers.CodecServiceProvider): Codec provider.
+            payload_holder: dict(str, str) or list(str) of payloads in XML or JSON format.
+            subtree: (bool) flag, which directs encode to XML subtree; default - False.
+            max_workers: Number of threads, defaults to the number of CPUs.
+
+        Returns:
+            A dict or list, matching payload_holder, of ydk.types.Entity
+            instances. Payloads which could not be decoded are mapped to the
+            exception raised for them.
+        """
+        return self._run_batch(
+            lambda payload: self._decode(provider, payload, subtree),
+            payload_holder, max_workers)
+
+    def _run_batch(self, func, holder, max_workers):
+        """Apply func to the items of holder in a thread pool, preserving
+        their order and collecting errors per item.
+
+        Pools are kept and shared by all calls with the same max_workers, so
+        that each worker thread creates its codec and root schemas once.
+        """
+        if isinstance(holder, dict):
+            keys = list(holder.keys())
+            items = [holder[key] for key in keys]
+        elif isinstance(holder, list):
+            keys = None
+            items = holder
+        else:
+            raise _YServiceError("Batch holder must be a dict or a list, not '{}'".format(type(holder).__name__))
+
+        def run(item):
+            try:
+                return func(item)
+            except Exception as err:
+                self.logger.debug("Batch item failed: {}".format(err))
+                return err
+
+        results = _get_batch_pool(max_workers).map(run, items, chunksize=1)
+
+        if keys is None:
+            return results
+        return dict(zip(keys, results))
+
+    @_check_argument
+    def encode_stream(self, provider, entity, writer, entry_path, pretty=True):
+        """Encode entity to XML payload, writing it in chunks to writer.
+
+        Entries of the list at entry_path are encoded one at a time, so the
+        payload is never held in memory as a whole; the data outside of the
+        list is encoded once, and each entry is encoded on its own under
+        copies of its ancestors holding only their keys. Entity is not
+        modified.
+
+        Args:
+            provider: An instance of ydk.provider.CodecServiceProvider class.
+            entity: (ydk.types.Entity) Top level entity to encode.
+            writer: A file object opened for writing text, or a callable
+                taking each chunk of the payload.
+            entry_path: (str) Names of the nodes from the top level container
+                down to the list, separated by '/'; for example
+                'neighbors/neighbor' for openconfig-bgp.
+            pretty: Pretty formatting of payload, default - True.
+
+        Raises:
+            YServiceError, if the provider encoding is not XML.
+            Instance of YError, if encoding fails.
+        """
+        if provider.encoding != EncodingFormat.XML:
+            raise _YServiceError('Streaming encode can only be used with XML encoding')
+        segments = [seg for seg in entry_path.split('/') if seg]
+        if not segments:
+            raise _YServiceError("Invalid entry path '{}'".format(entry_path))
+        write = writer if callable(writer) else writer.write
+
+        # the payload outside of the lists is encoded once, with the first
+        # entry of each list marking where its entries go
+        entry_lists = []
+        skeleton = _build_skeleton(entity, segments, entry_lists)
+        payload = _to_bytes(self._encode(provider, skeleton, pretty, False))
+        offsets = _get_entry_offsets(payload, segments)
+        if len(offsets) != len(entry_lists):
+            raise _YServiceError("Could not find entries in encoded payload")
+
+        end = 0
+        for (start, next_end), (ancestors, entries) in zip(offsets, entry_lists):
+            write(_to_str(payload[end:start]))
+            top, parent = _build_entry_chain(ancestors, segments)
+            attr = _get_child_attr(parent, segments[-1])
+            for entry in entries:
+                _attach_shared(parent, attr, [entry])
+                entry_payload = _to_bytes(self._encode(provider, top, pretty, False))
+                for entry_start, entry_end in _get_entry_offsets(entry_payload, segments):
+                    write(_to_str(entry_payload[entry_start:entry_end]))
+            end = next_end
+        write(_to_str(payload[end:]))
+
     @_check_argument
     def decode(self, provider, payload_holder, subtree=False):
         """Decode payload in XML or JSON format to YDK entities.
@@ -170,8 +305,7 @@ class CodecService(object):
 
         self.logger.debug("Performing decode operation on payload:\n{}".format(payload))
 
-        codec_service = _Codec()
-        root_data_node = codec_service.decode(root_schema, payload, provider.encoding)
+        root_data_node = _get_codec().decode(root_schema, payload, provider.encoding)
         data_nodes = root_data_node.get_children();
         if data_nodes is None or len(data_nodes) == 0:
             self.logger.debug(_PAYLOAD_ERROR_MSG)
@@ -181,10 +315,250 @@ class CodecService(object):
             _get_entity_from_data_node(data_node, entity)
             return entity
 
+    @_check_argument
+    def decode_stream(self, provider, stream, entry_path):
+        """Decode list entries from XML payload in stream, one at a time.
+
+        The payload is parsed incrementally; each entry of the list at
+        entry_path is decoded and yielded as soon as it is read, so memory
+        usage is bounded by the size of one entry instead of the whole
+        payload.
+
+        Args:
+            provider: (ydk.providers.CodecServiceProvider): Codec provider.
+            stream: A file object or file name of the XML payload.
+            entry_path: (str) Names of the nodes from the top level container
+                down to the list, separated by '/'; for example 'interface'
+                for openconfig-interfaces.
+
+        Returns:
+            A generator of ydk.types.Entity instances, one per list entry.
+            Each entry is attached to a copy of its ancestors, which hold
+            only their key and other leaf values. Entries are decoded with
+            lazy instantiation of child containers, see
+            ydk.types.enable_lazy_children, so containers absent from the
+            payload are only created when accessed.
+
+        Raises:
+            YServiceError, if the provider encoding is not XML.
+            YServiceProviderError, see documentation for `_decode`.
+        """
+        if provider.encoding != EncodingFormat.XML:
+            raise _YServiceError('Streaming decode can only be used with XML encoding')
+        segments = [seg for seg in entry_path.split('/') if seg]
+        if not segments:
+            raise _YServiceError("Invalid entry path '{}'".format(entry_path))
+
+        # elements from the root down to the current element, and how many
+        # of them match entry_path
+        stack = []
+        on_path = 0
+        # prefixes declared in the payload, which could be used in identityref values
+        namespaces = {}
+        for event, element in _ET.iterparse(stream, events=('start', 'end', 'start-ns')):
+            if event == 'start-ns':
+                prefix, uri = element
+                if prefix:
+                    namespaces[prefix] = uri
+                continue
+            if event == 'start':
+                depth = len(stack)
+                if (on_path == depth and 0 < depth <= len(segments)
+                        and _local_name(element.tag) == segments[depth - 1]):
+                    on_path += 1
+                elif depth == 0:
+                    on_path = 1
+                stack.append(element)
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            if on_path == depth + 1:
+                on_path -= 1
+                if depth == len(segments):
+                    payload = _wrap_entry(stack, element, namespaces)
+                    stack[-1].remove(element)
+                    with _lazy_children():
+                        entity = self._decode(provider, payload, False)
+                    yield _get_entry(entity, segments)
+            elif on_path == depth and 0 < depth <= len(segments) and len(element) > 0:
+                # subtree outside of entry_path, only leafs of ancestors are kept
+                stack[-1].remove(element)
+
     def _log_error_and_raise_exception(self, msg, exception_class):
         self.logger.error(msg)
         raise exception_class(msg)
 
+def _get_codec():
+    """Return the codec of the calling thread."""
+    codec = getattr(_CODECS, 'codec', None)
+    if codec is None:
+        codec = _CODECS.codec = _Codec()
+    return codec
+
+
+def _get_batch_pool(max_workers):
+    """Return the shared thread pool with max_workers threads."""
+    with _BATCH_POOLS_LOCK:
+        pool = _BATCH_POOLS.get(max_workers)
+        if pool is None:
+            pool = _BATCH_POOLS[max_workers] = _ThreadPool(max_workers)
+        return pool
+
+
+def _get_child_attr(entity, seg):
+    """Return the attribute name of the child of entity named seg."""
+    if seg not in entity._child_classes:
+        raise _YServiceError("Node '{}' not found in '{}'".format(seg, entity.yang_name))
+    attr, _ = entity._child_classes[seg]
+    return attr
+
+
+def _build_skeleton(entity, segments, entry_lists, ancestors=()):
+    """Return a copy of entity for encoding, in which each list at segments
+    holds only its first entry with data.
+
+    The ancestors and entries of each such list are appended to entry_lists,
+    in the order they are encoded.
+    """
+    attr = _get_child_attr(entity, segments[0])
+    child = entity.__dict__.get(attr)
+    skeleton = _encoding_copy(entity, exclude=(attr,))
+    ancestors = ancestors + (entity,)
+    if child is None:
+        # child was never created, it holds no data
+        return skeleton
+    if len(segments) == 1:
+        if isinstance(child, _Entity):
+            _attach_shared(skeleton, attr, child)
+            return skeleton
+        entries = child.entities()
+        markers = [entry for entry in entries if entry.has_data()][:1]
+        if markers:
+            entry_lists.append((ancestors, entries))
+            _attach_shared(skeleton, attr, markers)
+        else:
+            _attach_shared(skeleton, attr, entries)
+        return skeleton
+
+    is_container = isinstance(child, _Entity)
+    copies = []
+    for child in [child] if is_container else child.entities():
+        copy = _build_skeleton(child, segments[1:], entry_lists, ancestors)
+        copy.parent = skeleton
+        copies.append(copy)
+    _attach_shared(skeleton, attr, copies[0] if is_container else copies)
+    return skeleton
+
+
+def _build_entry_chain(ancestors, segments):
+    """Return copies of the top level entity and of the parent of the list
+    at segments, linked through copies of the ancestors in between; all of
+    them hold only their keys.
+    """
+    top = parent = _encoding_copy(ancestors[0], keys_only=True)
+    for ancestor, child, seg in zip(ancestors, ancestors[1:], segments):
+        attr = _get_child_attr(ancestor, seg)
+        copy = _encoding_copy(child, keys_only=True)
+        copy.parent = parent
+        _attach_shared(parent, attr, copy if isinstance(ancestor.__dict__[attr], _Entity) else [copy])
+        parent = copy
+    return top, parent
+
+
+def _get_entry_offsets(payload, segments):
+    """Return offsets of the elements at segments in XML payload, in
+    document order.
+
+    Each start offset includes the whitespace preceding the element; the
+    end offset is past its end tag.
+    """
+    offsets = []
+    state = {'depth': 0, 'on_path': 0}
+    parser = _expat.ParserCreate()
+
+    def start_element(name, attrs):
+        depth = state['depth']
+        if state['on_path'] == depth and (depth == 0 or (depth <= len(segments)
+                                                         and name.rsplit(':', 1)[-1] == segments[depth - 1])):
+            state['on_path'] += 1
+            if depth == len(segments):
+                start = payload.rfind(b'>', 0, parser.CurrentByteIndex) + 1
+                offsets.append([start, None])
+        state['depth'] += 1
+
+    def end_element(name):
+        state['depth'] -= 1
+        depth = state['depth']
+        if state['on_path'] == depth + 1:
+            state['on_path'] -= 1
+            if depth == len(segments):
+                offsets[-1][1] = payload.index(b'>', parser.CurrentByteIndex) + 1
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.Parse(payload, True)
+    return offsets
+
+
+def _to_bytes(payload):
+    if isinstance(payload, bytes):
+        return payload
+    return payload.encode('utf-8')
+
+
+def _to_str(payload):
+    if sys.version_info < (3, 0):
+        return payload
+    return payload.decode('utf-8')
+
+
+def _local_name(tag):
+    """Return element tag without namespace."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _wrap_entry(ancestors, entry, namespaces):
+    """Return XML payload with entry and copies of its ancestors holding the
+    leafs preceding it, which include list keys.
+    """
+    root = None
+    parent = None
+    for i, ancestor in enumerate(ancestors):
+        child_on_path = ancestors[i + 1] if i + 1 < len(ancestors) else entry
+        copy = _ET.Element(ancestor.tag, ancestor.attrib)
+        for child in ancestor:
+            if child is child_on_path:
+                break
+            if len(child) == 0:
+                copy.append(child)
+        if parent is None:
+            for prefix in namespaces:
+                copy.set('xmlns:{}'.format(prefix), namespaces[prefix])
+            root = copy
+        else:
+            parent.append(copy)
+        parent = copy
+    parent.append(entry)
+    payload = _ET.tostring(root)
+    if not isinstance(payload, str):
+        payload = payload.decode('utf-8')
+    return payload
+
+
+def _get_entry(entity, segments):
+    """Return the list entry at segments under decoded top level entity."""
+    for seg in segments:
+        if seg not in entity._child_classes:
+            raise _YServiceError("Node '{}' not found in '{}'".format(seg, entity.yang_name))
+        attr, _ = entity._child_classes[seg]
+        child = getattr(entity, attr)
+        if not isinstance(child, _Entity):
+            child = child[0]
+        entity = child
+    return entity
+
+
 def _get_yang_path(entity):
     """Return YANG models install location for entity.
 
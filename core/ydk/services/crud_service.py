@@ -13,13 +13,109 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------
+import contextlib
+import itertools
+import logging
+import threading
+
 from ydk.ext.services import CRUDService as _CrudService
 from ydk.errors.error_handler import handle_runtime_error as _handle_error
 from ydk.errors.error_handler import check_argument as _check_argument
-from ydk.errors import YServiceError
-from ydk.types import EntityCollection, Config
+from ydk.errors import YError, YServiceError
+from ydk.types import Entity, EntityCollection, Config
+from ydk.types.py_types import _snapshot
 from ydk.entity_utils import _read_entities
 
+
+# Active batches of the current thread, innermost last.
+_BATCHES = threading.local()
+
+
+def _get_batch(provider):
+    for batch in reversed(getattr(_BATCHES, 'stack', ())):
+        if batch.provider is provider:
+            return batch
+    return None
+
+
+class CrudBatch(object):
+    """Write-behind queue of create, update and delete operations on a
+    provider, see CRUDService.batch.
+
+    Attributes:
+        provider (ydk.ServiceProvider): Provider the operations apply to.
+        failures (list): Tuples of operation name, entity and YError for
+            the operations which failed.
+        requests (int): Number of requests sent to the device.
+    """
+    def __init__(self, crud, provider, max_entities, cache=None):
+        self.provider = provider
+        self.max_entities = max_entities
+        self.failures = []
+        self.requests = 0
+        self._crud = crud
+        self._cache = cache
+        self._pending = []
+        self._count = 0
+
+    def create(self, entity):
+        self._queue('create', entity)
+
+    def update(self, entity):
+        self._queue('update', entity)
+
+    def delete(self, entity):
+        self._queue('delete', entity)
+
+    def flush(self):
+        """Send queued operations to the device.
+
+        Consecutive operations of the same kind are sent in one request of
+        at most max_entities entities. When a request fails, all of its
+        entities are recorded as failed with the error of the request; they
+        are not sent again, as the device may have applied some of them.
+
+        Returns:
+            True if no operation of the batch failed so far.
+        """
+        pending, self._pending = self._pending, []
+        for operation, group in itertools.groupby(pending, key=lambda item: item[0]):
+            group = list(group)
+            for i in range(0, len(group), self.max_entities):
+                chunk = group[i:i + self.max_entities]
+                try:
+                    self._send(operation, [copy for _, _, copy in chunk])
+                except YError as err:
+                    logging.getLogger(__name__).debug(
+                        "Batched {} of {} entities failed: {}".format(operation, len(chunk), err))
+                    self.failures.extend((operation, entity, err) for _, entity, _ in chunk)
+        return not self.failures
+
+    def _queue(self, operation, entity):
+        if isinstance(entity, EntityCollection):
+            entity = entity.entities()
+        entities = entity if isinstance(entity, list) else [entity]
+        self._pending.extend((operation, e, _snapshot(e) if isinstance(e, Entity) else e)
+                             for e in entities)
+        self._count += len(entities)
+        if len(self._pending) >= self.max_entities:
+            self.flush()
+
+    def _send(self, operation, entities):
+        self.requests += 1
+        try:
+            with _handle_error():
+                if operation == 'create':
+                    self._crud.create(self.provider, entities)
+                elif operation == 'update':
+                    self._crud.update(self.provider, entities)
+                else:
+                    self._crud.delete(self.provider, entities)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(self.provider)
+
+
 class CRUDService(_CrudService):
     """
     Python wrapper for CrudService
@@ -38,20 +134,81 @@ class CRUDService(_CrudService):
     Raises:
         Instance of YError in case of operation failure fails.
     """
-    def __init__(self):
+    def __init__(self, cache=None):
         self._crud = _CrudService()
+        self._cache = cache
+
+    @contextlib.contextmanager
+    def batch(self, provider, max_entities=100):
+        """Context manager queuing create, update and delete operations on
+        provider, and sending them on exit in as few requests as possible.
+
+        Within the context, these operations called on this thread with the
+        same provider return True right away. Queued operations are sent
+        once max_entities of them are queued, before read and read_config
+        on the provider, and on exit. If the context exits with an
+        exception, operations still queued are dropped; those sent before
+        remain applied. Entities are copied when queued, so an entity can
+        be changed and queued again for the next operation.
+
+        Args:
+            provider (ydk.ServiceProvider): Service provider.
+            max_entities (int): Maximum number of entities per request.
+
+        Yields:
+            CrudBatch, which can also be used to queue operations.
+
+        Raises:
+            YServiceError on exit if some operations failed, they are listed
+            in the failures attribute of the batch.
+
+        Example:
+            >>> with crud.batch(provider) as batch:
+            ...     for interface in interfaces:
+            ...         crud.create(provider, interface)
+        """
+        if provider is None:
+            raise YServiceError("provider cannot be None")
+        if max_entities < 1:
+            raise YServiceError("max_entities must be at least 1")
+        batch = CrudBatch(self._crud, provider, max_entities, self._cache)
+        if not hasattr(_BATCHES, 'stack'):
+            _BATCHES.stack = []
+        _BATCHES.stack.append(batch)
+        try:
+            yield batch
+        finally:
+            _BATCHES.stack.remove(batch)
+        if not batch.flush():
+            raise YServiceError("{} of {} batched operations failed, first error: {}".format(
+                len(batch.failures), batch._count, batch.failures[0][2]))
 
     @_check_argument
     def create(self, provider, entity):
+        batch = _get_batch(provider)
+        if batch is not None:
+            batch.create(entity)
+            return True
         if isinstance(entity, EntityCollection):
             entity = entity.entities()
-        with _handle_error():
-            return self._crud.create(provider, entity)
+        try:
+            with _handle_error():
+                return self._crud.create(provider, entity)
+        finally:
+            self._invalidate(provider)
 
     def read(self, provider, read_filter=None):
         if provider is None:
             raise YServiceError("provider cannot be None")
+        batch = _get_batch(provider)
+        if batch is not None:
+            batch.flush()
+        if self._cache is not None:
+            return self._cache.fetch(provider, 'get', read_filter,
+                                     lambda: self._read(provider, read_filter))
+        return self._read(provider, read_filter)
 
+    def _read(self, provider, read_filter):
         if read_filter is None:
             with _handle_error():
                 return _read_entities(provider, get_config=False)
@@ -68,7 +225,15 @@ class CRUDService(_CrudService):
     def read_config(self, provider, read_filter=None):
         if provider is None:
             raise YServiceError("provider cannot be None")
+        batch = _get_batch(provider)
+        if batch is not None:
+            batch.flush()
+        if self._cache is not None:
+            return self._cache.fetch(provider, 'get-config', read_filter,
+                                     lambda: self._read_config(provider, read_filter))
+        return self._read_config(provider, read_filter)
 
+    def _read_config(self, provider, read_filter):
         if read_filter is None:
             with _handle_error():
                 return _read_entities(provider)
@@ -84,14 +249,34 @@ class CRUDService(_CrudService):
 
     @_check_argument
     def update(self, provider, entity):
+        batch = _get_batch(provider)
+        if batch is not None:
+            batch.update(entity)
+            return True
         if isinstance(entity, EntityCollection):
             entity = entity.entities()
-        with _handle_error():
-            return self._crud.update(provider, entity)
+        try:
+            with _handle_error():
+                return self._crud.update(provider, entity)
+        finally:
+            self._invalidate(provider)
 
     @_check_argument
     def delete(self, provider, entity):
+        batch = _get_batch(provider)
+        if batch is not None:
+            batch.delete(entity)
+            return True
         if isinstance(entity, EntityCollection):
             entity = entity.entities()
-        with _handle_error():
-            return self._crud.delete(provider, entity)
+        try:
+            with _handle_error():
+                return self._crud.delete(provider, entity)
+        finally:
+            self._invalidate(provider)
+
+    def _invalidate(self, provider):
+        """Drop cached read results of provider, after its configuration was
+        changed."""
+        if self._cache is not None:
+            self._cache.invalidate(provider)
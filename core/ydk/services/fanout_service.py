@@ -0,0 +1,170 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Run one service operation on many devices concurrently."""
+import logging
+import time
+from multiprocessing.pool import ThreadPool as _ThreadPool
+
+from ydk.errors import YServiceError as _YServiceError
+from ydk.ext.services import Datastore
+from ydk.providers.netconf_pool import NetconfProviderPool
+
+from .crud_service import CRUDService
+from .netconf_service import NetconfService
+
+
+class DeviceResult(object):
+    """Outcome of an operation on one device.
+
+    Attributes:
+        device: The provider, or the address of the connection parameters,
+            the operation ran on.
+        result: Value returned by the operation, None if it failed.
+        error (Exception): Exception raised by the operation, None if it
+            succeeded.
+        elapsed (float): Duration in seconds, including connection setup.
+    """
+    __slots__ = ('device', 'result', 'error', 'elapsed')
+
+    def __init__(self, device, result=None, error=None, elapsed=0.0):
+        self.device = device
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = 'ok' if self.ok else repr(self.error)
+        return 'DeviceResult({!r}, {}, {:.3f}s)'.format(self.device, outcome, self.elapsed)
+
+
+class FanoutService(object):
+    """Runs CRUD and Netconf operations on a set of devices with bounded
+    concurrency.
+
+    Devices are given as service providers, or as dicts of connection
+    parameters for NetconfProviderPool.acquire (address, username,
+    password, port, ...). Providers for connection parameters come from the
+    given pool, or from a pool created for the duration of each call.
+
+    Args:
+        max_workers (int): Maximum number of devices handled concurrently,
+            defaults to 16.
+        pool (ydk.providers.NetconfProviderPool, optional): Pool of providers
+            for connection parameters.
+
+    Example:
+        >>> fanout = FanoutService(max_workers=50)
+        >>> results = fanout.create(providers, bgp)
+        >>> failed = [r.device for r in results if not r.ok]
+    """
+    def __init__(self, max_workers=16, pool=None):
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self._pool = pool
+        self._crud = CRUDService()
+        self._netconf = NetconfService()
+
+    def run(self, devices, operation, *args, **kwargs):
+        """Run operation on every device.
+
+        Args:
+            devices (list): Service providers or dicts of connection parameters.
+            operation (str or callable): Name of a CRUDService or
+                NetconfService method, or a callable taking a provider as
+                first argument.
+            *args, **kwargs: Remaining arguments of operation.
+
+        Returns:
+            list(DeviceResult) in the order of devices. Errors raised for a
+            device are recorded in its result and do not stop the others.
+        """
+        func = self._get_operation(operation)
+        devices = list(devices)
+        pool = self._pool
+        if pool is None and any(isinstance(d, dict) for d in devices):
+            pool = NetconfProviderPool(max_size=1)
+
+        def run(device):
+            label = device.get('address') if isinstance(device, dict) else device
+            start = time.time()
+            try:
+                if isinstance(device, dict):
+                    with pool.provider(**device) as provider:
+                        result = func(provider, *args, **kwargs)
+                else:
+                    result = func(device, *args, **kwargs)
+            except Exception as err:
+                self.logger.debug("Operation failed on {}: {}".format(label, err))
+                return DeviceResult(label, error=err, elapsed=time.time() - start)
+            return DeviceResult(label, result, elapsed=time.time() - start)
+
+        workers = _ThreadPool(max(1, min(self.max_workers, len(devices))))
+        try:
+            return workers.map(run, devices, chunksize=1)
+        finally:
+            workers.close()
+            workers.join()
+            if pool is not self._pool:
+                pool.close()
+
+    def create(self, devices, entity):
+        return self.run(devices, self._crud.create, entity)
+
+    def read(self, devices, read_filter=None):
+        return self.run(devices, self._crud.read, read_filter)
+
+    def read_config(self, devices, read_filter=None):
+        return self.run(devices, self._crud.read_config, read_filter)
+
+    def update(self, devices, entity):
+        return self.run(devices, self._crud.update, entity)
+
+    def delete(self, devices, entity):
+        return self.run(devices, self._crud.delete, entity)
+
+    def edit_config(self, devices, config, target=Datastore.candidate, commit=True,
+                    default_operation="", test_option="", error_option=""):
+        """Edit target datastore on every device, then commit if target is
+        the candidate datastore and commit is True.
+
+        Changes committed to the candidate are applied with
+        NetconfService.transaction: running and candidate datastores are
+        locked for the edit and the commit, and the changes of a device are
+        discarded if any of these fails.
+        """
+        if not (commit and target == Datastore.candidate):
+            return self.run(devices, self._netconf.edit_config, target, config,
+                            default_operation, test_option, error_option)
+
+        def edit(provider):
+            with self._netconf.transaction(provider, validate=False) as transaction:
+                transaction.edit_config(config, default_operation, test_option, error_option)
+            return transaction.committed
+
+        return self.run(devices, edit)
+
+    def _get_operation(self, operation):
+        if callable(operation):
+            return operation
+        for service in (self._crud, self._netconf):
+            func = getattr(service, operation, None)
+            if func is not None and not operation.startswith('_'):
+                return func
+        raise _YServiceError("Unknown operation '{}'".format(operation))
@@ -0,0 +1,372 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""NETCONF session sending requests without waiting for replies.
+
+The sessions of NetconfServiceProvider send one request at a time, so a
+session handles at most one request per round trip. NetconfPipeline opens
+its own NETCONF session and keeps several requests in flight, matching
+replies to requests by message-id (RFC 6241 section 4.1), which raises the
+throughput of a session to a distant device by up to the number of
+requests in flight.
+
+The session runs over TCP, or over SSH when paramiko is installed.
+"""
+import concurrent.futures
+import itertools
+import logging
+import re
+import socket
+import threading
+import xml.etree.ElementTree as ET
+
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+from ydk.errors import YClientError, YError, YServiceError, YServiceProviderError
+from ydk.ext.services import Datastore
+from ydk.providers.codec_provider import CodecServiceProvider
+from ydk.types import EncodingFormat, EntityCollection
+
+from .codec_service import CodecService
+
+
+_NC_NS = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_BASE_10 = 'urn:ietf:params:netconf:base:1.0'
+_BASE_11 = 'urn:ietf:params:netconf:base:1.1'
+_EOM = b']]>]]>'
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+_DATASTORES = {Datastore.running: 'running',
+               Datastore.candidate: 'candidate',
+               Datastore.startup: 'startup'}
+
+logger = logging.getLogger(__name__)
+
+
+def _qname(tag):
+    return '{%s}%s' % (_NC_NS, tag)
+
+
+def _strip_declaration(payload):
+    return _XML_DECLARATION.sub('', payload, count=1)
+
+
+class NetconfPipeline(object):
+    """NETCONF session with several requests in flight.
+
+    Args:
+        address (str): Device address.
+        username (str): Username.
+        password (str, optional): Password.
+        port (int): Device port, defaults to 830.
+        protocol (str): 'ssh' or 'tcp', defaults to 'ssh'.
+        max_in_flight (int): Maximum number of requests awaiting a reply,
+            defaults to 16.
+        timeout (float, optional): Connection timeout in seconds.
+        private_key_path (str, optional): Private key for SSH authentication.
+        accept_unknown_host_keys (bool): Accept SSH host keys missing from
+            the system known hosts files. This is insecure, the device is
+            not authenticated; defaults to False, rejecting them.
+
+    Example:
+        >>> with NetconfPipeline('10.0.0.1', 'admin', 'admin') as pipeline:
+        ...     results = pipeline.get([Interfaces(), Bgp()])
+    """
+    def __init__(self, address, username, password=None, port=830, protocol='ssh',
+                 max_in_flight=16, timeout=None, private_key_path=None,
+                 accept_unknown_host_keys=False):
+        self.address = address
+        self._codec = CodecService()
+        self._codec_provider = CodecServiceProvider(type='xml')
+        self._transport = self._connect(address, port, username, password, protocol,
+                                        timeout, private_key_path, accept_unknown_host_keys)
+        self._window = threading.BoundedSemaphore(max_in_flight)
+        self._write_lock = threading.Lock()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._message_ids = itertools.count(1)
+        self._buffer = b''
+        self._closed = False
+
+        self._send_message(self._hello())
+        hello = ET.fromstring(self._receive_message())
+        self.capabilities = [(c.text or '').strip() for c in hello.iter(_qname('capability'))]
+        self.session_id = hello.findtext(_qname('session-id'))
+        self._chunked = _BASE_11 in self.capabilities
+
+        self._reader = threading.Thread(target=self._read_replies, name='ydk-netconf-pipeline')
+        self._reader.daemon = True
+        self._reader.start()
+
+    def submit(self, operation):
+        """Send operation and return a future of its reply.
+
+        Blocks while max_in_flight requests await their reply.
+
+        Args:
+            operation (str): XML of the operation element, sent as the
+                content of the rpc element.
+
+        Returns:
+            concurrent.futures.Future of the rpc-reply element
+            (xml.etree.ElementTree.Element). The future raises YServiceError
+            if the reply holds an rpc-error.
+        """
+        if self._closed:
+            raise YClientError("NETCONF pipeline to {} is closed".format(self.address))
+        self._window.acquire()
+        return self._send_request(operation, True)
+
+    def get(self, read_filters, timeout=None):
+        """Read state and configuration data for each filter, with all
+        requests in flight together.
+
+        Args:
+            read_filters (list(ydk.types.Entity)): Filters, one request each.
+            timeout (float, optional): Seconds to wait for each reply.
+
+        Returns:
+            list of top level entities in the order of read_filters, None
+            when a filter selected no data, or the YError raised for it.
+        """
+        return self._read('<get>{}</get>', read_filters, timeout)
+
+    def get_config(self, read_filters, source=Datastore.running, timeout=None):
+        """Read configuration data of source datastore for each filter, see get."""
+        return self._read('<get-config><source><{}/></source>{{}}</get-config>'.format(
+            self._datastore(source)), read_filters, timeout)
+
+    def edit_config(self, configs, target=Datastore.running, timeout=None):
+        """Send an edit-config per entity of configs, with all requests in
+        flight together.
+
+        Returns:
+            list of True, or the YError raised, in the order of configs.
+        """
+        template = '<edit-config><target><{}/></target><config>{{}}</config></edit-config>'.format(
+            self._datastore(target))
+        futures = []
+        for entity in self._entities(configs):
+            try:
+                futures.append(self.submit(template.format(self._encode(entity))))
+            except YError as err:
+                futures.append(err)
+        return [self._result(f, timeout, lambda reply: True) for f in futures]
+
+    def close(self, timeout=10.0):
+        """Close the session, after the replies to requests in flight.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the reply to
+                close-session; requests still awaiting a reply after that
+                are cancelled. Waits indefinitely if None.
+        """
+        if self._closed:
+            return
+        try:
+            # not limited by max_in_flight, so that closing never waits for a slot
+            self._send_request('<close-session/>', False).result(timeout)
+        except Exception as err:
+            logger.debug("Closing NETCONF pipeline to {}: {}".format(self.address, err))
+        self._closed = True
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, windowed in pending.values():
+            if windowed:
+                self._window.release()
+            future.cancel()
+        self._transport.close()
+        self._reader.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _send_request(self, operation, windowed):
+        """Send operation and return a future of its reply; windowed tells
+        whether the request holds a max_in_flight slot."""
+        future = concurrent.futures.Future()
+        message_id = None
+        try:
+            with self._write_lock:
+                message_id = str(next(self._message_ids))
+                with self._pending_lock:
+                    self._pending[message_id] = (future, windowed)
+                message = '<rpc xmlns="{}" message-id="{}">{}</rpc>'.format(
+                    _NC_NS, message_id, _strip_declaration(operation))
+                self._send_message(message.encode('utf-8'))
+        except Exception as err:
+            with self._pending_lock:
+                self._pending.pop(message_id, None)
+            if windowed:
+                self._window.release()
+            raise YClientError("Could not send request to {}: {}".format(self.address, err))
+        return future
+
+    def _read(self, template, read_filters, timeout):
+        futures = []
+        for entity in self._entities(read_filters):
+            try:
+                read_filter = '<filter type="subtree">{}</filter>'.format(self._encode(entity))
+                futures.append(self.submit(template.format(read_filter)))
+            except YError as err:
+                futures.append(err)
+        return [self._result(f, timeout, self._decode_data) for f in futures]
+
+    def _result(self, future, timeout, convert):
+        if isinstance(future, YError):
+            return future
+        try:
+            return convert(future.result(timeout))
+        except concurrent.futures.TimeoutError:
+            return YClientError("No reply from {} within {} seconds".format(self.address, timeout))
+        except YError as err:
+            return err
+
+    def _entities(self, holder):
+        if isinstance(holder, EntityCollection):
+            return holder.entities()
+        if isinstance(holder, list):
+            return holder
+        return [holder]
+
+    def _encode(self, entity):
+        top = entity
+        while top.parent is not None:
+            top = top.parent
+        return _strip_declaration(self._codec.encode(self._codec_provider, top, False, True))
+
+    def _decode_data(self, reply):
+        data = reply.find(_qname('data'))
+        if data is None or len(data) == 0:
+            return None
+        return self._codec.decode(self._codec_provider, ET.tostring(data[0]).decode('utf-8'), True)
+
+    def _datastore(self, datastore):
+        if datastore not in _DATASTORES:
+            raise YServiceError("Wrong datastore value '{}'".format(datastore))
+        return _DATASTORES[datastore]
+
+    def _connect(self, address, port, username, password, protocol, timeout, private_key_path,
+                 accept_unknown_host_keys):
+        try:
+            if protocol == 'tcp':
+                sock = socket.create_connection((address, port), timeout)
+                sock.settimeout(None)
+                return sock
+            if protocol != 'ssh':
+                raise YServiceProviderError("Unsupported protocol '{}'".format(protocol))
+            if paramiko is None:
+                raise YServiceProviderError("NETCONF pipeline over SSH requires the paramiko package")
+            client = paramiko.SSHClient()
+            client.load_system_host_keys()
+            if accept_unknown_host_keys:
+                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            else:
+                client.set_missing_host_key_policy(paramiko.RejectPolicy())
+            client.connect(address, port, username, password, key_filename=private_key_path,
+                           timeout=timeout, allow_agent=False, look_for_keys=False)
+            channel = client.get_transport().open_session()
+            channel.invoke_subsystem('netconf')
+            channel.ssh_client = client
+            return channel
+        except YError:
+            raise
+        except Exception as err:
+            raise YClientError("Could not connect to {}:{}: {}".format(address, port, err))
+
+    def _hello(self):
+        return ('<hello xmlns="{}"><capabilities><capability>{}</capability>'
+                '<capability>{}</capability></capabilities></hello>').format(
+                    _NC_NS, _BASE_10, _BASE_11).encode('utf-8')
+
+    def _send_message(self, message):
+        if getattr(self, '_chunked', False):
+            message = b'\n#' + str(len(message)).encode('ascii') + b'\n' + message + b'\n##\n'
+        else:
+            message = message + _EOM
+        self._transport.sendall(message)
+
+    def _recv(self):
+        data = self._transport.recv(65536)
+        if not data:
+            raise YClientError("Session to {} closed".format(self.address))
+        self._buffer += data
+
+    def _receive_message(self):
+        if getattr(self, '_chunked', False):
+            return self._receive_chunked()
+        while _EOM not in self._buffer:
+            self._recv()
+        message, self._buffer = self._buffer.split(_EOM, 1)
+        return message
+
+    def _receive_chunked(self):
+        """Return next message in chunked framing, RFC 6242 section 4.2."""
+        chunks = []
+        while True:
+            while True:
+                start = self._buffer.find(b'\n#')
+                end = self._buffer.find(b'\n', start + 2) if start >= 0 else -1
+                if end >= 0:
+                    break
+                self._recv()
+            header = self._buffer[start + 2:end]
+            self._buffer = self._buffer[end + 1:]
+            if header == b'#':
+                return b''.join(chunks)
+            size = int(header)
+            while len(self._buffer) < size:
+                self._recv()
+            chunks.append(self._buffer[:size])
+            self._buffer = self._buffer[size:]
+
+    def _read_replies(self):
+        """Resolve the future of each reply as it arrives."""
+        error = None
+        try:
+            while True:
+                reply = ET.fromstring(self._receive_message())
+                with self._pending_lock:
+                    future, windowed = self._pending.pop(reply.get('message-id'), (None, False))
+                if future is None:
+                    logger.debug("Ignoring reply with unknown message-id {}".format(reply.get('message-id')))
+                    continue
+                if windowed:
+                    self._window.release()
+                if not future.set_running_or_notify_cancel():
+                    # cancelled by the caller
+                    continue
+                rpc_error = reply.find(_qname('rpc-error'))
+                if rpc_error is not None:
+                    future.set_exception(YServiceError(
+                        rpc_error.findtext(_qname('error-message')) or
+                        rpc_error.findtext(_qname('error-tag')) or 'rpc-error'))
+                else:
+                    future.set_result(reply)
+        except Exception as err:
+            error = err if isinstance(err, YError) else YClientError(str(err))
+        self._closed = True
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, windowed in pending.values():
+            if windowed:
+                self._window.release()
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------
+import contextlib
+import itertools
+import logging
+
 from ydk.ext.services import Datastore, NetconfService as _NetconfService
 from ydk.errors import YServiceError as _YServiceError
 from ydk.errors.error_handler import handle_runtime_error as _handle_error
@@ -20,11 +24,163 @@ from ydk.errors.error_handler import handle_runtime_error as _handle_error
 from ydk.types import EntityCollection, Config
 from ydk.entity_utils import _read_entities
 
+
+class NetconfTransaction(object):
+    """Changes to the candidate datastore committed at once, see
+    NetconfService.transaction.
+
+    Attributes:
+        provider (ydk.ServiceProvider): Provider the changes apply to.
+        requests (int): Number of requests sent to the device.
+        committed (bool): True once the changes are committed.
+    """
+    def __init__(self, netconf, provider, lock, validate, confirmed,
+                 confirm_timeout, persist, max_entities):
+        self.provider = provider
+        self.requests = 0
+        self.committed = False
+        self._netconf = netconf
+        self._lock = lock
+        self._validate = validate
+        self._confirmed = confirmed
+        self._confirm_timeout = confirm_timeout
+        self._persist = persist
+        self._max_entities = max_entities
+        self._edits = []
+
+    def edit_config(self, config, default_operation="", test_option="", error_option=""):
+        """Queue config, an entity or a list of entities, for edit-config.
+
+        Entities may carry a yfilter, such as YFilter.delete, to choose their
+        edit operation.
+        """
+        if isinstance(config, EntityCollection):
+            config = config.entities()
+        entities = config if isinstance(config, list) else [config]
+        options = (default_operation, test_option, error_option)
+        self._edits.extend((options, entity) for entity in entities)
+
+    def confirm(self):
+        """Confirm a confirmed commit of the transaction.
+
+        Without persist, the commit is confirmed by a commit on the same
+        session; with persist, by a commit carrying it as persist-id.
+        """
+        self._check_confirmed()
+        if self._persist is None:
+            return self._call(self._netconf.commit)
+        return self._call(self._netconf.commit, False, None, None, self._persist)
+
+    def cancel(self):
+        """Cancel a confirmed commit of the transaction, restoring the
+        previous configuration."""
+        self._check_confirmed()
+        if self._persist is None:
+            return self._call(self._netconf.cancel_commit)
+        return self._call(self._netconf.cancel_commit, self._persist)
+
+    def _check_confirmed(self):
+        if not (self._confirmed and self.committed):
+            raise _YServiceError("Transaction has no confirmed commit")
+
+    def _commit(self):
+        """Lock, edit, validate and commit the candidate datastore; discard
+        the changes if any of these fails while the candidate is locked by
+        the transaction, as it may otherwise hold changes of other
+        sessions."""
+        if not self._edits:
+            return
+        netconf = self._netconf
+        locked = []
+        try:
+            if self._lock:
+                for datastore in (Datastore.running, Datastore.candidate):
+                    self._call(netconf.lock, datastore)
+                    locked.append(datastore)
+            try:
+                for options, group in itertools.groupby(self._edits, key=lambda edit: edit[0]):
+                    entities = [entity for _, entity in group]
+                    size = self._max_entities or len(entities)
+                    for i in range(0, len(entities), size):
+                        chunk = entities[i:i + size]
+                        self._call(netconf.edit_config, Datastore.candidate,
+                                   chunk if len(chunk) > 1 else chunk[0], *options)
+                if self._validate:
+                    self._call(netconf.validate, Datastore.candidate)
+                self._call(netconf.commit, self._confirmed, self._confirm_timeout, self._persist)
+                self.committed = True
+            except Exception:
+                if Datastore.candidate in locked:
+                    try:
+                        self._call(netconf.discard_changes)
+                    except Exception as err:
+                        logging.getLogger(__name__).error(
+                            "Could not discard candidate changes: {}".format(err))
+                raise
+        finally:
+            for datastore in reversed(locked):
+                try:
+                    self._call(netconf.unlock, datastore)
+                except Exception as err:
+                    logging.getLogger(__name__).error(
+                        "Could not unlock {} datastore: {}".format(datastore, err))
+
+    def _call(self, method, *args):
+        self.requests += 1
+        return method(self.provider, *args)
+
+
 class NetconfService(_NetconfService):
     """ Python wrapper for NetconfService
     """
-    def __init__(self):
+    def __init__(self, cache=None):
         self._ns = _NetconfService()
+        self._cache = cache
+
+    @contextlib.contextmanager
+    def transaction(self, provider, lock=True, validate=True, confirmed=False,
+                    confirm_timeout=None, persist=None, max_entities=None):
+        """Context manager collecting edits to the candidate datastore, and
+        applying them on exit in a single commit.
+
+        On exit, running and candidate datastores are locked, queued edits
+        are sent with as few edit-config requests as possible, the candidate
+        is validated and committed, and the datastores are unlocked.
+        Datastores are only locked while the changes are applied, and
+        nothing is sent if the context exits with an exception.
+
+        If a step fails, the changes are discarded before the datastores are
+        unlocked. With lock=False the candidate may also hold changes of
+        other sessions, so it is deliberately left as it is: the caller
+        decides whether to call discard_changes.
+
+        Args:
+            provider (ydk.providers.NetconfServiceProvider): Provider.
+            lock (bool): Lock running and candidate datastores, defaults to
+                True; without locks, failed changes are not discarded.
+            validate (bool): Validate the candidate before commit, defaults to True.
+            confirmed (bool): Use a confirmed commit, to be confirmed or
+                cancelled with the confirm and cancel methods of the
+                transaction, on the same session unless persist is set.
+            confirm_timeout (int, optional): Confirmed commit timeout in seconds.
+            persist (int, optional): Persist id of a confirmed commit.
+            max_entities (int, optional): Maximum number of entities per
+                edit-config, unlimited by default.
+
+        Yields:
+            NetconfTransaction, whose edit_config method queues edits.
+
+        Example:
+            >>> with netconf.transaction(provider) as tx:
+            ...     tx.edit_config(bgp)
+            ...     tx.edit_config(interfaces)
+        """
+        if provider is None:
+            raise _YServiceError("provider cannot be None")
+        transaction = NetconfTransaction(self, provider, lock, validate, confirmed,
+                                         confirm_timeout, persist, max_entities)
+        yield transaction
+        transaction._commit()
 
     def cancel_commit(self, provider, persist_id=None):
         if provider is None:
@@ -33,8 +189,11 @@ class NetconfService(_NetconfService):
         if persist_id is None:
             persist_id = -1
 
-        with _handle_error():
-            return self._ns.cancel_commit(provider, persist_id)
+        try:
+            with _handle_error():
+                return self._ns.cancel_commit(provider, persist_id)
+        finally:
+            self._invalidate(provider)
 
     def close_session(self, provider):
         if provider is None:
@@ -56,29 +215,38 @@ class NetconfService(_NetconfService):
         if persist_id is None:
             persist_id = -1
 
-        with _handle_error():
-            return self._ns.commit(provider, confirmed, confirm_timeout, persist, persist_id)
+        try:
+            with _handle_error():
+                return self._ns.commit(provider, confirmed, confirm_timeout, persist, persist_id)
+        finally:
+            self._invalidate(provider)
 
     def copy_config(self, provider, target, source=None, url="", source_config=None):
         if None in (provider, target) or (source is None and source_config is None):
             raise _YServiceError("provider, target, and source/source_config cannot be None")
 
-        with _handle_error():
-            if isinstance(source, Datastore):
-                return self._ns.copy_config(provider, target, source, url)
-            elif source_config is not None:
-                if isinstance(source_config, EntityCollection):
-                    source_config = source_config.entities()
-                return self._ns.copy_config(provider, target, source_config)
-            else:
-                return self._ns.copy_config(provider, target, source)
+        try:
+            with _handle_error():
+                if isinstance(source, Datastore):
+                    return self._ns.copy_config(provider, target, source, url)
+                elif source_config is not None:
+                    if isinstance(source_config, EntityCollection):
+                        source_config = source_config.entities()
+                    return self._ns.copy_config(provider, target, source_config)
+                else:
+                    return self._ns.copy_config(provider, target, source)
+        finally:
+            self._invalidate(provider)
 
     def delete_config(self, provider, target, url=""):
         if None in (provider, target):
             raise _YServiceError("provider and target cannot be None")
 
-        with _handle_error():
-            return self._ns.delete_config(provider, target, url)
+        try:
+            with _handle_error():
+                return self._ns.delete_config(provider, target, url)
+        finally:
+            self._invalidate(provider)
 
     def discard_changes(self, provider):
         if provider is None:
@@ -93,11 +261,14 @@ class NetconfService(_NetconfService):
         if None in (provider, target, config):
             raise _YServiceError("provider, target, and config cannot be None")
 
-        with _handle_error():
-            if isinstance(config, Config):
-                config = config.entities()
-            return self._ns.edit_config(provider, target, config,
-                default_operation, test_option, error_option)
+        try:
+            with _handle_error():
+                if isinstance(config, Config):
+                    config = config.entities()
+                return self._ns.edit_config(provider, target, config,
+                    default_operation, test_option, error_option)
+        finally:
+            self._invalidate(provider)
 
     def get_config(self, provider, source=Datastore.running, read_filter=None):
         if None in (provider, source):
@@ -120,7 +291,12 @@ class NetconfService(_NetconfService):
     def get(self, provider, read_filter=None):
         if provider is None:
             raise _YServiceError("provider cannot be None")
+        if self._cache is not None:
+            return self._cache.fetch(provider, 'get', read_filter,
+                                     lambda: self._get(provider, read_filter))
+        return self._get(provider, read_filter)
 
+    def _get(self, provider, read_filter):
         if read_filter is None:
             with _handle_error():
                 return _read_entities(provider, get_config=False)
@@ -167,3 +343,9 @@ class NetconfService(_NetconfService):
                 return self._ns.validate(provider, source_config)
             else:
                 return self._ns.validate(provider, source)
+
+    def _invalidate(self, provider):
+        """Drop cached read results of provider, after its configuration may
+        have changed."""
+        if self._cache is not None:
+            self._cache.invalidate(provider)
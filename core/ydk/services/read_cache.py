@@ -0,0 +1,134 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Cache of read results shared by CRUDService and NetconfService."""
+import collections
+import threading
+import time
+
+from ydk.entity_utils import XmlSubtreeCodec
+from ydk.types import EntityCollection
+
+
+class ReadCache(object):
+    """Size bounded cache of read results with expiry.
+
+    Results of CRUDService.read, CRUDService.read_config and
+    NetconfService.get are kept per provider and filter, the filter being
+    identified by its XML subtree encoding. All results for a provider are
+    dropped when configuration is changed through a service using the
+    cache, once the change is sent; results of reads which were in progress
+    meanwhile are not cached.
+
+    Cached results are returned as is to every caller, and must not be
+    modified.
+
+    Args:
+        max_entries (int): Least recently used results are dropped above
+            this number, defaults to 256.
+        ttl (float): Seconds results are kept for, defaults to 5.
+        ttls (dict, optional): Seconds results are kept for, per top level
+            entity class of the filter, overriding ttl. A value of 0
+            disables caching for the class.
+
+    Example:
+        >>> cache = ReadCache(ttl=10, ttls={oc_bgp.Bgp: 60})
+        >>> crud = CRUDService(cache=cache)
+        >>> netconf = NetconfService(cache=cache)
+    """
+    def __init__(self, max_entries=256, ttl=5.0, ttls=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, provider, operation, read_filter, read):
+        """Return cached result of operation, or the result of calling read,
+        which is cached."""
+        entities = self._get_entities(read_filter)
+        ttl = self._get_ttl(entities)
+        if ttl <= 0:
+            return read()
+        key = self._get_key(provider, (operation, type(read_filter)), entities)
+        if key is None:
+            return read()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    del self._entries[key]
+                    self._entries[key] = entry
+                    self.hits += 1
+                    return entry[2]
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        result = read()
+        with self._lock:
+            if generation != self._generation:
+                # configuration may have changed during the read
+                return result
+            # the provider is kept with its results so its id is not reused
+            self._entries[key] = (time.time() + ttl, provider, result)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, provider=None):
+        """Drop cached results of provider, or all results."""
+        with self._lock:
+            self._generation += 1
+            if provider is None:
+                self._entries.clear()
+                return
+            for key in [k for k, entry in self._entries.items() if entry[1] is provider]:
+                del self._entries[key]
+
+    def _get_entities(self, read_filter):
+        if read_filter is None:
+            return []
+        if isinstance(read_filter, EntityCollection):
+            return read_filter.entities()
+        if isinstance(read_filter, list):
+            return read_filter
+        return [read_filter]
+
+    def _get_ttl(self, entities):
+        """Return shortest ttl of the filter entities."""
+        ttls = []
+        for entity in entities:
+            top = entity
+            while top.parent is not None:
+                top = top.parent
+            ttls.append(self.ttls.get(type(top), self.ttl))
+        return min(ttls) if ttls else self.ttl
+
+    def _get_key(self, provider, operation, entities):
+        """Return key of the read, None if a filter can not be encoded."""
+        if not entities:
+            return (id(provider), operation, None)
+        try:
+            root_schema = provider.get_session().get_root_schema()
+            codec = XmlSubtreeCodec()
+            return (id(provider), operation,
+                    tuple(codec.encode(entity, root_schema) for entity in entities))
+        except Exception:
+            return None
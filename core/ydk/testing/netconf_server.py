@@ -0,0 +1,744 @@
+#  ----------------------------------------------------------------
+# Copyright 2016 Cisco Systems
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------
+"""Local NETCONF server standing in for a device.
+
+NetconfServer speaks NETCONF over TCP, advertises the modules of an
+installed YDK bundle and serves them with get-schema, keeps running and
+candidate datastores in memory and answers the base protocol operations
+used by YDK services, including confirmed commits, optionally after a
+delay. It allows providers and services to be exercised and benchmarked
+without a device:
+
+    >>> with NetconfServer('openconfig', latency=0.005) as server:
+    ...     provider = NetconfServiceProvider(address='127.0.0.1',
+    ...                                       username='admin',
+    ...                                       password='admin',
+    ...                                       port=server.port,
+    ...                                       protocol='tcp')
+
+Credentials are not checked and YANG constraints are not validated. List
+entries and leaf-list values are matched using the bundle entity classes.
+Datastore locks follow RFC 6241: a locked datastore is only changed by the
+session holding the lock, and the candidate can not be locked while it has
+uncommitted changes.
+
+The server can also be run on its own:
+
+    python -m ydk.testing.netconf_server --bundle openconfig --port 2023
+"""
+import argparse
+import copy
+import io
+import itertools
+import logging
+import os
+import socket
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+try:
+    import queue
+    import socketserver
+except ImportError:
+    import Queue as queue
+    import SocketServer as socketserver
+
+from ydk.entity_utils.entity_utils import _get_entity_class
+from ydk.entity_utils.entity_utils import _iter_bundles, _read_yang_ns
+from ydk.types import YLeafList
+
+
+_NC_NS = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_MON_NS = 'urn:ietf:params:xml:ns:yang:ietf-netconf-monitoring'
+_BASE_10 = 'urn:ietf:params:netconf:base:1.0'
+_BASE_11 = 'urn:ietf:params:netconf:base:1.1'
+_SERVER_CAPABILITIES = [
+    _BASE_10,
+    _BASE_11,
+    'urn:ietf:params:netconf:capability:candidate:1.0',
+    'urn:ietf:params:netconf:capability:confirmed-commit:1.1',
+    'urn:ietf:params:netconf:capability:writable-running:1.0',
+    'urn:ietf:params:netconf:capability:validate:1.1',
+    _MON_NS + '?module=ietf-netconf-monitoring&revision=2010-10-04',
+]
+_CONFIRM_TIMEOUT = 600
+_EOM = b']]>]]>'
+_OPERATION = '{%s}operation' % _NC_NS
+
+logger = logging.getLogger(__name__)
+
+
+def _qname(tag):
+    return '{%s}%s' % (_NC_NS, tag)
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element, tag):
+    text = element.findtext(_qname(tag))
+    return text.strip() if text is not None else None
+
+
+def _split_tag(tag):
+    if tag.startswith('{'):
+        return tuple(tag[1:].split('}', 1))
+    return (None, tag)
+
+
+class _RpcError(Exception):
+    """Error reported to the client as rpc-error."""
+    def __init__(self, tag, message, error_type='application'):
+        super(_RpcError, self).__init__(message)
+        self.tag = tag
+        self.message = message
+        self.error_type = error_type
+
+
+class _SchemaInfo(object):
+    """Children, list keys and leaf-lists of schema nodes, read from the
+    entity classes of installed bundles.
+    """
+    def __init__(self):
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def top_class(self, element):
+        try:
+            return _get_entity_class(_split_tag(element.tag))
+        except Exception:
+            return None
+
+    def child_class(self, cls, name):
+        return self._info(cls)[0].get(name)
+
+    def key_names(self, cls):
+        return self._info(cls)[1]
+
+    def is_leaf_list(self, cls, name):
+        return name in self._info(cls)[2]
+
+    def _info(self, cls):
+        if cls is None:
+            return ({}, [], frozenset())
+        info = self._classes.get(cls)
+        if info is None:
+            try:
+                entity = cls()
+                children = dict((name.rsplit(':', 1)[-1], child[1])
+                                for name, child in entity._child_classes.items())
+                keys = [entity._leafs[key].name for key in entity.ylist_key_names]
+                leaf_lists = frozenset(leaf.name for leaf in entity._leafs.values()
+                                       if isinstance(leaf, YLeafList))
+                info = (children, keys, leaf_lists)
+            except Exception as err:
+                logger.debug("No schema information from {}: {}".format(cls, err))
+                info = ({}, [], frozenset())
+            with self._lock:
+                self._classes[cls] = info
+        return info
+
+
+class _ConfirmedCommit(object):
+    """Confirmed commit waiting for confirmation, with the running
+    configuration restored if it is cancelled or times out."""
+    def __init__(self, rollback, session_id, persist):
+        self.rollback = rollback
+        self.session_id = session_id
+        self.persist = persist
+        self.timer = None
+
+
+class _Datastores(object):
+    """Running and candidate datastores, with their locks and pending
+    confirmed commit."""
+    def __init__(self, schema):
+        self.schema = schema
+        self.running = ET.Element(_qname('data'))
+        self.candidate = ET.Element(_qname('data'))
+        self.candidate_modified = False
+        self.locks = {}
+        self.confirmed_commit = None
+        self.lock = threading.RLock()
+
+    def get(self, name):
+        if name == 'running':
+            return self.running
+        if name == 'candidate':
+            return self.candidate
+        raise _RpcError('invalid-value', "Datastore '{}' is not supported".format(name))
+
+    def edit(self, target, config, default_operation):
+        """Apply edit-config to target datastore, leaving it unchanged on
+        error."""
+        data = copy.deepcopy(self.get(target))
+        for child in config:
+            self._edit(data, child, default_operation, None, True)
+        self.set(target, data)
+
+    def set(self, target, data):
+        if target == 'running':
+            self.running = data
+            if not self.candidate_modified:
+                self.candidate = copy.deepcopy(data)
+        else:
+            self.get(target)
+            self.candidate = data
+            self.candidate_modified = True
+
+    def commit(self, session_id=None, confirmed=False, timeout=_CONFIRM_TIMEOUT,
+               persist=None, persist_id=None):
+        """Commit the candidate; a confirmed commit is rolled back unless
+        confirmed by a later commit before timeout seconds."""
+        pending = self.confirmed_commit
+        if pending is not None:
+            self._check_confirmed_commit(pending, session_id, persist_id)
+            self._stop_timer(pending)
+        elif persist_id is not None:
+            raise _RpcError('invalid-value', "No confirmed commit with persist-id '{}'".format(persist_id))
+        if confirmed:
+            rollback = pending.rollback if pending is not None else copy.deepcopy(self.running)
+            pending = _ConfirmedCommit(rollback, session_id, persist)
+            pending.timer = threading.Timer(timeout, self._expire, (pending,))
+            pending.timer.daemon = True
+            pending.timer.start()
+            self.confirmed_commit = pending
+        else:
+            self.confirmed_commit = None
+        self.running = copy.deepcopy(self.candidate)
+        self.candidate_modified = False
+
+    def cancel_commit(self, session_id=None, persist_id=None):
+        pending = self.confirmed_commit
+        if pending is None:
+            raise _RpcError('operation-failed', "No confirmed commit in progress")
+        self._check_confirmed_commit(pending, session_id, persist_id)
+        self.rollback()
+
+    def rollback(self):
+        """Restore the running configuration of the pending confirmed
+        commit."""
+        pending = self.confirmed_commit
+        self._stop_timer(pending)
+        self.confirmed_commit = None
+        self.running = pending.rollback
+        self.discard_changes()
+
+    def _check_confirmed_commit(self, pending, session_id, persist_id):
+        if pending.persist is not None:
+            if persist_id != pending.persist:
+                raise _RpcError('invalid-value', "Confirmed commit persist-id '{}' does not match".format(persist_id))
+        elif persist_id is not None:
+            raise _RpcError('invalid-value', "Confirmed commit has no persist-id")
+        elif session_id != pending.session_id:
+            raise _RpcError('in-use', "Confirmed commit is in progress in session {}".format(pending.session_id))
+
+    def _expire(self, pending):
+        with self.lock:
+            if self.confirmed_commit is pending:
+                logger.info("Confirmed commit timed out, restoring running configuration")
+                self.rollback()
+
+    @staticmethod
+    def _stop_timer(pending):
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+    def discard_changes(self):
+        self.candidate = copy.deepcopy(self.running)
+        self.candidate_modified = False
+
+    def _edit(self, parent, element, operation, parent_class, top):
+        operation = element.attrib.get(_OPERATION, operation)
+        name = _local_name(element.tag)
+        cls = self.schema.top_class(element) if top else self.schema.child_class(parent_class, name)
+        match = self._find(parent, element, cls, parent_class)
+
+        if operation in ('delete', 'remove'):
+            if match is not None:
+                parent.remove(match)
+            elif operation == 'delete':
+                raise _RpcError('data-missing', "Data '{}' does not exist".format(name))
+            return
+        if operation == 'create' and match is not None:
+            raise _RpcError('data-exists', "Data '{}' already exists".format(name))
+
+        if match is None:
+            if operation == 'none' and len(element) == 0:
+                return
+            match = ET.SubElement(parent, element.tag)
+        elif operation == 'replace':
+            match.clear()
+
+        if len(element) == 0:
+            if operation != 'none':
+                match.text = element.text
+            return
+        child_operation = 'merge' if operation in ('create', 'replace') else operation
+        for child in element:
+            self._edit(match, child, child_operation, cls, False)
+
+    def _find(self, parent, element, cls, parent_class):
+        """Return the node of parent matching element, or None."""
+        candidates = [node for node in parent if node.tag == element.tag]
+        if not candidates:
+            return None
+        keys = self.schema.key_names(cls)
+        if keys:
+            values = [self._child_text(element, key) for key in keys]
+            for node in candidates:
+                if [self._child_text(node, key) for key in keys] == values:
+                    return node
+            return None
+        if len(element) == 0 and self.schema.is_leaf_list(parent_class, _local_name(element.tag)):
+            for node in candidates:
+                if (node.text or '').strip() == (element.text or '').strip():
+                    return node
+            return None
+        return candidates[0]
+
+    def _child_text(self, element, name):
+        for child in element:
+            if _local_name(child.tag) == name:
+                return (child.text or '').strip()
+        return None
+
+
+def _subtree_filter(nodes, filters):
+    """Return copies of nodes selected by subtree filter elements, as
+    defined in RFC 6241 section 6."""
+    selected = []
+    for node in nodes:
+        for f in filters:
+            result = _filter_node(node, f)
+            if result is not None:
+                selected.append(result)
+                break
+    return selected
+
+
+def _filter_node(node, f):
+    f_ns, f_name = _split_tag(f.tag)
+    ns, name = _split_tag(node.tag)
+    if f_name != name or (f_ns is not None and f_ns != ns):
+        return None
+    if len(f) == 0:
+        text = (f.text or '').strip()
+        if text and text != (node.text or '').strip():
+            return None
+        return copy.deepcopy(node)
+
+    content = [c for c in f if len(c) == 0 and (c.text or '').strip()]
+    others = [c for c in f if c not in content]
+    for c in content:
+        if not any(_filter_node(child, c) is not None for child in node):
+            return None
+    if not others:
+        return copy.deepcopy(node)
+
+    result = ET.Element(node.tag, node.attrib)
+    for child in node:
+        if any(_filter_node(child, c) is not None for c in content):
+            result.append(copy.deepcopy(child))
+    matched = _subtree_filter(list(node), others)
+    if not matched and content:
+        return None
+    if not matched and len(result) == 0:
+        return None
+    result.extend(matched)
+    return result
+
+
+class _Session(socketserver.BaseRequestHandler):
+    """NETCONF session over one client connection."""
+
+    def setup(self):
+        self.buffer = b''
+        self.chunked = False
+        self.session_id = self.server.next_session_id()
+        self.replies = queue.Queue()
+
+    def handle(self):
+        server = self.server.netconf
+        try:
+            self._send(self._hello())
+            hello = self._receive()
+            if hello is None:
+                return
+            capabilities = [(c.text or '').strip() for c in ET.fromstring(hello).iter(_qname('capability'))]
+            self.chunked = _BASE_11 in capabilities
+            sender = threading.Thread(target=self._send_replies)
+            sender.daemon = True
+            sender.start()
+            try:
+                while True:
+                    message = self._receive()
+                    if message is None:
+                        return
+                    reply, operation = server._handle_rpc(message, self.session_id)
+                    self.replies.put((time.time() + server._latency(operation), reply))
+                    if operation == 'close-session':
+                        return
+            finally:
+                self.replies.put(None)
+                sender.join()
+        except (socket.error, ET.ParseError) as err:
+            logger.debug("Session {} ended: {}".format(self.session_id, err))
+        finally:
+            server._end_session(self.session_id)
+
+    def _send_replies(self):
+        """Send replies in order once their latency elapsed, while later
+        requests are already being read and handled."""
+        while True:
+            item = self.replies.get()
+            if item is None:
+                return
+            due, reply = item
+            delay = due - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self._send(reply)
+            except socket.error as err:
+                logger.debug("Session {} reply not sent: {}".format(self.session_id, err))
+
+    def _hello(self):
+        hello = ET.Element(_qname('hello'))
+        capabilities = ET.SubElement(hello, _qname('capabilities'))
+        for capability in self.server.netconf.capabilities:
+            ET.SubElement(capabilities, _qname('capability')).text = capability
+        ET.SubElement(hello, _qname('session-id')).text = str(self.session_id)
+        return ET.tostring(hello)
+
+    def _read(self):
+        data = self.request.recv(65536)
+        if not data:
+            raise socket.error('connection closed')
+        self.buffer += data
+
+    def _receive(self):
+        """Return next message, or None at end of session."""
+        try:
+            if self.chunked:
+                return self._receive_chunked()
+            while _EOM not in self.buffer:
+                self._read()
+        except socket.error:
+            return None
+        message, self.buffer = self.buffer.split(_EOM, 1)
+        message = message.strip()
+        if message.startswith(b'['):
+            # ConfD style TCP header preceding the hello message
+            message = message.split(b']', 1)[1].strip()
+        return message
+
+    def _receive_chunked(self):
+        """Return next message in chunked framing, RFC 6242 section 4.2."""
+        chunks = []
+        while True:
+            while True:
+                start = self.buffer.find(b'\n#')
+                end = self.buffer.find(b'\n', start + 2) if start >= 0 else -1
+                if end >= 0:
+                    break
+                self._read()
+            header = self.buffer[start + 2:end]
+            self.buffer = self.buffer[end + 1:]
+            if header == b'#':
+                return b''.join(chunks)
+            size = int(header)
+            while len(self.buffer) < size:
+                self._read()
+            chunks.append(self.buffer[:size])
+            self.buffer = self.buffer[size:]
+
+    def _send(self, message):
+        if self.chunked:
+            message = b'\n#' + str(len(message)).encode('ascii') + b'\n' + message + b'\n##\n'
+        else:
+            message = message + _EOM
+        self.request.sendall(message)
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, netconf):
+        socketserver.TCPServer.__init__(self, address, _Session)
+        self.netconf = netconf
+        self._session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_session_id(self):
+        with self._lock:
+            return next(self._session_ids)
+
+
+class NetconfServer(object):
+    """In-memory NETCONF server over TCP, see module documentation.
+
+    Args:
+        bundle (str, optional): Name of the installed YDK bundle whose
+            modules are advertised and served; all installed bundles by
+            default.
+        host (str): Address to listen on, defaults to 127.0.0.1.
+        port (int): Port to listen on, an ephemeral port by default.
+        latency (float or dict): Seconds between a request and its reply, or
+            a dict mapping operation names ('get', 'edit-config', ...) to
+            delays, with 'default' used for other operations. Like network
+            latency, it overlaps for requests sent without waiting for
+            replies.
+
+    Attributes:
+        port (int): Port the server listens on.
+        requests (int): Number of RPCs handled.
+    """
+    def __init__(self, bundle=None, host='127.0.0.1', port=0, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self._schema = _SchemaInfo()
+        self._datastores = _Datastores(self._schema)
+        self._yang_files = {}
+        self.capabilities = list(_SERVER_CAPABILITIES)
+        self._load_bundles(bundle)
+        self._server = _TCPServer((host, port), self)
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = None
+
+    def start(self):
+        """Serve requests in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name='ydk-netconf-server')
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        with self._datastores.lock:
+            if self._datastores.confirmed_commit is not None:
+                self._datastores._stop_timer(self._datastores.confirmed_commit)
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _load_bundles(self, bundle):
+        for name, bundle_dir in _iter_bundles():
+            if bundle is not None and name != bundle:
+                continue
+            state = _read_yang_ns(name)
+            if state is None:
+                continue
+            namespaces = state['namespace_lookup']
+            for module, revision in sorted(state['capabilities'].items()):
+                capability = '{}?module={}'.format(namespaces.get(module, module), module)
+                if revision:
+                    capability += '&revision={}'.format(revision)
+                self.capabilities.append(capability)
+            yang_dir = os.path.join(bundle_dir, '_yang')
+            if os.path.isdir(yang_dir):
+                for f in os.listdir(yang_dir):
+                    if f.endswith('.yang'):
+                        module = f[:-len('.yang')].split('@', 1)[0]
+                        self._yang_files.setdefault(module, os.path.join(yang_dir, f))
+
+    def _latency(self, operation):
+        latency = self.latency
+        if isinstance(latency, dict):
+            latency = latency.get(operation, latency.get('default', 0.0))
+        return latency
+
+    def _handle_rpc(self, message, session_id):
+        """Return reply to message and the operation name."""
+        rpc = ET.fromstring(message)
+        reply = ET.Element(_qname('rpc-reply'), rpc.attrib)
+        operation = rpc[0] if len(rpc) else None
+        name = _local_name(operation.tag) if operation is not None else None
+        with self._datastores.lock:
+            self.requests += 1
+            try:
+                handler = getattr(self, '_rpc_' + (name or '').replace('-', '_'), None)
+                if handler is None:
+                    raise _RpcError('operation-not-supported',
+                                    "Operation '{}' is not supported".format(name), 'protocol')
+                data = handler(operation, session_id)
+                if data is None:
+                    ET.SubElement(reply, _qname('ok'))
+                else:
+                    reply.append(data)
+            except _RpcError as err:
+                error = ET.SubElement(reply, _qname('rpc-error'))
+                ET.SubElement(error, _qname('error-type')).text = err.error_type
+                ET.SubElement(error, _qname('error-tag')).text = err.tag
+                ET.SubElement(error, _qname('error-severity')).text = 'error'
+                ET.SubElement(error, _qname('error-message')).text = err.message
+        return ET.tostring(reply), name
+
+    def _end_session(self, session_id):
+        with self._datastores.lock:
+            for datastore, owner in list(self._datastores.locks.items()):
+                if owner == session_id:
+                    del self._datastores.locks[datastore]
+            pending = self._datastores.confirmed_commit
+            if pending is not None and pending.persist is None and pending.session_id == session_id:
+                self._datastores.rollback()
+
+    def _datastore_name(self, operation, tag):
+        node = operation.find(_qname(tag))
+        if node is None or len(node) == 0:
+            raise _RpcError('missing-element', "Missing '{}' datastore".format(tag), 'protocol')
+        return _local_name(node[0].tag)
+
+    def _check_lock(self, datastore, session_id):
+        owner = self._datastores.locks.get(datastore)
+        if owner is not None and owner != session_id:
+            raise _RpcError('in-use', "Datastore '{}' is locked by session {}".format(datastore, owner))
+
+    def _select(self, datastore, operation):
+        data = ET.Element(_qname('data'))
+        f = operation.find(_qname('filter'))
+        if f is None:
+            data.extend(copy.deepcopy(list(datastore)))
+        else:
+            data.extend(_subtree_filter(list(datastore), list(f)))
+        return data
+
+    def _rpc_get(self, operation, session_id):
+        return self._select(self._datastores.running, operation)
+
+    def _rpc_get_config(self, operation, session_id):
+        source = self._datastore_name(operation, 'source')
+        return self._select(self._datastores.get(source), operation)
+
+    def _rpc_edit_config(self, operation, session_id):
+        target = self._datastore_name(operation, 'target')
+        self._check_lock(target, session_id)
+        default_operation = operation.findtext(_qname('default-operation'), 'merge').strip()
+        config = operation.find(_qname('config'))
+        if config is None:
+            raise _RpcError('missing-element', "Missing 'config' element", 'protocol')
+        self._datastores.edit(target, config, default_operation)
+
+    def _rpc_copy_config(self, operation, session_id):
+        target = self._datastore_name(operation, 'target')
+        self._check_lock(target, session_id)
+        source = operation.find(_qname('source'))
+        if source is not None and source.find(_qname('config')) is not None:
+            data = ET.Element(_qname('data'))
+            data.extend(copy.deepcopy(list(source.find(_qname('config')))))
+        else:
+            data = copy.deepcopy(self._datastores.get(self._datastore_name(operation, 'source')))
+        self._datastores.set(target, data)
+
+    def _rpc_delete_config(self, operation, session_id):
+        target = self._datastore_name(operation, 'target')
+        if target == 'running':
+            raise _RpcError('operation-not-supported', "Running datastore can not be deleted")
+        self._check_lock(target, session_id)
+        self._datastores.set(target, ET.Element(_qname('data')))
+
+    def _rpc_commit(self, operation, session_id):
+        self._check_lock('running', session_id)
+        timeout = operation.findtext(_qname('confirm-timeout'))
+        try:
+            timeout = int(timeout) if timeout is not None else _CONFIRM_TIMEOUT
+        except ValueError:
+            raise _RpcError('invalid-value', "Invalid confirm-timeout '{}'".format(timeout))
+        self._datastores.commit(session_id,
+                                operation.find(_qname('confirmed')) is not None,
+                                timeout,
+                                _text(operation, 'persist'),
+                                _text(operation, 'persist-id'))
+
+    def _rpc_discard_changes(self, operation, session_id):
+        self._check_lock('candidate', session_id)
+        self._datastores.discard_changes()
+
+    def _rpc_cancel_commit(self, operation, session_id):
+        self._datastores.cancel_commit(session_id, _text(operation, 'persist-id'))
+
+    def _rpc_validate(self, operation, session_id):
+        return None
+
+    def _rpc_lock(self, operation, session_id):
+        target = self._datastore_name(operation, 'target')
+        self._datastores.get(target)
+        if target in self._datastores.locks:
+            raise _RpcError('lock-denied', "Datastore '{}' is locked by session {}".format(
+                target, self._datastores.locks[target]), 'protocol')
+        if target == 'candidate' and self._datastores.candidate_modified:
+            raise _RpcError('lock-denied', "Candidate datastore has uncommitted changes", 'protocol')
+        self._datastores.locks[target] = session_id
+
+    def _rpc_unlock(self, operation, session_id):
+        target = self._datastore_name(operation, 'target')
+        if self._datastores.locks.get(target) != session_id:
+            raise _RpcError('operation-failed', "Datastore '{}' is not locked by this session".format(target), 'protocol')
+        del self._datastores.locks[target]
+
+    def _rpc_close_session(self, operation, session_id):
+        return None
+
+    def _rpc_kill_session(self, operation, session_id):
+        self._end_session(int(operation.findtext(_qname('session-id'), '0')))
+
+    def _rpc_get_schema(self, operation, session_id):
+        identifier = operation.findtext('{%s}identifier' % _MON_NS)
+        path = self._yang_files.get((identifier or '').strip())
+        if path is None:
+            raise _RpcError('invalid-value', "Schema '{}' is not available".format(identifier))
+        with io.open(path, encoding='utf-8') as f:
+            data = ET.Element('{%s}data' % _MON_NS)
+            data.text = f.read()
+        return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local NETCONF server for YDK testing")
+    parser.add_argument('--bundle', help="YDK bundle to advertise, all installed bundles by default")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2023)
+    parser.add_argument('--latency', type=float, default=0.0, help="reply delay in seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = NetconfServer(args.bundle, args.host, args.port, args.latency)
+    logger.info("Serving NETCONF on {}:{}".format(server.host, server.port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------
 
 from .py_types import Entity, EntityCollection, Config, Filter, YList, YLeafList
+from .py_types import enable_compact_storage, enable_lazy_children
 from ydk.ext.types import Bits
 from ydk.ext.types import ChildrenMap
 from ydk.ext.types import ModelCachingOption
@@ -48,4 +49,6 @@ __all__ = [ "YList",
             "YLeaf",
             "YLeafList",
             "YType",
+            "enable_compact_storage",
+            "enable_lazy_children",
             ]
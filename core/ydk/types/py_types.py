@@ -22,11 +22,17 @@
         - Entity
 """
 from collections import OrderedDict
+import contextlib
 import logging
+import sys
+import threading
 
 from ydk_ import is_set
 from ydk.ext.types import Bits
 from ydk.ext.types import ChildrenMap
+from ydk.ext.types import Decimal64
+from ydk.ext.types import Empty
+from ydk.ext.types import Identity
 from ydk.ext.types import Enum as _Enum
 from ydk.ext.types import YLeaf as _YLeaf
 from ydk.ext.types import YLeafList as _YLeafList
@@ -38,6 +44,440 @@ from ydk.errors import YModelError as _YModelError
 from ydk.errors import YInvalidArgumentError
 from ydk.errors.error_handler import handle_type_error as _handle_type_error
 
+_LAZY_CHILDREN = False
+_COMPACT_STORAGE = False
+
+if sys.version_info < (3, 0):
+    _INTEGER_TYPES = (int, long)
+    _LEAF_VALUE_TYPES = (int, long, float, str, unicode, Bits, Decimal64, Empty, Identity)
+else:
+    _INTEGER_TYPES = (int,)
+    _LEAF_VALUE_TYPES = (int, float, str, bytes, Bits, Decimal64, Empty, Identity)
+
+_INT64_MIN = -2 ** 63
+_UINT64_MAX = 2 ** 64 - 1
+
+
+def enable_lazy_children(enabled=True):
+    """ Enable or disable lazy instantiation of child containers.
+
+    When enabled, child containers of newly created entities are not built
+    by the generated constructor; each one is created on first attribute
+    access (or by get_child_by_name during decode). Until then it is
+    treated as an empty container by has_data, has_operation, get_children
+    and get_order_of_children. Children constructed by user defined
+    subclasses of generated classes are always built right away.
+
+    Args:
+        enabled (bool): True to turn lazy instantiation on, False to turn it off.
+    """
+    global _LAZY_CHILDREN
+    _LAZY_CHILDREN = enabled
+
+
+def enable_compact_storage(enabled=True):
+    """ Enable or disable compact leaf storage for newly created entities.
+
+    When enabled, leaf values of new entities of generated classes are kept
+    in a list indexed by the leaf position in the class metadata, in a slot
+    of the entity, instead of its instance dictionary. Entities without
+    child containers or lists then have no instance dictionary at all.
+    Leafs are still read and assigned as regular attributes.
+
+    Args:
+        enabled (bool): True to turn compact storage on, False to turn it off.
+    """
+    global _COMPACT_STORAGE
+    _COMPACT_STORAGE = enabled
+
+
+class _LeafListValue(list):
+    """ List holding the values of an entity leaf-list.
+
+    Notifies the owning entity when modified in place, so that its cached
+    has_data and has_operation state can be invalidated.
+    """
+    __slots__ = ('_entity',)
+
+    def __init__(self, entity, values=()):
+        super(_LeafListValue, self).__init__(values)
+        self._entity = entity
+
+    def _changed(self):
+        entity = getattr(self, '_entity', None)
+        if entity is not None:
+            entity._invalidate_state()
+
+    def append(self, item):
+        super(_LeafListValue, self).append(item)
+        self._changed()
+
+    def extend(self, items):
+        super(_LeafListValue, self).extend(items)
+        self._changed()
+
+    def insert(self, index, item):
+        super(_LeafListValue, self).insert(index, item)
+        self._changed()
+
+    def remove(self, item):
+        super(_LeafListValue, self).remove(item)
+        self._changed()
+
+    def pop(self, *args):
+        item = super(_LeafListValue, self).pop(*args)
+        self._changed()
+        return item
+
+    def clear(self):
+        del self[:]
+
+    def __setitem__(self, index, item):
+        super(_LeafListValue, self).__setitem__(index, item)
+        self._changed()
+
+    def __delitem__(self, index):
+        super(_LeafListValue, self).__delitem__(index)
+        self._changed()
+
+    def __setslice__(self, i, j, items):
+        super(_LeafListValue, self).__setslice__(i, j, items)
+        self._changed()
+
+    def __delslice__(self, i, j):
+        super(_LeafListValue, self).__delslice__(i, j)
+        self._changed()
+
+    def __iadd__(self, items):
+        result = super(_LeafListValue, self).__iadd__(items)
+        self._changed()
+        return result
+
+    def __imul__(self, count):
+        result = super(_LeafListValue, self).__imul__(count)
+        self._changed()
+        return result
+
+
+def _column_values(column):
+    """ Returns column values as a sequence of python objects; NumPy arrays are converted
+    with their tolist method.
+    """
+    if hasattr(column, 'tolist'):
+        return column.tolist()
+    if isinstance(column, (list, tuple)):
+        return column
+    return list(column)
+
+
+class _LazyChild(object):
+    """ Placeholder for a child container which has not been instantiated yet.
+    """
+    __slots__ = ('entity_class', 'parent')
+
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.parent = None
+
+
+def _set_leaf_value(leaf, value):
+    """ Validate and return value assigned to YLeaf leaf.
+    """
+    if isinstance(value, _Enum.YLeaf):
+        value = value.name
+    elif value is not None and not isinstance(value, _LEAF_VALUE_TYPES):
+        raise _YModelError("Invalid value '{}' of type '{}' for leaf '{}'"
+                           .format(value, type(value).__name__, leaf.name))
+    elif isinstance(value, _INTEGER_TYPES) and not _INT64_MIN <= value <= _UINT64_MAX:
+        raise _YModelError("Value '{}' out of range for leaf '{}'".format(value, leaf.name))
+    return value
+
+
+def _set_bits_value(leaf, value):
+    """ Validate and return value assigned to bits YLeaf leaf.
+    """
+    if isinstance(value, Bits):
+        return value
+    return _set_leaf_value(leaf, value)
+
+
+def _integer_setter(low, high):
+    """ Return function validating values assigned to integer YLeaf leafs,
+    which accept integers from low to high.
+    """
+    def set_integer_value(leaf, value):
+        value = _set_leaf_value(leaf, value)
+        if isinstance(value, _INTEGER_TYPES) and not low <= value <= high:
+            raise _YModelError("Value '{}' out of range for leaf '{}', expected value from {} to {}"
+                               .format(value, leaf.name, low, high))
+        return value
+    return set_integer_value
+
+
+def _leaf_list_setter(set_item_value):
+    """ Return function validating values assigned to YLeafList leafs, with
+    each item validated by set_item_value.
+    """
+    def set_leaf_list_value(leaf, value):
+        if value is None:
+            return value
+        if isinstance(value, _LEAF_VALUE_TYPES) or not hasattr(value, '__iter__'):
+            raise _YModelError("Invalid value '{}' of type '{}' for leaf-list '{}'"
+                               .format(value, type(value).__name__, leaf.name))
+        for item in value:
+            set_item_value(leaf, item)
+        return value
+    return set_leaf_list_value
+
+
+_LEAF_SETTERS = {
+    YType.bits: _set_bits_value,
+    YType.int8: _integer_setter(-2 ** 7, 2 ** 7 - 1),
+    YType.int16: _integer_setter(-2 ** 15, 2 ** 15 - 1),
+    YType.int32: _integer_setter(-2 ** 31, 2 ** 31 - 1),
+    YType.int64: _integer_setter(_INT64_MIN, 2 ** 63 - 1),
+    YType.uint8: _integer_setter(0, 2 ** 8 - 1),
+    YType.uint16: _integer_setter(0, 2 ** 16 - 1),
+    YType.uint32: _integer_setter(0, 2 ** 32 - 1),
+    YType.uint64: _integer_setter(0, _UINT64_MAX),
+}
+_LEAF_LIST_SETTERS = dict((ytype, _leaf_list_setter(_LEAF_SETTERS[ytype])) for ytype in _LEAF_SETTERS)
+_set_leaf_list_value = _leaf_list_setter(_set_leaf_value)
+
+
+def _get_leaf_setter(leaf):
+    """ Return the function used to validate values assigned to leaf.
+    """
+    if isinstance(leaf, _YLeafList):
+        return _LEAF_LIST_SETTERS.get(leaf.type, _set_leaf_list_value)
+    return _LEAF_SETTERS.get(leaf.type, _set_leaf_value)
+
+
+def _copy_leaf(leaf):
+    """ Return an empty copy of leaf; leafs in class metadata are shared
+    by all instances and are never filled in.
+    """
+    return type(leaf)(leaf.type, leaf.name)
+
+
+class _LeafValue(object):
+    """ Class attribute reading the value of a leaf from the compact storage
+    of an entity; values in the instance dictionary take precedence.
+    """
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __get__(self, entity, owner):
+        if entity is None:
+            return self
+        values = entity._values
+        if values is None:
+            return None
+        return values[self.index]
+
+
+class _EntityMetadata(object):
+    """ Schema information shared by every instance of a generated Entity class.
+
+    It is filled in once, by the generated constructor of the first instance
+    of the class, and is not modified afterwards.
+    """
+    __slots__ = ('child_classes', 'child_names', 'child_class_set', 'leafs', 'leaf_names',
+                 'leaf_index', 'leaf_defaults', 'leaf_setters', 'leaf_yang_names',
+                 'children_name_map', 'children_yang_names', 'segment_path', 'absolute_path',
+                 'key_names', 'template')
+
+    def __init__(self):
+        self.child_classes = None
+        self.child_names = ()
+        self.child_class_set = frozenset()
+        self.leafs = None
+        self.leaf_names = ()
+        self.leaf_index = {}
+        self.leaf_defaults = ()
+        self.leaf_setters = {}
+        self.leaf_yang_names = {}
+        self.children_name_map = OrderedDict()
+        self.children_yang_names = set()
+        self.segment_path = None
+        self.absolute_path = None
+        self.key_names = frozenset()
+        self.template = None
+
+
+_METADATA_ATTRS = frozenset(['_child_classes', '_leafs', '_segment_path', '_absolute_path'])
+_METADATA_LOCK = threading.Lock()
+
+
+def _get_metadata(clazz):
+    """ Return metadata for Entity class clazz, creating it on first use.
+    """
+    metadata = clazz.__dict__.get('_metadata')
+    if metadata is None:
+        with _METADATA_LOCK:
+            metadata = clazz.__dict__.get('_metadata')
+            if metadata is None:
+                metadata = _EntityMetadata()
+                clazz._children_name_map = metadata.children_name_map
+                clazz._children_yang_names = metadata.children_yang_names
+                clazz._metadata = metadata
+    return metadata
+
+
+_CONSTRUCTION = threading.local()
+
+
+@contextlib.contextmanager
+def _lazy_children():
+    """ Turn lazy instantiation of child containers on in the calling thread,
+    within the context.
+    """
+    previous = getattr(_CONSTRUCTION, 'lazy', False)
+    _CONSTRUCTION.lazy = True
+    try:
+        yield
+    finally:
+        _CONSTRUCTION.lazy = previous
+
+
+def _get_construction_stack():
+    """ Return the classes of the entities being constructed in this thread,
+    innermost last; None stands for a class which is not generated.
+    """
+    stack = getattr(_CONSTRUCTION, 'stack', None)
+    if stack is None:
+        stack = _CONSTRUCTION.stack = []
+    return stack
+
+
+def _is_generated(clazz):
+    """ Return True if clazz is a generated bundle class, not a subclass
+    defined by the user.
+    """
+    return '_revision' in clazz.__dict__
+
+
+# members of the C++ entity set by generated constructors
+_ENTITY_MEMBERS = ('yang_name', 'yang_parent_name', 'is_top_level_class', 'has_list_ancestor',
+                   'ylist_key_names', 'is_presence_container')
+
+
+class _EntityTemplate(object):
+    """ State of a new entity of a generated class, recorded from the first
+    instance of the class built by its generated constructor.
+
+    Later instances are built from the template without running the
+    generated constructor, which allocates the child classes and leafs
+    maps, the leafs and the path functions of the class only for them to
+    be dropped in favour of class metadata.
+    """
+    __slots__ = ('members', 'attrs', 'leafs', 'children', 'lists')
+
+    def __init__(self, members, leaf_names):
+        self.members = members
+        self.attrs = []
+        self.leafs = leaf_names
+        self.children = []
+        self.lists = []
+
+    def build(self, cls, lazy):
+        """ Return a new entity of cls, with _LazyChild placeholders for its
+        child containers if lazy is set.
+        """
+        # attributes are set one by one, which keeps the instance dictionary
+        # sharing its keys with other instances of cls
+        set_attribute = _Entity.__setattr__
+        entity = cls.__new__(cls)
+        Entity.__init__(entity)
+        for name, value in self.members:
+            set_attribute(entity, name, value)
+        for name in self.attrs:
+            set_attribute(entity, name, None)
+        if entity._values is None:
+            for name in self.leafs:
+                set_attribute(entity, name, None)
+        lazy_children = {}
+        for name, child_class in self.children:
+            if lazy:
+                child = lazy_children[name] = _LazyChild(child_class)
+                child.parent = entity
+            else:
+                child = child_class()
+                child.parent = entity
+                set_attribute(entity, name, child)
+        if lazy_children:
+            set_attribute(entity, '_lazy_children', lazy_children)
+        for name in self.lists:
+            set_attribute(entity, name, YList(entity))
+        return entity
+
+
+def _record_template(entity):
+    """ Return template of the class of entity, None if the state of entity
+    is not the one left by a generated constructor.
+    """
+    metadata = entity._metadata
+    if any(value is not None for value in entity._get_leaf_values()):
+        return None
+    template = _EntityTemplate([(name, getattr(entity, name)) for name in _ENTITY_MEMBERS],
+                               metadata.leaf_names)
+    state = dict(entity.__dict__)
+    for name, placeholder in state.pop('_lazy_children', {}).items():
+        template.children.append((name, placeholder.entity_class))
+    for name, value in state.items():
+        if name in metadata.leaf_setters:
+            continue
+        elif isinstance(value, Entity) and value.parent is entity:
+            template.children.append((name, type(value)))
+        elif isinstance(value, YList):
+            template.lists.append(name)
+        elif value is None:
+            template.attrs.append(name)
+        else:
+            return None
+    return template
+
+
+class _EntityMeta(type(_Entity)):
+    """ Metaclass of Entity.
+
+    Entities of generated classes, other than the first one of each class,
+    are built from the template recorded from the first one, see
+    _EntityTemplate.
+
+    With lazy children enabled, a child container constructed by the
+    generated constructor of its parent class is replaced by a _LazyChild
+    placeholder. Constructors of user defined subclasses, and any other
+    code, always get a fully built entity.
+    """
+    def __call__(cls, *args, **kwargs):
+        lazy = _LAZY_CHILDREN or getattr(_CONSTRUCTION, 'lazy', False)
+        if lazy:
+            stack = _get_construction_stack()
+            if stack and stack[-1] is not None and cls in _get_metadata(stack[-1]).child_class_set:
+                return _LazyChild(cls)
+
+        metadata = None
+        if not (args or kwargs) and _is_generated(cls):
+            metadata = _get_metadata(cls)
+            if metadata.template:
+                return metadata.template.build(cls, lazy)
+
+        if lazy:
+            stack.append(cls if _is_generated(cls) else None)
+            try:
+                entity = super(_EntityMeta, cls).__call__(*args, **kwargs)
+            finally:
+                stack.pop()
+        else:
+            entity = super(_EntityMeta, cls).__call__(*args, **kwargs)
+        if metadata is not None and metadata.template is None:
+            metadata.template = _record_template(entity) or False
+        return entity
+
+
 class YLeafList(_YLeafList):
     """ Wrapper class for YLeafList, add __repr__ and get list slice
     functionalities.
@@ -80,20 +520,60 @@ class YLeafList(_YLeafList):
         rep = [i for i in self.getYLeafs()]
         return "%s('%s', %r)" % (self.__class__.__name__, self.leaf_name, rep)
 
-class Entity(_Entity):
+class Entity(_EntityMeta('_EntityBase', (_Entity,), {})):
     """ Entity wrapper class overrides some of the ydk::Entity methods.
+
+    Schema information (child classes, leafs, children names and paths) is
+    kept in class level metadata shared by all instances of a generated
+    class; instances only hold leaf values and children. With compact
+    storage enabled, leaf values are kept in the '_values' slot, in the
+    order of the leafs in class metadata.
+
+    The results of has_data and has_operation are cached in the '_has_data'
+    and '_has_operation' slots. Assigning a leaf value marks the entity and
+    its ancestors as having data; any other change drops the cached state
+    of the entity and its ancestors, which is then recomputed on demand.
+
+    The children map and the segment path are cached as well; they are
+    dropped when a child or list entry is added or removed, or when a list
+    key leaf is assigned.
     """
+    __slots__ = ('_values', '_has_data', '_has_operation', '_children_cache',
+                 '_segment_path_cache', '_filtered_leaf_values')
+    logger = logging.getLogger("ydk.types.Entity")
+    _child_classes = OrderedDict()
+    _leafs = OrderedDict()
+
     def __init__(self):
         super(Entity, self).__init__()
-        self.logger = logging.getLogger("ydk.types.EntityCollection")
-        self._local_refs = {}
-        self._children_name_map = OrderedDict()
-        self._children_yang_names = set()
-        self._child_classes = OrderedDict()
-        self._leafs = OrderedDict()
-        self._segment_path = lambda : ''
-        self._absolute_path = lambda : ''
-        self.logger = logging.getLogger("ydk.types.Entity")
+        metadata = _get_metadata(type(self))
+        values = None
+        if _COMPACT_STORAGE and _is_generated(type(self)):
+            values = metadata.leaf_defaults
+        _set_values(self, values)
+        _set_has_data(self, None)
+        _set_has_operation(self, None)
+        _set_children_cache(self, None)
+        _set_segment_path_cache(self, None)
+        _set_filtered_leaf_values(self, None)
+
+    def __getattr__(self, name):
+        lazy_children = self.__dict__.get('_lazy_children')
+        if lazy_children is not None and name in lazy_children:
+            placeholder = lazy_children[name]
+            if placeholder.parent is None:
+                # still being wired up by the generated constructor
+                return placeholder
+            return self._materialize_child(name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    def _materialize_child(self, name):
+        placeholder = self.__dict__['_lazy_children'].pop(name)
+        child = placeholder.entity_class()
+        child.parent = self
+        self.__dict__[name] = child
+        self._invalidate_children()
+        return child
 
     def __eq__(self, other):
         if not isinstance(other, Entity):
@@ -109,11 +589,14 @@ class Entity(_Entity):
         return self.get_children()
 
     def get_children(self):
+        children = self._children_cache
+        if children is not None:
+            return children
         children = ChildrenMap()
 
-        for name in self.__dict__:
-            value = self.__dict__[name]
-            if isinstance(value, Entity) and name != '_top_entity':
+        for name in self._metadata.child_names:
+            value = self.__dict__.get(name)
+            if isinstance(value, Entity):
                 if name not in self._children_name_map:
                     continue
                 children[name] = value
@@ -121,20 +604,36 @@ class Entity(_Entity):
                 count=0
                 for v in value:
                     if isinstance(v, Entity):
-                        if v.get_segment_path() not in children:
-                            children[v.get_segment_path()] = v
+                        segment_path = v.get_segment_path()
+                        if segment_path not in children:
+                            children[segment_path] = v
                         else:
-                            children['%s%s' % (v.get_segment_path(), count)] = v
+                            children['%s%s' % (segment_path, count)] = v
                             count += 1
         # store local refs so that pybind11 does not free the object. See https://github.com/pybind/pybind11/issues/673
-        self._local_refs["ydk::children"] = children
+        self._keep_local_ref("ydk::children", children)
+        _set_children_cache(self, children)
         return children
 
+    def _invalidate_children(self):
+        """ Drop cached children map after a child or list entry was added or removed.
+        """
+        _set_children_cache(self, None)
+
+    def _invalidate_path(self):
+        """ Drop cached segment path after a list key leaf was assigned; the
+        children map of the parent is keyed by it.
+        """
+        _set_segment_path_cache(self, None)
+        parent = self.parent
+        if isinstance(parent, Entity):
+            parent._invalidate_children()
+
     def get_order_of_children(self):
         order = []
         for yang_name in self._child_classes:
             name = self._child_classes[yang_name][0]
-            value = self.__dict__[name]
+            value = self.__dict__.get(name)
             if isinstance(value, YList):
                 for v in value:
                     if isinstance(v, Entity):
@@ -164,7 +663,7 @@ class Entity(_Entity):
                 setattr(self, attr, child)
             else:
                 local_reference_key = "ydk::seg::%s" % segment_path
-                self._local_refs[local_reference_key] = child
+                self._keep_local_ref(local_reference_key, child)
                 getattr(self, attr).append(child)
 
             return child
@@ -172,66 +671,133 @@ class Entity(_Entity):
         return None
 
     def has_data(self):
+        state = self._has_data
+        if state is None:
+            state, cacheable = self._compute_has_data()
+            if cacheable:
+                _set_has_data(self, state)
+        return state
+
+    def _compute_has_data(self):
+        """ Return has_data result and whether it can be cached; it can not
+        if it depends on Bits values, which are modified in place.
+        """
         if hasattr(self, 'is_presence_container') and self.is_presence_container:
-            return True
+            return True, True
 
-        for name, value in vars(self).items():
+        cacheable = True
+        for name, value in zip(self._metadata.leaf_names, self._get_leaf_values()):
+            if value is None:
+                continue
             if isinstance(value, _YFilter):
-                return True
-            if name in self._leafs:
-                leaf = self._leafs[name]
-                if isinstance(leaf, _YLeaf):
-                    if value is not None:
-                        if not isinstance(value, Bits) or len(value.get_bitmap()) > 0:
-                            return True
-                elif isinstance(leaf, _YLeafList) and len(value) > 0:
-                    return True
-            if isinstance(value, Entity) and value.has_data():
-                return True
+                return True, True
+            leaf = self._leafs[name]
+            if isinstance(leaf, _YLeaf):
+                if not isinstance(value, Bits):
+                    return True, True
+                cacheable = False
+                if len(value.get_bitmap()) > 0:
+                    return True, False
+            elif isinstance(leaf, _YLeafList) and len(value) > 0:
+                return True, True
+
+        for name in self._metadata.child_names:
+            value = self.__dict__.get(name)
+            if isinstance(value, _YFilter):
+                return True, True
+            children = ()
+            if isinstance(value, Entity):
+                children = (value,)
             elif isinstance(value, YList):
-                for l in value:
-                    if l.has_data():
-                        return True
-        return False
+                children = value
+            for child in children:
+                if child.has_data():
+                    return True, child._has_data is not None
+                cacheable = cacheable and child._has_data is not None
+        return False, cacheable
 
     def has_operation(self):
         if hasattr(self, 'yfilter') and is_set(self.yfilter):
             return True
 
-        for name, value in vars(self).items():
+        state = self._has_operation
+        if state is None:
+            state, cacheable = self._compute_has_operation()
+            if cacheable:
+                _set_has_operation(self, state)
+        return state
+
+    def _compute_has_operation(self):
+        """ Return has_operation result, not counting the yfilter of this
+        entity, and whether it can be cached.
+        """
+        cacheable = True
+        for name, value in zip(self._metadata.leaf_names, self._get_leaf_values()):
             if value is not None:
-                if name in self._leafs:
-                    leaf = self._leafs[name]
-                    isYLeaf = isinstance(leaf, _YLeaf)
-                    isYLeafList = isinstance(leaf, _YLeafList)
-                    isBits = isinstance(value, Bits)
-
-                    if type(value) is _YFilter:
-                        return True
-                    if isYLeaf and (not isBits or len(value.get_bitmap()) > 0):
-                        return True
-                    if isYLeafList and len(value) > 0:
-                        return True
-                elif isinstance(value, Entity):
-                    if is_set(value.yfilter) or value.has_operation():
-                        return True
-                elif isinstance(value, YList):
-                    for v in value:
-                        isEntity = isinstance(v, Entity)
-                        if isEntity and (is_set(v.yfilter) or v.has_operation()):
-                            return True
-        return False
+                leaf = self._leafs[name]
+                isYLeaf = isinstance(leaf, _YLeaf)
+                isYLeafList = isinstance(leaf, _YLeafList)
+                isBits = isinstance(value, Bits)
+
+                if type(value) is _YFilter:
+                    return True, True
+                if isBits:
+                    cacheable = False
+                    if len(value.get_bitmap()) > 0:
+                        return True, False
+                elif isYLeaf:
+                    return True, True
+                if isYLeafList and len(value) > 0:
+                    return True, True
+
+        for name in self._metadata.child_names:
+            value = self.__dict__.get(name)
+            children = ()
+            if isinstance(value, Entity):
+                children = (value,)
+            elif isinstance(value, YList):
+                children = value
+            for child in children:
+                if is_set(child.yfilter) or child.has_operation():
+                    return True, child._has_operation is not None
+                cacheable = cacheable and child._has_operation is not None
+        return False, cacheable
+
+    def _mark_has_data(self):
+        """ Record that this entity, and therefore all its ancestors, has data.
+        """
+        entity = self
+        while entity is not None and not (entity._has_data is True
+                                          and entity._has_operation is True):
+            _set_has_data(entity, True)
+            _set_has_operation(entity, True)
+            entity = entity.parent
+
+    def _invalidate_state(self):
+        """ Drop cached has_data and has_operation state of this entity and
+        its ancestors.
+        """
+        entity = self
+        while entity is not None and (entity._has_data is not None
+                                      or entity._has_operation is not None):
+            _set_has_data(entity, None)
+            _set_has_operation(entity, None)
+            entity = entity.parent
 
     def set_value(self, path, value, name_space='', name_space_prefix=''):
-        for name, leaf in self._leafs.items():
-            if leaf.name == path:
-                if isinstance(leaf, _YLeaf):
-                    if isinstance(self.__dict__[name], Bits):
-                        self.__dict__[name][value] = True
-                    else:
-                        self.__dict__[name] = value
-                elif isinstance(leaf, _YLeafList):
-                    self.__dict__[name].append(value)
+        name = self._metadata.leaf_yang_names.get(path)
+        if name is not None:
+            leaf = self._leafs[name]
+            if isinstance(leaf, _YLeaf):
+                if isinstance(self._get_leaf_value(name), Bits):
+                    self._get_leaf_value(name)[value] = True
+                else:
+                    self._set_leaf_value(name, value)
+                    self._mark_has_data()
+                    if name in self._metadata.key_names:
+                        self._invalidate_path()
+            elif isinstance(leaf, _YLeafList):
+                self._get_leaf_value(name).append(value)
 
     def set_filter(self, path, yfilter):
         pass
@@ -248,19 +814,28 @@ class Entity(_Entity):
 
     def get_name_leaf_data(self):
         leaf_name_data = LeafDataList()
-        for name in self._leafs:
-            value = self.__dict__[name]
+        for name, value in zip(self._metadata.leaf_names, self._get_leaf_values()):
+            if value is None:
+                continue
             leaf = self._leafs[name]
 
             if isinstance(value, _YFilter):
                 self.logger.debug('YFilter assigned to "%s", "%s"' % (name, value))
+                leaf = _copy_leaf(leaf)
                 leaf.yfilter = value
+                prev_value = (self._filtered_leaf_values or {}).get(name)
                 if isinstance(leaf, _YLeaf):
+                    if prev_value is not None:
+                        leaf.set(prev_value)
                     leaf_name_data.append(leaf.get_name_leafdata())
                 elif isinstance(leaf, _YLeafList):
+                    if prev_value is not None:
+                        for item in prev_value:
+                            leaf.append(item)
                     leaf_name_data.extend(leaf.get_name_leafdata())
-            elif (type(value) not in (list, type(None), Bits)
+            elif (not isinstance(value, (list, Bits))
                 or (isinstance(value, Bits) and len(value.get_bitmap()) > 0)):
+                leaf = _copy_leaf(leaf)
                 leaf.set(value)
                 leaf_name_data.append(leaf.get_name_leafdata())
             elif isinstance(value, list) and len(value) > 0:
@@ -281,77 +856,184 @@ class Entity(_Entity):
         return leaf_name_data
 
     def get_segment_path(self):
-        path = self._segment_path()
-        if ("[" in path) and hasattr(self, 'ylist_key_names') and len(self.ylist_key_names) > 0:
-            path = path.split('[')[0]
+        path = self._segment_path_cache
+        if path is not None:
+            return path
+        path = self._metadata.segment_path or ''
+        cacheable = self._metadata.segment_path is not None
+        if self._metadata.key_names:
             for attr_name in self.ylist_key_names:
                 leaf = self._leafs[attr_name]
-                if leaf is not None:
-                    attr_str = format(self.__dict__[attr_name])
-                    if "'" in attr_str:
-                        path += '[{}="{}"]'.format(leaf.name, attr_str)
-                    else:
-                        path += "[{}='{}']".format(leaf.name, attr_str)
+                value = self._get_leaf_value(attr_name)
+                if value is None:
+                    cacheable = False
+                attr_str = format(value)
+                if "'" in attr_str:
+                    path += '[{}="{}"]'.format(leaf.name, attr_str)
                 else:
-                    # should never get here
-                    return self._segment_path()
+                    path += "[{}='{}']".format(leaf.name, attr_str)
+        if cacheable:
+            _set_segment_path_cache(self, path)
         return path
 
     def path(self):
         return self.get_segment_path()
 
     def get_absolute_path(self):
-        return self._absolute_path()
+        prefix = self._metadata.absolute_path
+        if prefix is None:
+            return ''
+        return prefix + self.get_segment_path()
+
+    def _segment_path(self):
+        return self.get_segment_path()
+
+    def _set_metadata(self, name, value):
+        """ Record schema information assigned by the generated constructor
+        in class metadata, the first time it is seen for this class.
+        """
+        clazz = type(self)
+        metadata = _get_metadata(clazz)
+        if name == '_child_classes':
+            if metadata.child_classes is None:
+                metadata.child_names = tuple(value[yang_name][0] for yang_name in value)
+                metadata.child_class_set = frozenset(value[yang_name][1] for yang_name in value)
+                metadata.child_classes = value
+                clazz._child_classes = value
+        elif name == '_leafs':
+            if metadata.leafs is None:
+                metadata.leaf_names = tuple(value)
+                metadata.leaf_index = dict((n, i) for i, n in enumerate(value))
+                metadata.leaf_defaults = (None,) * len(value)
+                metadata.leaf_setters = dict((n, _get_leaf_setter(value[n])) for n in value)
+                metadata.leaf_yang_names = dict((value[n].name, n) for n in value)
+                metadata.leafs = value
+                for index, leaf_name in enumerate(value):
+                    if not isinstance(getattr(clazz, leaf_name, None), _LeafValue):
+                        setattr(clazz, leaf_name, _LeafValue(index))
+                clazz._leafs = value
+            if self._values is not None and len(self._values) != len(metadata.leaf_names):
+                _set_values(self, metadata.leaf_defaults)
+        elif name == '_segment_path':
+            if metadata.segment_path is None:
+                # static part of the path, list keys are appended by get_segment_path
+                metadata.segment_path = value().split('[')[0]
+        elif metadata.absolute_path is None:
+            path = value()
+            metadata.absolute_path = path[:len(path) - len(self.get_segment_path())]
+
+    def _get_leaf_values(self):
+        """ Return leaf values in the order of the leafs in class metadata.
+        """
+        values = self._values
+        if values is None:
+            values = [self.__dict__.get(name) for name in self._metadata.leaf_names]
+        return values
+
+    def _get_leaf_value(self, name):
+        values = self._values
+        if values is None:
+            return self.__dict__.get(name)
+        return values[self._metadata.leaf_index[name]]
+
+    def _set_leaf_value(self, name, value):
+        values = self._values
+        if values is None:
+            self.__dict__[name] = value
+            return
+        if type(values) is tuple:
+            # leaf defaults shared by the entities of the class
+            if value is None:
+                return
+            values = list(values)
+            _set_values(self, values)
+        values[self._metadata.leaf_index[name]] = value
+
+    def _keep_local_ref(self, key, value):
+        self.__dict__.setdefault('_local_refs', {})[key] = value
 
     def _get_child_by_seg_name(self, segs):
         for seg in segs:
             for name in self._children_name_map:
                 if seg == self._children_name_map[name]:
-                    return self.__dict__[name]
+                    return getattr(self, name)
         return None
 
     def _perform_setattr(self, clazz, leaf_names, name, value):
+        setter = self._metadata.leaf_setters.get(name)
+        if setter is not None:
+            self._perform_leaf_setattr(name, setter, value)
+            return
+        if isinstance(value, _LazyChild):
+            self.__dict__.setdefault('_lazy_children', {})[name] = value
+            return
+        if name in _METADATA_ATTRS:
+            self._set_metadata(name, value)
+            return
         with _handle_type_error():
             if name in self.__dict__ and isinstance(self.__dict__[name], YList):
                 raise _YModelError("Attempt to assign value of '{}' to YList ldata. "
                                     "Please use list append or extend method."
                                     .format(value))
-            if isinstance(value, _Enum.YLeaf):
-                value = value.name
-            if name in leaf_names and name in self.__dict__:
-                # bits ..?
-                prev_value = self.__dict__[name]
-                self.__dict__[name] = value
-
-                leaf = self._leafs[name]
-                if not isinstance(value, _YFilter):
-                    if isinstance(leaf, _YLeaf):
-                        leaf.set(value)
-                    elif isinstance(leaf, _YLeafList):
-                        for item in value:
-                            leaf.append(item)
-                else:
-                    self.logger.debug('Setting "%s" to "%s"' % (value, name))
-                    leaf.yfilter = value
-                    if prev_value is not None:
-                        self.logger.debug('Storing previous value "%s" to "%s"' % (prev_value, name))
-                        if isinstance(leaf, _YLeaf):
-                            leaf.set(prev_value)
-                        elif isinstance(leaf, _YLeafList):
-                            for item in prev_value:
-                                leaf.append(item)
-
-            else:
-                if isinstance(value, Entity):
-                    if hasattr(value, "parent") and name != "parent":
-                        if not value.is_top_level_class:
-                            value.parent = self
-                super(Entity, self).__setattr__(name, value)
+            if isinstance(value, Entity):
+                if hasattr(value, "parent") and name != "parent":
+                    if not value.is_top_level_class:
+                        value.parent = self
+            lazy_children = self.__dict__.get('_lazy_children')
+            if lazy_children:
+                lazy_children.pop(name, None)
+            super(Entity, self).__setattr__(name, value)
+            if name == 'yfilter':
+                self._invalidate_state()
+            elif name in self._metadata.child_names:
+                self._invalidate_state()
+                self._invalidate_children()
+            elif name == 'ylist_key_names' and not self._metadata.key_names:
+                self._metadata.key_names = frozenset(value)
+
+    def _perform_leaf_setattr(self, name, setter, value):
+        """ Assign value to leaf name using the setter from class metadata.
+        The setter accepts only values YLeaf.set takes for the type of the
+        leaf; YLeaf.set itself is called when the entity is encoded by
+        get_name_leaf_data.
+        """
+        if isinstance(value, _YFilter):
+            self.logger.debug('Setting "%s" to "%s"' % (value, name))
+            prev_value = self._get_leaf_value(name)
+            if prev_value is not None and not isinstance(prev_value, _YFilter):
+                self.logger.debug('Storing previous value "%s" to "%s"' % (prev_value, name))
+                if self._filtered_leaf_values is None:
+                    _set_filtered_leaf_values(self, {})
+                self._filtered_leaf_values[name] = prev_value
+        else:
+            value = setter(self._leafs[name], value)
+            if isinstance(value, list) and not (isinstance(value, _LeafListValue)
+                                                and value._entity is self):
+                value = _LeafListValue(self, value)
+            filtered_leaf_values = self._filtered_leaf_values
+            if filtered_leaf_values:
+                filtered_leaf_values.pop(name, None)
+        self._set_leaf_value(name, value)
+        if value is None or isinstance(value, (list, Bits)):
+            self._invalidate_state()
+        else:
+            self._mark_has_data()
+        if name in self._metadata.key_names:
+            self._invalidate_path()
 
     def __str__(self):
         return "{}.{}".format(self.__class__.__module__, self.__class__.__name__)
 
 
+# setters of the slots of Entity, bypassing __setattr__ of generated classes
+_set_values = Entity.__dict__['_values'].__set__
+_set_has_data = Entity.__dict__['_has_data'].__set__
+_set_has_operation = Entity.__dict__['_has_operation'].__set__
+_set_children_cache = Entity.__dict__['_children_cache'].__set__
+_set_segment_path_cache = Entity.__dict__['_segment_path_cache'].__set__
+_set_filtered_leaf_values = Entity.__dict__['_filtered_leaf_values'].__set__
+
+
 def _name_matches_yang_name(name, yang_name):
     return name == yang_name or yang_name.endswith(':'+name)
 
@@ -360,9 +1042,12 @@ class EntityCollection(object):
     """ EntityCollection is a wrapper class around ordered dictionary collection of type OrderedDict.
     It is created specifically to collect Entity class instances,
     Each Entity instance has unique segment path value, which is used as a key in the dictionary.
+    A positional index of the entities is kept alongside the dictionary, so lookups by key,
+    by position and membership tests do not copy the collection.
     """
     def __init__(self, *entities):
         self._entity_map = OrderedDict()
+        self._entity_list = []
         for entity in entities:
             self.append(entity)
         self.logger = logging.getLogger("ydk.types.EntityCollection")
@@ -381,6 +1066,24 @@ class EntityCollection(object):
     def _key(self, entity):
         return entity.path();
 
+    def _add(self, key, entity):
+        if key in self._entity_map:
+            self._entity_list = None
+        elif self._entity_list is not None:
+            self._entity_list.append(entity)
+        self._entity_map[key] = entity
+
+    def _remove(self, key):
+        entity = self._entity_map.pop(key)
+        self._entity_list = None
+        return entity
+
+    def _positions(self):
+        """ Returns the positional index of the entities, rebuilding it after removals. """
+        if self._entity_list is None:
+            self._entity_list = list(self._entity_map.values())
+        return self._entity_list
+
     def append(self, entities):
         """
         Adds new elements to the end of the dictionary. Allowed entries:
@@ -391,12 +1094,12 @@ class EntityCollection(object):
             self._log_error_and_raise_exception("Cannot add None object to the EntityCollection", YInvalidArgumentError)
         elif isinstance(entities, Entity):
             key = self._key(entities)
-            self._entity_map[key] = entities
+            self._add(key, entities)
         elif isinstance(entities, list):
             for entity in entities:
                 if isinstance(entity, Entity):
                     key = self._key(entity)
-                    self._entity_map[key] = entity
+                    self._add(key, entity)
                 else:
                     msg = "Argument %s is not supported by EntityCollection class; data ignored"%type(entity)
                     self._log_error_and_raise_exception(msg, YInvalidArgumentError)
@@ -423,7 +1126,7 @@ class EntityCollection(object):
         return list(self._entity_map.keys())
 
     def has_key(self, key):
-        return key in self.keys()
+        return key in self._entity_map
 
     def get(self, item):
         return self.__getitem__(item)
@@ -439,14 +1142,11 @@ class EntityCollection(object):
         entity = None
         if isinstance(item, int):
             if 0 <= item < len(self):
-                entity = self.entities()[item]
+                entity = self._positions()[item]
         elif isinstance(item, str):
-            if item in self.keys():
-                entity = self._entity_map[item]
+            entity = self._entity_map.get(item)
         elif isinstance(item, Entity):
-            key = self._key(item)
-            if key in self.keys():
-                entity = self._entity_map[key]
+            entity = self._entity_map.get(self._key(item))
         else:
             msg = "Argument %s is not supported by EntityCollection class; data ignored"%type(item)
             self._log_error_and_raise_exception(msg, YInvalidArgumentError)
@@ -455,6 +1155,7 @@ class EntityCollection(object):
     def clear(self):
         """Deletes all the members of collection"""
         self._entity_map.clear()
+        self._entity_list = []
 
     def pop(self, item=None):
         """
@@ -470,18 +1171,20 @@ class EntityCollection(object):
             pass
         elif item is None:
             key, entity = self._entity_map.popitem()
+            if self._entity_list is not None:
+                self._entity_list.pop()
         elif isinstance(item, int):
             entity = self.__getitem__(item)
             if entity is not None:
                 key = self._key(entity)
-                entity = self._entity_map.pop(key)
+                entity = self._remove(key)
         elif isinstance(item, str):
-            if item in self.keys():
-                entity = self._entity_map.pop(item)
+            if item in self._entity_map:
+                entity = self._remove(item)
         elif isinstance(item, Entity):
             key = self._key(item)
-            if key in self.keys():
-                entity = self._entity_map.pop(key)
+            if key in self._entity_map:
+                entity = self._remove(key)
         return entity
 
     def __delitem__(self, item):
@@ -533,12 +1236,15 @@ class YList(EntityCollection):
         key_list = []
         if hasattr(entity, 'ylist_key_names'):
             for key in entity.ylist_key_names:
-                if hasattr(entity, key):
-                    attr = entity.__dict__[key]
+                if key in entity._leafs:
+                    attr = entity._get_leaf_value(key)
                     if attr is None:
                         key_list = []
                         break
                     key_list.append(attr)
+        return self._format_key(key_list)
+
+    def _format_key(self, key_list):
         if len(key_list) == 0:
             key = format(self.counter)
             self.counter += 1
@@ -550,10 +1256,16 @@ class YList(EntityCollection):
             key = tuple(key_list)
         return key
 
+    def _invalidate_parent_state(self):
+        if isinstance(self.parent, Entity):
+            self.parent._invalidate_state()
+            self.parent._invalidate_children()
+
     def _flush_cache(self):
-        for _ in range(len(self._cache_dict)):
-            _, entity = self._cache_dict.popitem(False)
-            self._entity_map[self._key(entity)] = entity
+        if self._cache_dict:
+            for _ in range(len(self._cache_dict)):
+                _, entity = self._cache_dict.popitem(False)
+                self._add(self._key(entity), entity)
 
     def append(self, entities):
         entities.parent = self.parent
@@ -562,6 +1274,7 @@ class YList(EntityCollection):
         elif isinstance(entities, Entity):
             key = self._key(entities)
             self._cache_dict[key] = entities
+            self._invalidate_parent_state()
         else:
             msg = "Argument %s is not supported by YList class; data ignored"%type(entities)
             self._log_error_and_raise_exception(msg, YInvalidArgumentError)
@@ -570,10 +1283,73 @@ class YList(EntityCollection):
         for entity in entity_list:
             self.append(entity)
 
+    def from_columns(self, key_cols, leaf_cols=None):
+        """
+        Creates list entries in bulk and appends them to the list.
+        Parameters 'key_cols' and 'leaf_cols' are dictionaries mapping leaf attribute names
+        to columns of values, one value per entry; a column could be any sequence or a NumPy array.
+        All columns must have the same length. Returns list of created entities.
+        """
+        entity_class = self._entity_class()
+        columns = OrderedDict(key_cols)
+        if leaf_cols:
+            columns.update(leaf_cols)
+        names = list(columns.keys())
+        values = [_column_values(columns[name]) for name in names]
+        size = len(values[0]) if values else 0
+        if any(len(column) != size for column in values):
+            self._log_error_and_raise_exception("Columns passed to YList.from_columns differ in length",
+                                                YInvalidArgumentError)
+        if size == 0:
+            return []
+
+        entity = entity_class()
+        metadata = entity._metadata
+        for name in names:
+            if name not in metadata.leaf_setters:
+                msg = "Leaf '%s' is not found in '%s'" % (name, entity_class.__name__)
+                self._log_error_and_raise_exception(msg, YInvalidArgumentError)
+        leafs = [entity._leafs[name] for name in names]
+        setters = [metadata.leaf_setters[name] for name in names]
+        key_positions = [names.index(key) for key in entity.ylist_key_names if key in columns]
+        has_all_keys = len(key_positions) == len(entity.ylist_key_names)
+
+        self._flush_cache()
+        entities = []
+        for row in zip(*values):
+            if entity is None:
+                entity = entity_class()
+            for name, leaf, setter, value in zip(names, leafs, setters, row):
+                value = setter(leaf, value)
+                if isinstance(value, list):
+                    value = _LeafListValue(entity, value)
+                entity._set_leaf_value(name, value)
+            entity.parent = self.parent
+            if has_all_keys and all(row[i] is not None for i in key_positions):
+                key = self._format_key([entity._get_leaf_value(names[i]) for i in key_positions])
+            else:
+                key = self._key(entity)
+            self._add(key, entity)
+            entities.append(entity)
+            entity = None
+        self._invalidate_parent_state()
+        return entities
+
+    def _entity_class(self):
+        parent = self.parent
+        if isinstance(parent, Entity):
+            for name, clazz in parent._child_classes.values():
+                if parent.__dict__.get(name) is self:
+                    return clazz
+        self._log_error_and_raise_exception("Could not find entity class of YList entries",
+                                            YInvalidArgumentError)
+
     def clear(self):
         """Deletes all the members of collection"""
         self._entity_map.clear()
+        self._entity_list = []
         self._cache_dict.clear()
+        self._invalidate_parent_state()
 
     def keys(self):
         self._flush_cache()
@@ -585,13 +1361,21 @@ class YList(EntityCollection):
 
     def pop(self, item=None):
         self._flush_cache()
-        return super(YList, self).pop(item)
+        entity = super(YList, self).pop(item)
+        if entity is not None:
+            self._invalidate_parent_state()
+        return entity
+
+    def has_key(self, key):
+        self._flush_cache()
+        return key in self._entity_map
 
     def __getitem__(self, item):
         entity = None
+        self._flush_cache()
         if isinstance(item, int) and 0 <= item < len(self):
-            entity = self.entities()[item]
-        elif self.has_key(item):
+            entity = self._positions()[item]
+        elif item in self._entity_map:
             entity = self._entity_map[item]
         elif not isinstance(item, str):
             entity = self._entity_map[format(item)]
@@ -599,3 +1383,91 @@ class YList(EntityCollection):
 
     def __len__(self):
         return self._entity_map.__len__() + self._cache_dict.__len__()
+
+
+def _encoding_copy(entity, keys_only=False, exclude=()):
+    """ Return a new entity of the class of entity, to be encoded in its
+    place without modifying entity.
+
+    The copy holds the leaf values of entity, or only its list keys if
+    keys_only is set. Unless keys_only is set, it also refers to the
+    children of entity other than those named in exclude; children are not
+    copied and keep entity as their parent.
+    """
+    clazz = type(entity)
+    copy = clazz()
+    names = entity.ylist_key_names if keys_only else copy._metadata.leaf_names
+    for name in names:
+        value = entity._get_leaf_value(name)
+        if value is not None:
+            copy._set_leaf_value(name, value)
+    filtered_leaf_values = entity._filtered_leaf_values
+    if filtered_leaf_values and not keys_only:
+        _set_filtered_leaf_values(copy, dict(filtered_leaf_values))
+    if is_set(entity.yfilter):
+        copy.yfilter = entity.yfilter
+    if not keys_only:
+        for name in copy._metadata.child_names:
+            child = entity.__dict__.get(name)
+            if name not in exclude and isinstance(child, (Entity, YList)):
+                _attach_shared(copy, name, child)
+    return copy
+
+
+def _snapshot(entity):
+    """ Return a copy of entity and its descendants holding their current
+    values, with the parent of entity; later changes to entity do not
+    affect the copy.
+    """
+    copy = _copy_tree(entity)
+    if entity.parent is not None:
+        copy.parent = entity.parent
+    return copy
+
+
+def _copy_tree(entity):
+    """ Return a copy of entity and its descendants, without parent.
+    """
+    copy = _encoding_copy(entity, exclude=entity._metadata.child_names)
+    for name in copy._metadata.leaf_names:
+        value = copy._get_leaf_value(name)
+        if isinstance(value, list):
+            copy._set_leaf_value(name, _LeafListValue(copy, value))
+        elif isinstance(value, Bits):
+            bits = Bits()
+            for bit, flag in value.get_bitmap().items():
+                bits[bit] = flag
+            copy._set_leaf_value(name, bits)
+    for name in copy._metadata.child_names:
+        child = entity.__dict__.get(name)
+        if isinstance(child, Entity):
+            children = _copy_tree(child)
+            children.parent = copy
+        elif isinstance(child, YList):
+            children = [_copy_tree(c) for c in child]
+            for c in children:
+                c.parent = copy
+        else:
+            if isinstance(child, _YFilter):
+                setattr(copy, name, child)
+            continue
+        _attach_shared(copy, name, children)
+    return copy
+
+
+def _attach_shared(entity, name, children):
+    """ Make children, an entity, YList or list of list entries of another
+    tree, the child named name of entity, without changing their parent.
+    """
+    if isinstance(children, (Entity, YList)):
+        entity.__dict__[name] = children
+    else:
+        ylist = YList(entity)
+        for child in children:
+            ylist._add(ylist._key(child), child)
+        entity.__dict__[name] = ylist
+    lazy_children = entity.__dict__.get('_lazy_children')
+    if lazy_children:
+        lazy_children.pop(name, None)
+    entity._invalidate_state()
+    entity._invalidate_children()
@@ -37,3 +37,7 @@ pip_check_install  dist/*.tar.gz
 echo "Running codec sample"
 cd ../core/samples
 ./bgp_codec.py
+
+echo "Running core unit tests"
+cd ../tests
+python -m unittest discover -v